@@ -0,0 +1,63 @@
+"""Deep config lookups in a hot loop: nested dict vs frozen Config.
+
+Usage:
+    python benchmarks/bench_config_access.py [--iterations N]
+"""
+import argparse
+import pickle
+import time
+
+from fenn.args import Config
+
+
+CONFIG = {
+    "project": "bench",
+    "logger": {"dir": "logger"},
+    "training": {"lr": 0.001, "epochs": 10, "optimizer": {"name": "adam", "beta1": 0.9}},
+    "model": {"layers": [64, 32], "dropout": 0.1},
+}
+
+
+def timed(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    fn(iterations)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    as_dict = pickle.loads(pickle.dumps(CONFIG))
+    as_config = Config(CONFIG)
+
+    def dict_nested(n):
+        for _ in range(n):
+            as_dict["training"]["optimizer"]["beta1"]
+
+    def config_nested(n):
+        for _ in range(n):
+            as_config["training"]["optimizer"]["beta1"]
+
+    def config_attribute(n):
+        for _ in range(n):
+            as_config.training.optimizer.beta1
+
+    def config_flat(n):
+        for _ in range(n):
+            as_config["training/optimizer/beta1"]
+
+    def config_hash(n):
+        for _ in range(n):
+            hash(as_config)
+
+    print(f"dict   args['training']['optimizer']['beta1'] : {timed(dict_nested, args.iterations):6.1f} ns")
+    print(f"Config args['training']['optimizer']['beta1'] : {timed(config_nested, args.iterations):6.1f} ns")
+    print(f"Config args.training.optimizer.beta1          : {timed(config_attribute, args.iterations):6.1f} ns")
+    print(f"Config args['training/optimizer/beta1']       : {timed(config_flat, args.iterations):6.1f} ns")
+    print(f"Config hash(args)                             : {timed(config_hash, args.iterations):6.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
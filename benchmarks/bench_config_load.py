@@ -0,0 +1,69 @@
+"""Time to load a large generated config: pure-Python safe_load vs Parser.
+
+Usage:
+    python benchmarks/bench_config_load.py [--sections N] [--repeat N]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+from fenn.args import Parser
+from fenn.logging import Logger
+
+
+def generate(path: str, sections: int) -> None:
+    config = {"project": "bench", "logger": {"dir": "logger"}}
+    for i in range(sections):
+        config[f"section_{i}"] = {
+            f"key_{j}": {"value": j * 0.5, "grid": list(range(8))} for j in range(20)
+        }
+    with open(path, "w") as f:
+        yaml.safe_dump(config, f)
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fenn.yaml")
+        generate(path, args.sections)
+
+        def safe_load():
+            with open(path) as f:
+                Parser._flatten_dict(yaml.safe_load(f))
+
+        Logger()  # created first, so that the Parser below is not reset
+        fenn_parser = Parser()
+        fenn_parser.config_file = path
+        Logger()._system_print = lambda *a, **kw: None
+
+        def cold():
+            Parser.clear_cache()
+            fenn_parser.load_configuration()
+            fenn_parser._flat_config()
+
+        def warm():
+            fenn_parser.load_configuration()
+            fenn_parser._flat_config()
+
+        baseline = timed(safe_load, args.repeat)
+        print(f"safe_load + flatten : {baseline:8.2f} ms")
+        print(f"Parser (cold cache) : {timed(cold, args.repeat):8.2f} ms")
+        print(f"Parser (warm cache) : {timed(warm, args.repeat):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Lines/second of the print -> session log path, per writer mode.
+
+Usage:
+    python benchmarks/bench_log_print.py [--lines N]
+"""
+import argparse
+import builtins
+import os
+import tempfile
+import time
+
+from fenn.args import Parser
+from fenn.logging import Logger
+
+
+def run(lines: int, **logger_conf) -> float:
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        logger = Logger()
+        Parser()._args = {
+            "project": "bench",
+            "session_id": "bench_session",
+            "logger": {"dir": tmp, **logger_conf},
+        }
+        logger.start()
+        try:
+            start = time.perf_counter()
+            for i in range(lines):
+                builtins.print(f"step {i} loss 0.1234", file=devnull)
+            logger.flush()
+            elapsed = time.perf_counter() - start
+        finally:
+            logger.stop()
+    return lines / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=100_000)
+    args = parser.parse_args()
+
+    direct = run(args.lines)
+    buffered = run(args.lines, buffered=True)
+
+    print(f"direct   : {direct:12,.0f} lines/s")
+    print(f"buffered : {buffered:12,.0f} lines/s  ({buffered / direct:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Runs per minute: a fresh process per run vs back-to-back runs in one process.
+
+Usage:
+    python benchmarks/bench_runs_per_minute.py [--runs N]
+"""
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+MAIN = """\
+from fenn import FENN
+
+app = FENN()
+
+@app.entrypoint
+def main(args):
+    return args["training"]["lr"] * 2
+
+if __name__ == "__main__":
+    app.run()
+"""
+
+
+def per_minute(runs: int, seconds: float) -> float:
+    return runs / seconds * 60
+
+
+def load_app(path: str):
+    """Imports the app of a script from its path, whatever else is named main."""
+    spec = importlib.util.spec_from_file_location("bench_main", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "main.py"), "w") as f:
+            f.write(MAIN)
+        with open(os.path.join(tmp, "fenn.yaml"), "w") as f:
+            f.write("project: bench\nlogger:\n  dir: logger\ntraining:\n  lr: 0.001\n")
+
+        start = time.perf_counter()
+        for i in range(args.runs):
+            subprocess.run(
+                [sys.executable, "main.py", f"training.lr={i}"],
+                cwd=tmp,
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+        cold = time.perf_counter() - start
+
+        # Restored before the temporary directory is removed
+        cwd, argv = os.getcwd(), sys.argv
+        os.chdir(tmp)
+        try:
+            app = load_app(os.path.join(tmp, "main.py"))
+            app._print_banner = lambda: None
+            start = time.perf_counter()
+            for i in range(args.runs):
+                sys.argv = ["main.py", f"training.lr={i}"]
+                with open(os.devnull, "w") as devnull:
+                    stdout, sys.stdout = sys.stdout, devnull
+                    try:
+                        app.run()
+                    finally:
+                        sys.stdout = stdout
+            warm = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+            sys.argv = argv
+
+        sessions = len(os.listdir(os.path.join(tmp, "logger", "bench")))
+        print(f"fresh process per run : {per_minute(args.runs, cold):8.0f} runs/min")
+        print(f"warm process          : {per_minute(args.runs, warm):8.0f} runs/min")
+        print(f"session files         : {sessions} (2 per run)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ except ImportError as e:
     ) from e
 from pathlib import Path
 
+from fenn.logging import Logger
+
 class Trainer:
 
     def __init__(self, model, loss_fn, optimizer, device="cpu", metrics=None):
@@ -39,16 +41,31 @@ class Trainer:
         total_loss = 0.0
         n_batches = 0
 
-        for batch in loader:
+        logger = Logger()
+        batches = iter(loader)
+
+        while True:
+
+            # The fetch that finds the loader exhausted is not recorded
+            try:
+                with logger.span("data_load"):
+                    inputs, targets = self._move_batch(next(batches))
+            except StopIteration:
+                break
+
+            with logger.span("forward_backward"):
+                outputs = self._model(inputs)
+                loss = self._loss_fn(outputs, targets)
+
+                self._optimizer.zero_grad()
+                loss.backward()
+                self._optimizer.step()
 
-            inputs, targets = self._move_batch(batch)
-            outputs = self._model(inputs)
-            loss = self._loss_fn(outputs, targets)
+            # .item() waits for the device to finish the step
+            with logger.span("device_sync"):
+                loss_value = loss.item()
 
-            self._optimizer.zero_grad()
-            loss.backward()
-            self._optimizer.step()
-            total_loss += loss.item()
+            total_loss += loss_value
             n_batches += 1
 
         mean_loss = total_loss / n_batches
@@ -1,94 +1,30 @@
-﻿from colorama import Fore, Style
-from typing import Callable, Optional, Any
-
-from fenn.args import Parser
-from fenn.logging import Logger
-from fenn.secrets.keystore import KeyStore
-from fenn.utils import generate_haiku_id
-
-
-class FENN:
-    """
-    The base FENN application
-    """
-
-    def __init__(self) -> None:
-
-        self._session_id: str = generate_haiku_id()
-
-        self._parser: Parser = Parser()
-        self._keystore: KeyStore = KeyStore()
-        self._logger: Logger = Logger()   # Singleton
-
-        # DISCLAIMER:
-        # This class is the base class for all FENN applications.
-        # It is designed to be subclassed, not instantiated directly.
-        # Please do not modify this class unless you know what you are doing.
-        self._config_file: str = None
-
-        self._entrypoint_fn: Optional[Callable] = None
-
-    def entrypoint(self, entrypoint_fn: Callable) -> Callable:
-        """
-        The decorator to register the main execution function.
-        """
-        self._entrypoint_fn = entrypoint_fn
-        return entrypoint_fn
-
-    def run(self) -> Any:
-        """
-        The method that executes the application's core logic.
-        """
-
-        self._logger._original_print(
-            "***********************************************************************************\n"
-            f"{Style.BRIGHT}Hi, thank you for using the {Fore.GREEN}PyFenn{Style.RESET_ALL}{Style.BRIGHT} framework.{Style.RESET_ALL}\n"
-            f"PyFenn is still in an {Fore.CYAN}alpha version{Style.RESET_ALL}.\n"
-            "If you find a bug or inconsistency, if you want to contribute or request a feature,\nplease open an issue at "
-            f"{Fore.CYAN}https://github.com/pyfenn/fenn/issues{Style.RESET_ALL}.\n"
-            f"{Style.BRIGHT}Thank you for your support!{Style.RESET_ALL}\n"
-            "***********************************************************************************\n"
-        )
-
-        if not self._entrypoint_fn:
-            raise RuntimeError(
-                f"{Fore.RED}[FENN][EXCEPTION] No main function registered. "
-                f"Please use {Fore.LIGHTYELLOW_EX}@app.entrypoint{Style.RESET_ALL} "
-                "to register your main function."
-            )
-
-        # Load config
-        self._parser.config_file = (
-            self._config_file if self._config_file is not None else "fenn.yaml"
-        )
-        self._args = self._parser.load_configuration()
-        self._args["session_id"] = self._session_id
-
-        # Start logging
-        self._logger.start()
-
-        # Print parsed config (user logs)
-        self._parser.print()
-
-        try:
-            # System startup message
-            self._logger.system_info(
-                f"Application starting from entrypoint: {self._entrypoint_fn.__name__}"
-            )
-
-            # Execute user function
-            result = self._entrypoint_fn(self._args)
-            return result
-
-        finally:
-            self._logger.stop()
-
-    def set_config_file(self, config_file: str) -> None:
-        """
-        The method to set the YAML file.
-        """
-        self._config_file = config_file
-
-    @property
-    def config_file(self) -> str:
-        return self._config_file
+﻿from typing import TYPE_CHECKING
+
+from fenn._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from fenn.app import FENN
+    from fenn.args import Parser
+    from fenn.logging import Logger
+    from fenn.secrets.keystore import KeyStore
+    from fenn.utils import generate_haiku_id
+
+# Public names are resolved on first access (PEP 562), so that `import fenn`
+# and the CLI do not pay for the logger, wandb or torch until they are used.
+_LAZY_ATTRIBUTES = {
+    "FENN": "fenn.app",
+    # Importable from the package since its first releases
+    "KeyStore": "fenn.secrets.keystore",
+    "Logger": "fenn.logging",
+    "Parser": "fenn.args",
+    "generate_haiku_id": "fenn.utils",
+}
+
+_SUBMODULES = {
+    "app", "args", "cli", "logging", "notification", "profiling",
+    "secrets", "sweep", "utils", "vision",
+}
+
+__all__ = ["FENN", "KeyStore", "Logger", "Parser", "generate_haiku_id"]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES, _SUBMODULES)
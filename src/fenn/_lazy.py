@@ -0,0 +1,39 @@
+import importlib
+import sys
+from typing import Any, Callable, Iterable, List, Mapping, Tuple
+
+
+def lazy_module(
+    name: str,
+    attributes: Mapping[str, str],
+    submodules: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Builds the PEP 562 ``__getattr__`` and ``__dir__`` of a lazy package.
+
+    Usage, in the package ``__init__``::
+
+        __getattr__, __dir__ = lazy_module(__name__, {"FENN": "fenn.app"})
+
+    Args:
+        name: ``__name__`` of the package.
+        attributes: Public name -> module defining it, imported on first access.
+        submodules: Submodules imported on first access as attributes.
+    """
+    namespace = sys.modules[name].__dict__
+    submodules = frozenset(submodules)
+
+    def __getattr__(attribute: str) -> Any:
+        module = attributes.get(attribute)
+        if module is not None:
+            value = getattr(importlib.import_module(module), attribute)
+            # Cached, so __getattr__ only runs on the first access
+            namespace[attribute] = value
+            return value
+        if attribute in submodules:
+            return importlib.import_module(f"{name}.{attribute}")
+        raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *attributes, *submodules})
+
+    return __getattr__, __dir__
@@ -0,0 +1,480 @@
+import functools
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from colorama import Fore, Style
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any, Sequence, Union
+
+from fenn import profiling, stages
+from fenn.args import Parser
+from fenn.context import RunContext
+from fenn.logging import Logger
+from fenn.secrets.keystore import KeyStore
+from fenn.sweep import SweepSpec, expand_sweep, run_sweep_job, to_overrides
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from fenn.notification import Notifier
+
+# Seconds FENN.run waits for queued notifications before returning
+NOTIFIER_FLUSH_TIMEOUT = 30.0
+
+# Context of the run executing in this process, whichever app runs it: a
+# sweep job runs on a FENN of its own, but stages belong to the user's app.
+_running_context: Optional[RunContext] = None
+
+
+class FENN:
+    """
+    The base FENN application
+    """
+
+    def __init__(self, frozen_config: bool = False) -> None:
+
+        # State of the current (or next) run; every run gets a new one
+        self._context: RunContext = RunContext()
+
+        self._parser: Parser = Parser()
+        self._keystore: KeyStore = KeyStore()
+        self._logger: Logger = Logger()   # Singleton
+
+        # DISCLAIMER:
+        # This class is the base class for all FENN applications.
+        # It is designed to be subclassed, not instantiated directly.
+        # Please do not modify this class unless you know what you are doing.
+        self._config_file: Union[str, List[str]] = None
+        self._schema: Optional[Dict[str, Any]] = None
+
+        self._entrypoint_fn: Optional[Callable] = None
+
+        # Pass a frozen fenn.args.Config to the entrypoint instead of a dict
+        self._frozen_config: bool = frozen_config
+
+        # Event loop driving an async entrypoint, while it runs
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+
+        # Background notifier, created on first use of app.notifier
+        self._notifier: Optional["Notifier"] = None
+
+        # Command-line overrides, and sys.argv as left after taking them out
+        self._argv_overrides: List[str] = []
+        self._argv: Optional[List[str]] = None
+
+        # Taken out of sys.argv now, before the script's own argparse runs
+        self._cli_overrides()
+
+    def entrypoint(self, entrypoint_fn: Callable) -> Callable:
+        """
+        The decorator to register the main execution function.
+        It can be an ``async def`` function, which is then run to completion
+        in an event loop owned by fenn.
+        """
+        self._entrypoint_fn = entrypoint_fn
+        return entrypoint_fn
+
+    def stage(
+        self,
+        depends_on: Sequence[str] = (),
+        key: Optional[Callable[..., Any]] = None,
+    ) -> Callable:
+        """
+        The decorator to memoize a pipeline stage on disk.
+
+        The output is cached under a key made of the values of the
+        ``depends_on`` config paths (e.g. ``["data", "preprocess.scaler"]``),
+        a hash of the function's source and the call arguments. A run that
+        only changes other keys (e.g. training hyperparameters) loads the
+        output instead of recomputing it. NumPy arrays in the output are
+        stored as .npy files and loaded back memory-mapped (read-only).
+
+        The call arguments are pickled into the key, so they must be
+        picklable; otherwise a TypeError is raised. ``key`` replaces them: it
+        is called with the stage's arguments and returns a picklable value
+        identifying the call (e.g. ``key=lambda args, model: model.name``).
+
+        The cache is configured by the ``stages`` section of the config:
+        ``dir`` (default: .fenn_cache) and ``max_size_mb`` (default: 10240),
+        past which the least recently used outputs are deleted.
+        """
+
+        def decorator(fn: Callable) -> Callable:
+            source: List[str] = []
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                context = _running_context or self._context
+                run_args = context.args
+                if run_args is None:
+                    raise RuntimeError(
+                        f"Stage {fn.__name__} can only be called while the application runs."
+                    )
+                if not source:
+                    source.append(stages.source_hash(fn))
+
+                cache_key = stages.stage_key(
+                    fn,
+                    source[0],
+                    stages.config_subset(run_args, depends_on),
+                    self._stage_arguments(fn, key, run_args, args, kwargs),
+                )
+                cache = self._stage_cache(run_args)
+
+                value = cache.get(cache_key)
+                if value is not stages.MISS:
+                    self._logger.system_info(f"Stage {fn.__name__} loaded from cache.")
+                    return value
+
+                start = time.perf_counter()
+                value = fn(*args, **kwargs)
+                cache.put(cache_key, value)
+                self._logger.system_info(
+                    f"Stage {fn.__name__} computed in "
+                    f"{time.perf_counter() - start:.2f}s and cached."
+                )
+                return value
+
+            return wrapper
+
+        return decorator
+
+    def run(self) -> Any:
+        """
+        The method that executes the application's core logic.
+        """
+        profiler = profiling.StartupProfiler() if profiling.enabled() else None
+        self._print_banner()
+        self._check_entrypoint()
+        return self._execute(self._cli_overrides(), profiler)
+
+    def sweep(self, spec: SweepSpec, max_workers: Optional[int] = None) -> Any:
+        """
+        The method that runs the entrypoint once per configuration of a sweep,
+        in a pool of worker processes.
+
+        Args:
+            spec: A grid, ``{"training.lr": [0.1, 0.01], "training.epochs": [10, 20]}``
+                (every combination is run), or a list of runs, each a
+                ``{key.path: value}`` dict or a list of ``key.path=value`` strings.
+                Command-line overrides are applied before the sweep values.
+            max_workers: Number of worker processes (default: number of CPUs).
+
+        Returns:
+            A pandas DataFrame with one row per run: session_id, status,
+            the swept values, and the entrypoint's return value (a returned
+            dict is spread over columns), or the error of a failed run.
+        """
+        import pandas as pd
+
+        self._print_banner()
+        self._check_entrypoint()
+
+        runs = expand_sweep(spec)
+        max_workers = max_workers or os.cpu_count() or 1
+        config_file = self._config_file if self._config_file is not None else "fenn.yaml"
+        base_overrides = self._cli_overrides()
+
+        self._logger.system_info(
+            f"Sweep of {len(runs)} runs on {min(max_workers, len(runs))} worker(s) started."
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    run_sweep_job,
+                    self._entrypoint_fn,
+                    config_file,
+                    base_overrides + to_overrides(run),
+                    self._frozen_config,
+                    self._schema,
+                )
+                for run in runs
+            ]
+            jobs = [future.result() for future in futures]
+
+        rows = []
+        for run, job in zip(runs, jobs):
+            row = {"session_id": job["session_id"], "status": job["status"], **run}
+            result = job.get("result")
+            if isinstance(result, dict):
+                row.update(result)
+            elif "result" in job:
+                row["result"] = result
+            if "error" in job:
+                row["error"] = job["error"]
+            rows.append(row)
+
+        failed = sum(job["status"] != "completed" for job in jobs)
+        self._logger.system_info(
+            f"Sweep finished: {len(jobs) - failed} completed, {failed} failed."
+        )
+
+        return pd.DataFrame(rows)
+
+    def _print_banner(self) -> None:
+        self._logger._original_print(
+            "***********************************************************************************\n"
+            f"{Style.BRIGHT}Hi, thank you for using the {Fore.GREEN}PyFenn{Style.RESET_ALL}{Style.BRIGHT} framework.{Style.RESET_ALL}\n"
+            f"PyFenn is still in an {Fore.CYAN}alpha version{Style.RESET_ALL}.\n"
+            "If you find a bug or inconsistency, if you want to contribute or request a feature,\nplease open an issue at "
+            f"{Fore.CYAN}https://github.com/pyfenn/fenn/issues{Style.RESET_ALL}.\n"
+            f"{Style.BRIGHT}Thank you for your support!{Style.RESET_ALL}\n"
+            "***********************************************************************************\n"
+        )
+
+    def _check_entrypoint(self) -> None:
+        if not self._entrypoint_fn:
+            raise RuntimeError(
+                f"{Fore.RED}[FENN][EXCEPTION] No main function registered. "
+                f"Please use {Fore.LIGHTYELLOW_EX}@app.entrypoint{Style.RESET_ALL} "
+                "to register your main function."
+            )
+
+    def _cli_overrides(self) -> List[str]:
+        """Takes the ``key.path=value`` arguments out of sys.argv.
+
+        They are removed in place, so the script's own argparse only sees
+        its own arguments, and kept for every run of this app until sys.argv
+        is replaced. Nothing after ``--`` is taken, nor a token right after
+        an option, which is that option's value (``--tag a=b``).
+        """
+        if sys.argv != self._argv:
+            overrides, rest = [], []
+            after_option = False
+            for i, arg in enumerate(sys.argv[1:], start=1):
+                if arg == "--":
+                    rest += sys.argv[i:]
+                    break
+                if not after_option and self._parser.is_override(arg):
+                    overrides.append(arg)
+                else:
+                    rest.append(arg)
+                # "--name value" rather than "--name=value" or a lone "-"
+                after_option = arg.startswith("-") and arg != "-" and "=" not in arg
+            sys.argv[1:] = rest
+            self._argv_overrides = overrides
+            self._argv = list(sys.argv)
+        return list(self._argv_overrides)
+
+    def _execute(
+        self, overrides: List[str], profiler: Optional[profiling.StartupProfiler] = None
+    ) -> Any:
+        # A fresh context per run, so nothing leaks from the previous one
+        if self._context.status != "pending":
+            self._context = RunContext()
+        context = self._context
+        context.config_file = (
+            self._config_file if self._config_file is not None else "fenn.yaml"
+        )
+        context.overrides = list(overrides)
+
+        # Load config
+        self._parser.config_file = context.config_file
+        self._parser.overrides = context.overrides
+        self._parser.schema = self._schema
+        context.status = "running"
+        try:
+            args = self._parser.load_configuration()
+        except Exception:
+            context.status = "failed"
+            raise
+        args["session_id"] = context.session_id
+        context.args = self._parser.freeze() if self._frozen_config else args
+        if profiler:
+            profiler.mark("load configuration")
+
+        # Start logging
+        self._logger.start()
+        if profiler:
+            profiler.mark("start logger")
+
+        global _running_context
+        previous_context, _running_context = _running_context, context
+        status = "failed"
+        try:
+            self._open_outbox(args)
+
+            # Print parsed config (user logs)
+            self._parser.print()
+
+            if profiler:
+                profiler.mark("print configuration")
+                self._report_startup(profiler)
+                if profiling.skip_entrypoint():
+                    status = "profiled"
+                    return None
+
+            # System startup message
+            self._logger.system_info(
+                f"Application starting from entrypoint: {self._entrypoint_fn.__name__}"
+            )
+
+            # Execute user function
+            result = self._call_entrypoint(context.args)
+            status = "completed"
+            context.result = result
+            return result
+
+        except KeyboardInterrupt:
+            status = "interrupted"
+            raise
+
+        finally:
+            _running_context = previous_context
+            context.status = status
+            try:
+                self._flush_notifier()
+            finally:
+                self._logger.stop(status)
+
+    def _open_outbox(self, run_args: Any) -> None:
+        # Opt-in: notification.outbox keeps undelivered messages across runs
+        notification_conf = run_args.get("notification") or {}
+        if not notification_conf.get("outbox", False):
+            return
+        from fenn.notification.outbox import OUTBOX_FILENAME
+
+        logger_dir = Path(run_args["logger"]["dir"])
+        logger_dir.mkdir(parents=True, exist_ok=True)
+        self.notifier.open_outbox(logger_dir / OUTBOX_FILENAME)
+
+    def _flush_notifier(self) -> None:
+        # The last messages ("training done") must go out before the process exits
+        if self._notifier is None:
+            return
+        if not self._notifier.flush(timeout=NOTIFIER_FLUSH_TIMEOUT):
+            self._logger.system_warning(
+                f"{self._notifier.pending} notification(s) still unsent after "
+                f"{NOTIFIER_FLUSH_TIMEOUT:.0f}s."
+            )
+        if self._notifier.dropped:
+            self._logger.system_warning(
+                f"{self._notifier.dropped} notification(s) dropped, the queue was full."
+            )
+        outbox = self._notifier.outbox
+        if outbox is None:
+            return
+        # The retry thread dies with the process: one last pass over due messages
+        remaining = self._notifier.flush_outbox(timeout=NOTIFIER_FLUSH_TIMEOUT)
+        if remaining:
+            self._logger.system_warning(
+                f"{remaining} notification(s) not delivered yet, "
+                f"kept in {outbox.path} for the next run."
+            )
+
+    def _call_entrypoint(self, args: Any) -> Any:
+        # Imported here, like asyncio: neither is needed to import fenn
+        import inspect
+
+        if inspect.iscoroutinefunction(self._entrypoint_fn):
+            # The loop exists before the coroutine is even created
+            return self._run_async(lambda: self._entrypoint_fn(args))
+
+        result = self._entrypoint_fn(args)
+        if inspect.iscoroutine(result):
+            # Fallback for async functions behind a plain wrapper (decorators)
+            return self._run_async(lambda: result)
+        return result
+
+    def _run_async(self, make_coroutine: Callable[[], Any]) -> Any:
+        # Imported here, asyncio alone adds tens of ms to every startup
+        import asyncio
+
+        with asyncio.Runner() as runner:
+            self._loop = runner.get_loop()
+            try:
+                return runner.run(make_coroutine())
+            finally:
+                self._loop = None
+
+    def _stage_cache(self, run_args: Any) -> stages.StageCache:
+        stages_conf = run_args.get("stages") or {}
+        return stages.StageCache(
+            stages_conf.get("dir", ".fenn_cache"),
+            max_bytes=int(stages_conf.get("max_size_mb", 10240)) * 1024 * 1024,
+        )
+
+    @staticmethod
+    def _stage_arguments(
+        fn: Callable,
+        key: Optional[Callable[..., Any]],
+        run_args: Any,
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> bytes:
+        if key is not None:
+            call = key(*args, **kwargs)
+        else:
+            # The run config is already part of the key through depends_on.
+            placeholder = "<config>"
+            call = (
+                tuple(placeholder if a is run_args else a for a in args),
+                sorted((k, placeholder if v is run_args else v) for k, v in kwargs.items()),
+            )
+        try:
+            return pickle.dumps(stages.canonical(call), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            # repr() would do, but it holds memory addresses: a new key every run
+            raise TypeError(
+                f"Stage {fn.__name__}: the call arguments cannot be pickled into "
+                f"the cache key ({e}). Pass key= to app.stage to build the key "
+                "from them."
+            ) from e
+
+    def _report_startup(self, profiler: profiling.StartupProfiler) -> None:
+        phases = profiler.phases
+        self._logger.user_info("Startup timings:")
+        for phase, ms in phases.items():
+            self._logger.user_info(f"  {phase}: {ms:.1f}ms")
+        self._logger.user_info(f"  total: {sum(phases.values()):.1f}ms")
+        profiling.write_log_path(self._logger._log_file)
+
+    def set_config_file(self, config_file: Union[str, List[str]]) -> None:
+        """
+        The method to set the YAML file, or an ordered list of YAML files
+        that are deep-merged (later files override earlier ones).
+        """
+        self._config_file = config_file
+
+    def set_schema(self, schema: Optional[Dict[str, Any]]) -> None:
+        """
+        The method to set a schema the configuration is validated against,
+        e.g. ``{"training.lr": float, "training.epochs": {"type": "int", "min": 1}}``.
+        It is merged with the ``schema:`` section of the YAML files, if any.
+        """
+        self._schema = schema
+
+    @property
+    def config_file(self) -> Union[str, List[str]]:
+        return self._config_file
+
+    @property
+    def session_id(self) -> str:
+        """The session id of the current run, or of the next one before it starts."""
+        return self._context.session_id
+
+    @property
+    def context(self) -> RunContext:
+        """The state of the current run, or of the last one after it ended."""
+        return self._context
+
+    @property
+    def notifier(self) -> "Notifier":
+        """
+        The application's notifier, in background mode: ``notify`` only
+        queues the message, so the training loop never waits for the
+        network. Queued messages are flushed when the run ends.
+        """
+        if self._notifier is None:
+            from fenn.notification import Notifier
+
+            self._notifier = Notifier(background=True)
+        return self._notifier
+
+    @property
+    def loop(self) -> Optional["asyncio.AbstractEventLoop"]:
+        """The event loop running the async entrypoint, None outside of it."""
+        return self._loop
@@ -1 +1,3 @@
-from fenn.args.parser import Parser
\ No newline at end of file
+from fenn.args.config import Config
+from fenn.args.parser import Parser
+from fenn.args.schema import ConfigError, Schema
@@ -0,0 +1,163 @@
+import difflib
+import keyword
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+class Config(Mapping):
+    """Frozen, read-only view of a nested configuration.
+
+    Sections are reachable as attributes (``args.training.lr``), as items
+    (``args["training"]["lr"]``) or through a flat path
+    (``args["training/lr"]``). Every path of the tree is precomputed into a
+    single dictionary, so each of these is one hash lookup. Lists become
+    tuples and nested dicts become Configs, which makes the whole tree
+    hashable; the hash is computed once, so a Config can key a cache.
+
+    Keys that are valid identifiers become slots of a subclass generated
+    once per set of keys, so attribute access is a plain slot read. Keys
+    that shadow a method (``items``, ``get``...) are only reachable as items.
+    """
+
+    __slots__ = ("_data", "_flat", "_hash")
+
+    def __new__(cls, data: Mapping[str, Any]) -> "Config":
+        fields = tuple(k for k in data if _is_field(k))
+        subclass = _classes.get(fields)
+        if subclass is None:
+            subclass = _classes[fields] = type(
+                "Config", (Config,), {"__slots__": fields, "__module__": __name__}
+            )
+        return object.__new__(subclass)
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        values = {k: _freeze(v) for k, v in data.items()}
+        for k, v in values.items():
+            if _is_field(k):
+                object.__setattr__(self, k, v)
+
+        flat: Dict[str, Any] = dict(values)
+        for k, v in values.items():
+            if isinstance(v, Config):
+                for path, leaf in v._flat.items():
+                    flat[f"{k}/{path}"] = leaf
+
+        object.__setattr__(self, "_data", values)
+        object.__setattr__(self, "_flat", flat)
+        object.__setattr__(self, "_hash", _hash_items(values))
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._flat[key]
+        except KeyError:
+            raise KeyError(self._unknown(key)) from None
+        except TypeError:
+            raise KeyError(key) from None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when there is no slot of that name, i.e. on a miss.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        raise AttributeError(self._unknown(name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Config is frozen, cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Config is frozen, cannot delete {name!r}")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return key in self._flat
+        except TypeError:
+            return False
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Config):
+            return self._hash == other._hash and self._data == other._data
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Config({self.to_dict()!r})"
+
+    def __dir__(self) -> List[str]:
+        return [*super().__dir__(), *(k for k in self._data if isinstance(k, str))]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Config, (self.to_dict(),))
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        # Mapping.get goes through __getitem__, which builds a suggestion on a miss.
+        try:
+            return self._flat.get(key, default)
+        except TypeError:
+            return default
+
+    def flat(self) -> Dict[str, Any]:
+        """Returns the leaves of the tree keyed by their ``a/b/c`` path."""
+        return {k: v for k, v in self._flat.items() if not isinstance(v, Config)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a mutable nested dict copy (tuples become lists again)."""
+        return {k: _thaw(v) for k, v in self._data.items()}
+
+    def _unknown(self, key: str) -> str:
+        message = f"Unknown configuration key {key!r}."
+        matches = difflib.get_close_matches(str(key), [str(k) for k in self._flat], n=1)
+        if matches:
+            message += f" Did you mean {matches[0]!r}?"
+        return message
+
+
+# tuple of field names -> generated Config subclass with those slots
+_classes: Dict[Tuple[str, ...], type] = {}
+
+
+def _is_field(key: Any) -> bool:
+    return (
+        isinstance(key, str)
+        and key.isidentifier()
+        and not keyword.iskeyword(key)
+        and not key.startswith("_")
+        and not hasattr(Config, key)
+    )
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Config):
+        return value
+    if isinstance(value, Mapping):
+        return Config(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Config):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return set(_thaw(v) for v in value)
+    return value
+
+
+def _hash_items(values: Dict[str, Any]) -> int:
+    try:
+        return hash(frozenset(values.items()))
+    except TypeError:
+        # Unhashable leaf (e.g. a custom YAML tag); fall back to its repr.
+        return hash(frozenset((k, repr(v)) for k, v in values.items()))
@@ -1,10 +1,70 @@
-import yaml
+import hashlib
 import os
+import pickle
+import re
+import yaml
+from collections import OrderedDict
 from colorama import Fore, Style, init
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+from fenn.args.config import Config
+from fenn.args.schema import BUILTIN_SCHEMA, ConfigError, compile_schema
 from fenn.secrets.keystore import KeyStore
 
+# libyaml's C loader is several times faster than the pure-Python one.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Top-level YAML section holding the schema; namespaced so that a config
+# may use a plain `schema` key for its own data.
+SCHEMA_KEY = "fenn_schema"
+
+
+class _CompiledConfig:
+    """A parsed configuration file, ready to be handed out again."""
+
+    __slots__ = ("mtime_ns", "size", "digest", "blob", "flat", "wandb_key", "schema")
+
+    def __init__(
+        self,
+        digest: str,
+        args: Dict[str, Any],
+        mtime_ns: int = 0,
+        size: int = 0,
+        wandb_key: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        # Deprecated: the WANDB key is moved out of the config once, here.
+        wandb_conf = args.get("wandb")
+        if isinstance(wandb_conf, dict) and "key" in wandb_conf:
+            wandb_key = wandb_conf.pop("key")
+        self.wandb_key = wandb_key
+        # The schema section describes the config, it is not part of it.
+        if isinstance(args.get(SCHEMA_KEY), dict):
+            schema = {**(schema or {}), **args.pop(SCHEMA_KEY)}
+        self.schema = schema
+        self.blob = pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL)
+        self.flat = Parser._flatten_dict(args)
+
+    def args(self) -> Dict[str, Any]:
+        # Every caller gets its own copy, the cached one is never mutated.
+        return pickle.loads(self.blob)
+
+
+# abspath -> compiled config, validated by mtime/size and then content hash
+_config_cache: Dict[str, _CompiledConfig] = {}
+
+# layer-stack hash -> merged config, least recently used first. Every
+# distinct set of overrides is a new entry, so long-lived processes keep
+# only the last few.
+_MERGED_CACHE_SIZE = 32
+_merged_cache: "OrderedDict[str, _CompiledConfig]" = OrderedDict()
+
+_OVERRIDE = re.compile(r"^[A-Za-z_][\w\-]*(\.[\w\-]+)*=")
+
+
 class Parser:
 
     _instance = None
@@ -15,49 +75,90 @@ class Parser:
         return cls._instance
 
     def __init__(self) -> None:
+        # Parser() is called from many places; only the first call sets it up,
+        # later ones must not wipe the configuration of the current run.
+        if getattr(self, "_initialized", False):
+            return
 
-        self._config_file: str = "fenn.yaml"
-        self._args: Dict[str, Any] = {}
+        self._config_files: List[str] = ["fenn.yaml"]
+        self._overrides: List[str] = []
+        self._args = {}
+        self._schema: Optional[Dict[str, Any]] = None
 
         self._keystore: KeyStore = KeyStore()
 
         init(autoreset=True)
+        self._initialized = True
+
+    @property
+    def _args(self) -> Dict[str, Any]:
+        return self._loaded_args
+
+    @_args.setter
+    def _args(self, args: Dict[str, Any]) -> None:
+        self._loaded_args = args
+        # Flattened again unless load_configuration provides the flat table
+        self._flat_args: Optional[Dict[str, Any]] = None
 
     def load_configuration(self) -> Any:
-        """Loads the YAML configuration into the _args dictionary."""
+        """Loads the YAML configuration into the _args dictionary.
+
+        The config files are deep-merged in order (later files win, lists are
+        replaced), then the ``key.path=value`` overrides are applied.
+        """
         from fenn.logging import Logger
 
         logger = Logger()
 
-        # Check if file exists BEFORE reading
-        default = " (default)" if self._config_file == "fenn.yaml" else ""
+        # Check if files exist BEFORE reading
+        for config_file in self._config_files:
+            default = " (default)" if config_file == "fenn.yaml" else ""
 
-        if not os.path.isfile(self._config_file):
+            if not os.path.isfile(config_file):
 
-            logger.system_exception(
-                f"Configuration file {self._config_file}{default} was not found."
-            )
+                logger.system_exception(
+                    f"Configuration file {config_file}{default} was not found."
+                )
 
-            raise FileNotFoundError(
-                0,
-                f"Configuration file {self._config_file} was not found.",
-                self._config_file,
-            )
+                raise FileNotFoundError(
+                    0,
+                    f"Configuration file {config_file} was not found.",
+                    config_file,
+                )
 
-        # File exists → load YAML
-        with open(self._config_file) as f:
-            self._args = yaml.safe_load(f)
+        # Files exist → load YAML (or reuse the cached parse/merge)
+        compiled = self._compile_stack(self._config_files, self._overrides)
+        self._args = compiled.args()
+        self._flat_args = compiled.flat
 
-        logger.system_info(
-            f"Configuration file {self._config_file} {default} loaded."
-        )
+        # Validate before anything else runs, so a bad config fails fast
+        schema = compile_schema(BUILTIN_SCHEMA, self._schema, compiled.schema)
+        try:
+            changed = schema.apply(self._args)
+        except ConfigError as e:
+            logger.system_exception(str(e))
+            raise
 
-        # Handle deprecated WANDB key
-        if self._args.get("wandb", {}).get("key"):
-            self._keystore.set_key(
-                "WANDB_API_KEY", self._args["wandb"]["key"]
+        if changed:
+            if any(isinstance(v, dict) for v in changed.values()):
+                self._flat_args = None
+            else:
+                self._flat_args = {**compiled.flat, **changed}
+
+        for config_file in self._config_files:
+            default = " (default)" if config_file == "fenn.yaml" else ""
+            logger.system_info(
+                f"Configuration file {config_file} {default} loaded."
+            )
+
+        if self._overrides:
+            logger.system_info(
+                f"Configuration overrides applied: {' '.join(self._overrides)}"
             )
-            self._args["wandb"].pop("key")
+
+        # Handle deprecated WANDB key
+        if compiled.wandb_key:
+            self._keystore.set_key("WANDB_API_KEY", compiled.wandb_key)
 
             logger.system_warning(
                 "WANDB key in yaml file is deprecated. "
@@ -77,7 +178,7 @@ class Parser:
             Fore.LIGHTGREEN_EX,
         ]
 
-        flat_config = self._flatten_dict(self._args)
+        flat_config = self._flat_config()
 
         for k, v in flat_config.items():
             parts = k.split("/")
@@ -90,17 +191,192 @@ class Parser:
             Logger().user_info(f"{'/'.join(colored_parts)}: {v}")
 
     @property
-    def config_file(self) -> str:
-        return self._config_file
+    def config_file(self) -> Union[str, List[str]]:
+        if len(self._config_files) == 1:
+            return self._config_files[0]
+        return list(self._config_files)
 
     @config_file.setter
-    def config_file(self, config_file: str) -> None:
-        self._config_file = config_file
+    def config_file(self, config_file: Union[str, Sequence[str]]) -> None:
+        if isinstance(config_file, (str, os.PathLike)):
+            self._config_files = [os.fspath(config_file)]
+        else:
+            self._config_files = [os.fspath(f) for f in config_file]
+        if not self._config_files:
+            raise ValueError("At least one configuration file is required.")
+
+    @property
+    def schema(self) -> Optional[Dict[str, Any]]:
+        return self._schema
+
+    @schema.setter
+    def schema(self, schema: Optional[Dict[str, Any]]) -> None:
+        # Compile now, so that a malformed schema fails before anything runs.
+        compile_schema(BUILTIN_SCHEMA, schema)
+        self._schema = dict(schema) if schema else None
+
+    @property
+    def overrides(self) -> List[str]:
+        return self._overrides
+
+    @overrides.setter
+    def overrides(self, overrides: Sequence[str]) -> None:
+        # Parse now, so that a malformed override fails before anything runs.
+        self._parse_overrides(overrides)
+        self._overrides = list(overrides)
+
+    @staticmethod
+    def is_override(token: str) -> bool:
+        """True if a command-line token looks like ``key.path=value``."""
+        return bool(_OVERRIDE.match(token))
 
     @property
     def args(self) -> Dict[str, Any]:
         return self._args
 
+    def freeze(self) -> Config:
+        """Returns the loaded configuration as a frozen, hashable Config tree."""
+        return Config(self._args)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drops every cached configuration file and merged layer stack."""
+        _config_cache.clear()
+        _merged_cache.clear()
+
+    @staticmethod
+    def _compile_stack(
+        config_files: Sequence[str], overrides: Sequence[str]
+    ) -> _CompiledConfig:
+        """Returns the merged config of a layer stack, memoized by its hash."""
+        layers = [Parser._compile(f) for f in config_files]
+        if len(layers) == 1 and not overrides:
+            return layers[0]
+
+        stack = hashlib.sha256()
+        for layer in layers:
+            stack.update(layer.digest.encode())
+        for override in overrides:
+            stack.update(b"\0" + override.encode())
+        digest = stack.hexdigest()
+
+        merged = _merged_cache.get(digest)
+        if merged is not None:
+            _merged_cache.move_to_end(digest)
+        else:
+            dicts = [layer.args() for layer in layers]
+            if overrides:
+                dicts.append(Parser._parse_overrides(overrides))
+            wandb_key = next(
+                (layer.wandb_key for layer in reversed(layers) if layer.wandb_key), None
+            )
+            schema = {}
+            for layer in layers:
+                schema.update(layer.schema or {})
+            merged = _CompiledConfig(
+                digest,
+                Parser._merge_layers(dicts),
+                wandb_key=wandb_key,
+                schema=schema or None,
+            )
+            _merged_cache[digest] = merged
+            if len(_merged_cache) > _MERGED_CACHE_SIZE:
+                _merged_cache.popitem(last=False)
+        return merged
+
+    @staticmethod
+    def _merge_layers(layers: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """Deep-merges dictionaries in one pass; later layers win, lists are replaced."""
+        values: Dict[str, List[Any]] = {}
+        for layer in layers:
+            for k, v in layer.items():
+                values.setdefault(k, []).append(v)
+
+        merged = {}
+        for k, candidates in values.items():
+            last = candidates[-1]
+            if not isinstance(last, dict):
+                merged[k] = last
+                continue
+            # Only the trailing run of dicts is merged: a scalar resets the key.
+            run = []
+            for v in reversed(candidates):
+                if not isinstance(v, dict):
+                    break
+                run.append(v)
+            merged[k] = Parser._merge_layers(run[::-1]) if len(run) > 1 else last
+        return merged
+
+    @staticmethod
+    def _parse_value(raw: str) -> Any:
+        """Parses the value of a ``key.path=value`` override as YAML."""
+        return yaml.load(raw, Loader=_YamlLoader) if raw else None
+
+    @staticmethod
+    def _parse_overrides(overrides: Sequence[str]) -> Dict[str, Any]:
+        """Turns ``key.path=value`` strings into a nested dict; values are parsed as YAML."""
+        layer: Dict[str, Any] = {}
+        for override in overrides:
+            if not _OVERRIDE.match(override):
+                raise ValueError(
+                    f"Invalid configuration override {override!r}, expected key.path=value"
+                )
+            path, _, raw = override.partition("=")
+            value = Parser._parse_value(raw)
+
+            *parents, leaf = path.split(".")
+            node = layer
+            for part in parents:
+                child = node.get(part)
+                if not isinstance(child, dict):
+                    child = node[part] = {}
+                node = child
+            node[leaf] = value
+        return layer
+
+    @staticmethod
+    def _compile(config_file: str) -> _CompiledConfig:
+        """Returns the parsed config file, from the cache when it is unchanged."""
+        path = os.path.abspath(config_file)
+        stat = os.stat(path)
+        cached = _config_cache.get(path)
+
+        if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        if cached and cached.digest == digest:
+            # Touched but not modified.
+            cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+            return cached
+
+        args = yaml.load(data, Loader=_YamlLoader) or {}
+        compiled = _CompiledConfig(digest, args, stat.st_mtime_ns, stat.st_size)
+        _config_cache[path] = compiled
+        return compiled
+
+    def _flat_config(self) -> Dict[str, Any]:
+        """Flattened _args, reusing the flattening done when the file was compiled.
+
+        Only top-level keys added after loading (e.g. ``session_id``) are
+        flattened again. The compiled table is used once, for the print
+        that follows loading: the entrypoint may mutate nested values
+        afterwards, so later calls flatten _args again.
+        """
+        cached, self._flat_args = self._flat_args, None
+        if cached is None:
+            return self._flatten_dict(self._args)
+
+        flat = dict(cached)
+        roots = {key.split("/", 1)[0] for key in flat}
+        for k, v in self._args.items():
+            if k not in roots:
+                flat.update(self._flatten_dict({k: v}))
+        return flat
+
     @staticmethod
     def _flatten_dict(d: dict, parent_key: str = "", sep: str = "/") -> dict:
         """Recursively flattens a nested dictionary."""
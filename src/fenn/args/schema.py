@@ -0,0 +1,243 @@
+import json
+import re
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# Keys every configuration needs, whatever the user schema says.
+BUILTIN_SCHEMA: Dict[str, Any] = {
+    "project": str,
+    "logger.dir": str,
+}
+
+_MISSING = object()
+_TRUE = {"true", "yes", "on", "1"}
+_FALSE = {"false", "no", "off", "0"}
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration does not match its schema.
+
+    Every issue found is collected in ``issues``, so a bad configuration is
+    fixed in one go instead of one error per run.
+    """
+
+    def __init__(self, issues: List[str]) -> None:
+        self.issues = list(issues)
+        super().__init__(
+            "Invalid configuration:\n" + "\n".join(f"  - {issue}" for issue in self.issues)
+        )
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise TypeError
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return float(value.strip())
+    raise TypeError
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise TypeError
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            value = float(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise TypeError
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise TypeError
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError
+
+
+def _to_list(value: Any) -> list:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError
+
+
+def _to_dict(value: Any) -> dict:
+    if isinstance(value, dict):
+        return value
+    raise TypeError
+
+
+_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "float": _to_float,
+    "int": _to_int,
+    "bool": _to_bool,
+    "str": _to_str,
+    "list": _to_list,
+    "dict": _to_dict,
+    "any": lambda value: value,
+}
+
+
+class _Field:
+    """One compiled schema entry: where the value lives and how to check it."""
+
+    __slots__ = (
+        "name", "parts", "type_name", "coerce", "required", "default",
+        "nullable", "choices", "minimum", "maximum",
+    )
+
+    def __init__(self, key: str, spec: Any) -> None:
+        self.parts: Tuple[str, ...] = tuple(re.split(r"[./]", key))
+        self.name = ".".join(self.parts)
+
+        options = dict(spec) if isinstance(spec, Mapping) else {"type": spec}
+        unknown = set(options) - {
+            "type", "required", "default", "nullable", "choices", "min", "max"
+        }
+        if unknown:
+            raise ValueError(f"Unknown schema option(s) for {self.name}: {sorted(unknown)}")
+
+        type_name = options.get("type", "any")
+        if isinstance(type_name, type):
+            type_name = type_name.__name__
+        if type_name not in _COERCERS:
+            raise ValueError(
+                f"Unknown schema type {type_name!r} for {self.name}, "
+                f"expected one of {sorted(_COERCERS)}"
+            )
+        self.type_name: str = type_name
+        self.coerce = _COERCERS[type_name]
+
+        self.default = options.get("default", _MISSING)
+        self.required: bool = options.get("required", self.default is _MISSING)
+        self.nullable: bool = options.get("nullable", False)
+        self.choices: Optional[List[Any]] = options.get("choices")
+        self.minimum: Optional[float] = options.get("min")
+        self.maximum: Optional[float] = options.get("max")
+
+    def apply(self, args: Dict[str, Any], issues: List[str], changed: Dict[str, Any]) -> None:
+        node: Any = args
+        for part in self.parts[:-1]:
+            child = node.get(part, _MISSING) if isinstance(node, dict) else _MISSING
+            if child is _MISSING and self.default is not _MISSING:
+                child = node[part] = {}
+            if child is _MISSING:
+                if self.required:
+                    issues.append(f"{self.name}: required key is missing")
+                return
+            if not isinstance(child, dict):
+                issues.append(f"{self.name}: {part!r} is {child!r}, not a section")
+                return
+            node = child
+
+        leaf = self.parts[-1]
+        value = node.get(leaf, _MISSING)
+
+        if value is _MISSING:
+            if self.default is not _MISSING:
+                node[leaf] = self.default
+                changed["/".join(self.parts)] = self.default
+            elif self.required:
+                issues.append(f"{self.name}: required key is missing")
+            return
+
+        if value is None:
+            if not self.nullable:
+                issues.append(f"{self.name}: expected {self.type_name}, got None")
+            return
+
+        try:
+            coerced = self.coerce(value)
+        except (TypeError, ValueError):
+            issues.append(f"{self.name}: expected {self.type_name}, got {value!r}")
+            return
+
+        if self.choices is not None and coerced not in self.choices:
+            issues.append(f"{self.name}: {coerced!r} is not one of {self.choices}")
+        if self.minimum is not None and coerced < self.minimum:
+            issues.append(f"{self.name}: {coerced!r} is below the minimum {self.minimum}")
+        if self.maximum is not None and coerced > self.maximum:
+            issues.append(f"{self.name}: {coerced!r} is above the maximum {self.maximum}")
+
+        if coerced is not value:
+            node[leaf] = coerced
+            changed["/".join(self.parts)] = coerced
+
+
+class Schema:
+    """A configuration schema compiled into a flat list of field checks.
+
+    The spec maps key paths (``training.lr`` or ``training/lr``) to a type
+    (``float``, ``"float"``...) or to a dict with ``type``, ``required``,
+    ``default``, ``nullable``, ``choices``, ``min`` and ``max``. Values are
+    coerced to their type (``"1e-3"`` becomes ``0.001``) and every issue is
+    collected before a single ConfigError is raised.
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, spec: Mapping[str, Any]) -> None:
+        fields: Dict[str, _Field] = {}
+        for key, field_spec in spec.items():
+            field = _Field(key, field_spec)
+            fields[field.name] = field
+        self._fields: Tuple[_Field, ...] = tuple(fields.values())
+
+    def apply(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Validates and coerces ``args`` in place.
+
+        Returns:
+            The values that were coerced or filled from a default, keyed by
+            their ``a/b`` path.
+
+        Raises:
+            ConfigError: If any field is missing or invalid.
+        """
+        issues: List[str] = []
+        changed: Dict[str, Any] = {}
+        for field in self._fields:
+            field.apply(args, issues, changed)
+        if issues:
+            raise ConfigError(issues)
+        return changed
+
+
+# canonical spec -> compiled schema
+_schema_cache: Dict[str, Schema] = {}
+
+
+def compile_schema(*specs: Optional[Mapping[str, Any]]) -> Schema:
+    """Compiles the union of the given specs (later ones win), once per process."""
+    merged: Dict[str, Any] = {}
+    for spec in specs:
+        for key, field_spec in (spec or {}).items():
+            merged[".".join(re.split(r"[./]", key))] = field_spec
+
+    key = json.dumps(
+        merged, sort_keys=True, default=lambda o: getattr(o, "__name__", repr(o))
+    )
+    schema = _schema_cache.get(key)
+    if schema is None:
+        schema = _schema_cache[key] = Schema(merged)
+    return schema
@@ -1,5 +1,20 @@
 import argparse
-import fenn.cli.pull_command as pull_command
+import importlib
+from typing import Callable
+
+
+def _command(module: str) -> Callable[[argparse.Namespace], None]:
+    """Returns the execute function of a command module, imported on first call.
+
+    `fenn --help` and every other command then only import what they run
+    (e.g. requests for pull, sqlite3 for logs).
+    """
+
+    def execute(args: argparse.Namespace) -> None:
+        return importlib.import_module(module).execute(args)
+
+    return execute
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="fenn")
@@ -34,7 +49,101 @@ def build_parser() -> argparse.ArgumentParser:
         help="List available templates in the repository",
     )
 
-    p_pull.set_defaults(func=pull_command.execute)
+    p_pull.set_defaults(func=_command("fenn.cli.pull_command"))
+
+    # --- Level 1 ---
+    p_logs = subparsers.add_parser("logs", help="Search the sessions stored in a logger directory")
+
+    # --- Level 2 ---
+    p_logs.add_argument(
+        "query",
+        nargs="?",
+        help="Text that must appear in the session log",
+    )
+
+    p_logs.add_argument(
+        "--dir",
+        default="logger",
+        help="Logger directory (default: logger)",
+    )
+
+    p_logs.add_argument(
+        "--project",
+        help="Only show sessions of this project",
+    )
+
+    p_logs.add_argument(
+        "--status",
+        help="Only show sessions with this status (running, completed, failed, interrupted)",
+    )
+
+    p_logs.add_argument(
+        "--where",
+        action="append",
+        metavar="KEY=VALUE",
+        help="Only show sessions whose config has this value (e.g. training.lr=0.001), repeatable",
+    )
+
+    p_logs.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum number of sessions to show (default: 20)",
+    )
+
+    p_logs.set_defaults(func=_command("fenn.cli.logs_command"))
+
+    # --- Level 1 ---
+    p_sync = subparsers.add_parser("sync", help="Upload wandb metrics spooled by offline sessions")
+
+    # --- Level 2 ---
+    p_sync.add_argument(
+        "--dir",
+        default="logger",
+        help="Logger directory (default: logger)",
+    )
+
+    p_sync.set_defaults(func=_command("fenn.cli.sync_command"))
+
+    # --- Level 1 ---
+    p_profile = subparsers.add_parser(
+        "profile-startup",
+        help="Time the imports and startup phases of a fenn application",
+    )
+
+    # --- Level 2 ---
+    p_profile.add_argument(
+        "script",
+        help="Python script to profile (e.g., main.py)",
+    )
+
+    p_profile.add_argument(
+        "script_args",
+        nargs=argparse.REMAINDER,
+        help="Arguments passed to the script",
+    )
+
+    p_profile.add_argument(
+        "--full",
+        action="store_true",
+        help="Run the entrypoint too instead of stopping before it",
+    )
+
+    p_profile.add_argument(
+        "--min-ms",
+        type=float,
+        default=5.0,
+        help="Hide imports faster than this, in milliseconds (default: 5)",
+    )
+
+    p_profile.add_argument(
+        "--depth",
+        type=int,
+        default=3,
+        help="Maximum depth of the import tree (default: 3)",
+    )
+
+    p_profile.set_defaults(func=_command("fenn.cli.profile_startup_command"))
 
     return parser
 
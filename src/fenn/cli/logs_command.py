@@ -0,0 +1,81 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from colorama import Fore, Style
+
+from fenn.logging.index import SessionIndex
+
+STATUS_COLORS = {
+    "completed": Fore.GREEN,
+    "running": Fore.CYAN,
+    "failed": Fore.RED,
+    "interrupted": Fore.YELLOW,
+}
+
+
+def execute(args: argparse.Namespace) -> None:
+    """
+    Execute the fenn logs command to search the sessions in a logger directory.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - query: Text that must appear in the session log (optional)
+            - dir: Logger directory (default: logger)
+            - project: Only sessions of this project (optional)
+            - status: Only sessions with this status (optional)
+            - where: List of key.path=value config filters
+            - limit: Maximum number of sessions shown
+    """
+    logger_dir = Path(args.dir)
+    if not logger_dir.is_dir():
+        print(
+            f"{Fore.RED}[FENN] Logger directory "
+            f"{Fore.LIGHTYELLOW_EX}{logger_dir}{Fore.RED} was not found.{Style.RESET_ALL}"
+        )
+        sys.exit(1)
+
+    where = {}
+    for condition in args.where or []:
+        key, sep, value = condition.partition("=")
+        if not sep:
+            print(
+                f"{Fore.RED}[FENN] Invalid filter {Fore.LIGHTYELLOW_EX}{condition}"
+                f"{Fore.RED}. Expected {Fore.LIGHTYELLOW_EX}key.path=value{Style.RESET_ALL}"
+            )
+            sys.exit(1)
+        where[key] = value
+
+    start = time.perf_counter()
+    index = SessionIndex(logger_dir)
+    try:
+        indexed = index.update()
+        sessions = index.search(
+            text=args.query,
+            project=args.project,
+            status=args.status,
+            where=where,
+            limit=args.limit,
+        )
+    finally:
+        index.close()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"{Fore.GREEN}[FENN] {len(sessions)} session(s) found "
+        f"({indexed} log(s) indexed, {elapsed_ms:.0f} ms).{Style.RESET_ALL}"
+    )
+
+    for session in sessions:
+        status = session["status"] or "unknown"
+        color = STATUS_COLORS.get(status, "")
+        print(
+            f"  {Fore.LIGHTYELLOW_EX}{session['session_id']}{Style.RESET_ALL} "
+            f"{session['project']} {color}{status}{Style.RESET_ALL} "
+            f"{session['start_time'] or '?'} -> {session['end_time'] or '?'}"
+        )
+        print(f"    {session['path']}")
+        if session.get("snippet"):
+            snippet = " ".join(session["snippet"].split())
+            print(f"    {Fore.CYAN}{snippet}{Style.RESET_ALL}")
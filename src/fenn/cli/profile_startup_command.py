@@ -0,0 +1,85 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from colorama import Fore, Style
+
+from fenn import profiling
+
+
+def execute(args: argparse.Namespace) -> None:
+    """
+    Execute the fenn profile-startup command to time the startup of a script.
+
+    The script runs with ``python -X importtime`` and FENN_PROFILE_STARTUP
+    set, so FENN.run logs its startup phases. The import tree is printed and
+    appended to the session log of the profiled run.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - script: Python script to profile
+            - script_args: Arguments passed to the script
+            - full: Run the entrypoint instead of stopping before it
+            - min_ms: Hide imports faster than this (in milliseconds)
+            - depth: Maximum depth of the import tree
+    """
+    script = Path(args.script)
+    if not script.is_file():
+        print(
+            f"{Fore.RED}[FENN] Script {Fore.LIGHTYELLOW_EX}{script}"
+            f"{Fore.RED} was not found.{Style.RESET_ALL}"
+        )
+        sys.exit(1)
+
+    fd, log_path_file = tempfile.mkstemp(prefix="fenn-profile-", suffix=".txt")
+    os.close(fd)
+
+    env = dict(os.environ)
+    env[profiling.PROFILE_ENV] = "1" if args.full else "exit"
+    env[profiling.ORIGIN_ENV] = repr(time.time())
+    env[profiling.LOG_PATH_ENV] = log_path_file
+
+    try:
+        process = subprocess.Popen(
+            [sys.executable, "-X", "importtime", str(script), *args.script_args],
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        import_lines = []
+        for line in process.stderr:
+            if line.startswith("import time:"):
+                import_lines.append(line)
+            else:
+                sys.stderr.write(line)
+        returncode = process.wait()
+
+        session_log = Path(log_path_file).read_text(encoding="utf-8").strip()
+    finally:
+        os.unlink(log_path_file)
+
+    roots = profiling.parse_importtime(import_lines)
+    total_ms = sum(root.total_ms for root in roots)
+    tree = profiling.format_import_tree(roots, min_ms=args.min_ms, max_depth=args.depth)
+
+    print(f"{Fore.GREEN}[FENN] Import time: {total_ms:.1f} ms{Style.RESET_ALL}")
+    for line in tree:
+        print(f"  {line}")
+
+    if session_log:
+        now = datetime.now().replace(microsecond=0).isoformat(" ")
+        with open(session_log, "a", encoding="utf-8") as f:
+            f.write(f"[{now}] Import times (total {total_ms:.1f}ms):\n")
+            f.writelines(f"[{now}]   {line}\n" for line in tree)
+        print(
+            f"{Fore.GREEN}[FENN] Startup profile written to "
+            f"{Fore.LIGHTYELLOW_EX}{session_log}{Style.RESET_ALL}"
+        )
+
+    if returncode:
+        sys.exit(returncode)
@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from colorama import Fore, Style
+
+from fenn.logging.spool import SpoolReplayer, find_spools
+from fenn.secrets.keystore import KeyStore
+
+
+def execute(args: argparse.Namespace) -> None:
+    """
+    Execute the fenn sync command to upload spooled wandb metrics.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - dir: Logger directory (default: logger)
+    """
+    logger_dir = Path(args.dir)
+    if not logger_dir.is_dir():
+        print(
+            f"{Fore.RED}[FENN] Logger directory "
+            f"{Fore.LIGHTYELLOW_EX}{logger_dir}{Fore.RED} was not found.{Style.RESET_ALL}"
+        )
+        sys.exit(1)
+
+    if not os.environ.get("WANDB_API_KEY"):
+        try:
+            os.environ["WANDB_API_KEY"] = KeyStore().get_key("WANDB_API_KEY")
+        except KeyError:
+            pass
+
+    # Running sessions are uploaded by their own process
+    running = [d for d in find_spools(logger_dir) if SpoolReplayer(d).active]
+    if running:
+        print(
+            f"{Fore.YELLOW}[FENN] Skipped {len(running)} spool(s) of sessions "
+            f"still running.{Style.RESET_ALL}"
+        )
+
+    spools = [d for d in find_spools(logger_dir) if SpoolReplayer(d).pending()]
+    if not spools:
+        print(f"{Fore.GREEN}[FENN] Nothing to sync.{Style.RESET_ALL}")
+        return
+
+    failed = 0
+    for spool_dir in spools:
+        try:
+            uploaded = SpoolReplayer(spool_dir).finish()
+            print(
+                f"{Fore.GREEN}[FENN] Synced {Fore.LIGHTYELLOW_EX}{spool_dir}"
+                f"{Fore.GREEN} ({uploaded} record(s)).{Style.RESET_ALL}"
+            )
+        except Exception as e:
+            failed += 1
+            print(
+                f"{Fore.RED}[FENN] Failed to sync {Fore.LIGHTYELLOW_EX}{spool_dir}"
+                f"{Fore.RED}: {e}{Style.RESET_ALL}"
+            )
+
+    if failed:
+        sys.exit(1)
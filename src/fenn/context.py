@@ -0,0 +1,33 @@
+from typing import Any, List, Optional, Union
+
+from fenn.utils import generate_haiku_id
+
+
+class RunContext:
+    """Everything that belongs to one run of an application.
+
+    A FENN application creates a new context for every ``run()`` (and every
+    run of a sweep), so that running again in the same process, e.g. in a
+    notebook or a warm worker, starts from a fresh session id, config and
+    status instead of the previous run's. The Parser and Logger singletons
+    only act on the context of the current run.
+    """
+
+    __slots__ = ("session_id", "config_file", "overrides", "args", "status", "result")
+
+    def __init__(
+        self,
+        config_file: Optional[Union[str, List[str]]] = None,
+        overrides: Optional[List[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> None:
+        self.session_id: str = session_id or generate_haiku_id()
+        self.config_file = config_file
+        self.overrides: List[str] = list(overrides or [])
+        self.args: Optional[Any] = None
+        # pending -> running -> completed / failed / interrupted / profiled
+        self.status: str = "pending"
+        self.result: Any = None
+
+    def __repr__(self) -> str:
+        return f"RunContext(session_id={self.session_id!r}, status={self.status!r})"
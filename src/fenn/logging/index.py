@@ -0,0 +1,304 @@
+import json
+import math
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fenn.args.parser import Parser
+
+INDEX_FILENAME = ".fenn_index.sqlite"
+
+# Bumped when the tables change; an index of another version is rebuilt.
+_SCHEMA_VERSION = 2
+
+# Log text is indexed in rows of about this many characters, up to
+# max_text_chars per session, so a multi-GB log is never held in memory.
+_CHUNK_CHARS = 1 << 20
+MAX_TEXT_CHARS = 64 << 20
+
+_TIMESTAMP = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]")
+
+_TABLES = ("sessions", "config", "chunks", "messages")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    signature TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    project TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    status TEXT,
+    config TEXT
+);
+CREATE TABLE IF NOT EXISTS config (
+    session INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS config_session ON config(session);
+CREATE INDEX IF NOT EXISTS config_key_value ON config(key, value);
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    session INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_session ON chunks(session);
+"""
+
+
+def _config_value(value: Any) -> str:
+    """Canonical text of a config value, shared by the index and the filters.
+
+    ``1e-3``, ``0.001`` and ``1.0e-3`` compare equal, as do ``10`` and
+    ``10.0``; booleans and strings are stored as JSON.
+    """
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(number):
+                value = number
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class SessionIndex:
+    """Incremental SQLite index of the sessions stored under a logger directory.
+
+    Every ``<logger.dir>/<project>/<session_id>.log`` is indexed together with
+    its ``<session_id>.json`` metadata (config, start/end time, status) when
+    present. ``update()`` only re-reads sessions whose files changed since
+    the last run, so queries stay fast on directories with thousands of logs.
+    Message text is searched through an FTS5 table when SQLite provides it;
+    only the first ``max_text_chars`` characters of each log are indexed.
+    """
+
+    def __init__(
+        self,
+        logger_dir: Path,
+        db_path: Optional[Path] = None,
+        max_text_chars: int = MAX_TEXT_CHARS,
+    ) -> None:
+        self._logger_dir = Path(logger_dir)
+        self._db_path = Path(db_path) if db_path else self._logger_dir / INDEX_FILENAME
+        self._max_text_chars = max_text_chars
+
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.row_factory = sqlite3.Row
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            # The index only caches what is on disk: rebuild it from scratch
+            for table in _TABLES:
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self._conn.executescript(_SCHEMA)
+        # Chunk text, with the rowid of its row in chunks
+        try:
+            self._conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS messages USING fts5(text)")
+            self._fts = True
+        except sqlite3.OperationalError:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS messages (text TEXT)")
+            self._fts = False
+        self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def update(self) -> int:
+        """Re-indexes new or changed sessions and drops deleted ones.
+
+        Returns:
+            The number of sessions that were (re-)indexed.
+        """
+        known = {
+            row["path"]: (row["id"], row["signature"])
+            for row in self._conn.execute("SELECT id, path, signature FROM sessions")
+        }
+
+        indexed = 0
+        seen = set()
+        with self._conn:
+            for log_file, signature in self._scan():
+                key = str(log_file)
+                seen.add(key)
+                if key in known:
+                    session, known_signature = known[key]
+                    if known_signature == signature:
+                        continue
+                    self._delete(session)
+                self._insert(log_file, signature)
+                indexed += 1
+
+            for key in known.keys() - seen:
+                self._delete(known[key][0])
+
+        return indexed
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        project: Optional[str] = None,
+        status: Optional[str] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Returns the matching sessions, most recent first.
+
+        Args:
+            text: Phrase that must appear in the session log.
+            project: Only sessions of this project.
+            status: Only sessions with this status (running, completed, ...).
+            where: Config values the session must have, keyed by flattened
+                path (``training/lr`` or ``training.lr``). String values are
+                parsed like command-line overrides, so ``"true"`` matches
+                True and ``"1e-3"`` matches 0.001.
+            limit: Maximum number of sessions returned.
+        """
+        columns = "s.path, s.session_id, s.project, s.start_time, s.end_time, s.status"
+        joins, clauses, params = [], [], []
+
+        if text:
+            # The session matches through any of its chunks
+            if self._fts:
+                match = '"' + text.replace('"', '""') + '"'
+                columns += (
+                    ", (SELECT snippet(messages, 0, '[', ']', '...', 12) FROM messages"
+                    " WHERE messages MATCH ? AND rowid IN"
+                    " (SELECT id FROM chunks WHERE session = s.id) LIMIT 1) AS snippet"
+                )
+                clauses.append(
+                    "s.id IN (SELECT session FROM chunks WHERE id IN"
+                    " (SELECT rowid FROM messages WHERE messages MATCH ?))"
+                )
+                params += [match, match]
+            else:
+                columns += ", NULL AS snippet"
+                clauses.append(
+                    "s.id IN (SELECT c.session FROM chunks c"
+                    " JOIN messages m ON m.rowid = c.id WHERE m.text LIKE ?)"
+                )
+                params.append(f"%{text}%")
+
+        if project:
+            clauses.append("s.project = ?")
+            params.append(project)
+
+        if status:
+            clauses.append("s.status = ?")
+            params.append(status)
+
+        for i, (key, value) in enumerate((where or {}).items()):
+            if isinstance(value, str):
+                value = Parser._parse_value(value)
+            joins.append(f"JOIN config c{i} ON c{i}.session = s.id")
+            clauses.append(f"c{i}.key = ? AND c{i}.value = ?")
+            params += [key.replace(".", "/"), _config_value(value)]
+
+        query = f"SELECT {columns} FROM sessions s {' '.join(joins)}"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY s.start_time DESC LIMIT ?"
+        params.append(limit)
+
+        return [dict(row) for row in self._conn.execute(query, params)]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _scan(self) -> Iterator[Tuple[Path, str]]:
+        for log_file in self._logger_dir.glob("*/*.log"):
+            signature = [log_file.stat()]
+            meta_file = log_file.with_suffix(".json")
+            if meta_file.exists():
+                signature.append(meta_file.stat())
+            yield log_file, ";".join(f"{st.st_mtime_ns}:{st.st_size}" for st in signature)
+
+    def _delete(self, session: int) -> None:
+        # By rowid: the FTS table has no index on anything else
+        chunks = self._conn.execute(
+            "SELECT id FROM chunks WHERE session = ?", (session,)
+        ).fetchall()
+        self._conn.executemany("DELETE FROM messages WHERE rowid = ?", chunks)
+        self._conn.execute("DELETE FROM chunks WHERE session = ?", (session,))
+        self._conn.execute("DELETE FROM config WHERE session = ?", (session,))
+        self._conn.execute("DELETE FROM sessions WHERE id = ?", (session,))
+
+    def _insert(self, log_file: Path, signature: str) -> None:
+        meta: Dict[str, Any] = {}
+        meta_file = log_file.with_suffix(".json")
+        if meta_file.exists():
+            try:
+                meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            except ValueError:
+                meta = {}
+        config = meta.get("config") or {}
+
+        session = self._conn.execute(
+            "INSERT INTO sessions (path, signature, session_id, project, start_time,"
+            " end_time, status, config) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(log_file),
+                signature,
+                meta.get("session_id", log_file.stem),
+                meta.get("project", log_file.parent.name),
+                meta.get("start_time"),
+                meta.get("end_time"),
+                meta.get("status", "unknown"),
+                json.dumps(config, default=str),
+            ),
+        ).lastrowid
+        self._conn.executemany(
+            "INSERT INTO config VALUES (?, ?, ?)",
+            [(session, k, _config_value(v)) for k, v in Parser._flatten_dict(config).items()],
+        )
+
+        first, last = self._insert_text(session, log_file, need_times=not (
+            meta.get("start_time") and meta.get("end_time")
+        ))
+        # Sessions without metadata are dated by their first and last log lines
+        self._conn.execute(
+            "UPDATE sessions SET start_time = COALESCE(start_time, ?),"
+            " end_time = COALESCE(end_time, ?) WHERE id = ?",
+            (
+                first.replace(" ", "T") if first else None,
+                last.replace(" ", "T") if last else None,
+                session,
+            ),
+        )
+
+    def _insert_text(
+        self, session: int, log_file: Path, need_times: bool
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Streams the log into chunks; returns its first and last timestamps."""
+        first = last = None
+        lines: List[str] = []
+        size = indexed = 0
+        with open(log_file, encoding="utf-8", errors="replace") as f:
+            # Bounded reads: a log without newlines is still read in chunks
+            for line in iter(lambda: f.readline(_CHUNK_CHARS), ""):
+                if need_times:
+                    match = _TIMESTAMP.match(line)
+                    if match:
+                        first = first or match.group(1)
+                        last = match.group(1)
+                if indexed >= self._max_text_chars:
+                    if not need_times:
+                        break
+                    continue
+                lines.append(line)
+                size += len(line)
+                indexed += len(line)
+                if size >= _CHUNK_CHARS or indexed >= self._max_text_chars:
+                    self._insert_chunk(session, "".join(lines))
+                    lines, size = [], 0
+        if lines:
+            self._insert_chunk(session, "".join(lines))
+        return first, last
+
+    def _insert_chunk(self, session: int, text: str) -> None:
+        chunk = self._conn.execute(
+            "INSERT INTO chunks (session) VALUES (?)", (session,)
+        ).lastrowid
+        self._conn.execute("INSERT INTO messages (rowid, text) VALUES (?, ?)", (chunk, text))
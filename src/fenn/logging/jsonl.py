@@ -0,0 +1,90 @@
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class JsonlSink:
+    """Writes structured log records as JSON Lines with size-based rotation.
+
+    Records are appended to ``<stem>.jsonl``. When the file would grow past
+    ``max_bytes`` it is closed and renamed to ``<stem>.<n>.jsonl`` (``n``
+    increasing from 1), and a new file is started. If ``compress`` is set,
+    rotated segments are gzip-compressed to ``<stem>.<n>.jsonl.gz`` by a
+    background thread, so rotation never blocks the caller on compression.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 100 * 1024 * 1024,
+        compress: bool = True,
+    ) -> None:
+        self._path = Path(path)
+        self._max_bytes = int(max_bytes)
+        self._compress = compress
+
+        self._lock = threading.Lock()
+        self._file = open(self._path, "a", encoding="utf-8")
+        self._size = self._path.stat().st_size
+        self._segment = 0
+
+        self._compress_queue: "queue.Queue[Optional[Path]]" = queue.Queue()
+        self._compressor: Optional[threading.Thread] = None
+        if compress:
+            self._compressor = threading.Thread(
+                target=self._compress_segments,
+                name="fenn-jsonl-compressor",
+                daemon=True,
+            )
+            self._compressor.start()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        size = len(line.encode("utf-8"))
+        with self._lock:
+            if self._size and self._size + size > self._max_bytes:
+                self._rotate()
+            self._file.write(line)
+            self._size += size
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+        if self._compressor is not None:
+            self._compress_queue.put(None)
+            self._compressor.join()
+            self._compressor = None
+
+    def _rotate(self) -> None:
+        # Must be called with self._lock held.
+        self._file.close()
+        self._segment += 1
+        segment = self._path.with_name(
+            f"{self._path.stem}.{self._segment}{self._path.suffix}"
+        )
+        os.replace(self._path, segment)
+        self._file = open(self._path, "a", encoding="utf-8")
+        self._size = 0
+        if self._compress:
+            self._compress_queue.put(segment)
+
+    def _compress_segments(self) -> None:
+        while True:
+            segment = self._compress_queue.get()
+            if segment is None:
+                return
+            target = segment.with_name(segment.name + ".gz")
+            with open(segment, "rb") as src, gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(segment)
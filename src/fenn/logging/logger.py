@@ -1,17 +1,23 @@
 import builtins
+import json
+import multiprocessing
 import os
 import re
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-import wandb
-try:
-    from torch.utils.tensorboard import SummaryWriter
-except ImportError:
-    SummaryWriter = None
 from colorama import Fore, Style
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from fenn.args import Parser
 from fenn.secrets.keystore import KeyStore
+from fenn.logging.jsonl import JsonlSink
+from fenn.logging.metrics import MetricsBuffer
+from fenn.logging.multiprocess import LogClient, LogListener, LogRecord, format_tag
+from fenn.logging.ratelimit import RateLimiter
+from fenn.logging.spans import Span, SpanRecorder
+from fenn.logging.spool import SpoolUploader, WandbSpool
+from fenn.logging.writer import BufferedFileWriter, FileWriter
 class Logger:
     """Singleton logging system for FENN."""
     _instance: Optional["Logger"] = None
@@ -28,23 +34,47 @@ class Logger:
         self._original_print = builtins.print
         self._keystore = KeyStore()
         self._parser = Parser()
+        self._spans = SpanRecorder()
+        self._rate_limiter = RateLimiter()
+        self._ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+        self._reset_session()
+        self._initialized = True
+    def _reset_session(self) -> None:
+        # Everything below belongs to one session and is set up again by start().
         self._args: Dict[str, Any] = None
         self._wandb_run: Optional[Any] = None
+        self._wandb_spool: Optional[WandbSpool] = None
+        self._wandb_uploader: Optional[SpoolUploader] = None
         self._tensorboard_writer: Optional[Any] = None
         self._log_file: Optional[Path] = None
-        self._ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        self._initialized = True
+        self._writer: Optional[Any] = None
+        self._jsonl_sink: Optional[JsonlSink] = None
+        self._metrics: Optional[MetricsBuffer] = None
+        self._print_rate: Optional[Tuple[int, float]] = None
+        self._start_time: Optional[datetime] = None
+        # Multi-process mode: the parent owns the queue and the listener,
+        # children only hold the queue and their tag.
+        self._owner_pid: Optional[int] = None
+        self._mp_queue: Optional[Any] = None
+        self._mp_listener: Optional[LogListener] = None
+        self._process_tag: Optional[str] = None
+        self._spans.clear()
+        self._span_summary: Dict[str, Dict[str, float]] = {}
+        self._rate_limiter.clear()
     # ==========================================================
     # SYSTEM LOGS — auto-tagged with [FENN]
     # ==========================================================
     def system_info(self, message: str) -> None:
         tag = f"{Fore.GREEN}[FENN][INFO]{Style.RESET_ALL}"
+        self._write_log("info", "system", message)
         self._system_print(f"{tag} {message}")
     def system_warning(self, message: str) -> None:
         tag = f"{Fore.YELLOW}[FENN][WARNING]{Style.RESET_ALL}"
+        self._write_log("warning", "system", message)
         self._system_print(f"{tag} {message}")
     def system_exception(self, message: str) -> None:
         tag = f"{Fore.RED}[FENN][EXCEPTION]{Style.RESET_ALL}"
+        self._write_log("exception", "system", message)
         self._system_print(f"{tag} {message}")
     # ==========================================================
     # USER LOGS — no tags, just printed normally
@@ -52,14 +82,64 @@ class Logger:
     def user_info(self, message: str) -> None:
         self._log_print(message)
     def user_warning(self, message: str) -> None:
-        self._log_print(message)
+        self._log_print(message, level="warning")
     def user_exception(self, message: str) -> None:
-        self._log_print(message)
+        self._log_print(message, level="exception")
+    # ==========================================================
+    # METRICS
+    # ==========================================================
+    def log_metrics(self, metrics: Dict[str, Any], step: Optional[int] = None) -> None:
+        """Buffers scalar metrics for the TensorBoard and wandb backends.
+
+        The call only appends to an in-memory buffer: values are aggregated
+        per step (``logger.metrics.aggregate``: mean, last or max) and sent
+        to the backends from a background thread. If ``step`` is omitted the
+        step after the previous call is used.
+        """
+        if self._metrics:
+            self._metrics.add(metrics, step)
+    def span(self, name: str) -> Span:
+        """Times a phase of the run, as a context manager or a decorator.
+
+        Wall-clock and CPU time are recorded per span name; count, p50, p95
+        and max are written to the session log and the metrics backends when
+        the session stops.
+
+        Example:
+            with Logger().span("data_load"):
+                batch = next(loader)
+        """
+        return Span(self._spans, name)
+    # ==========================================================
+    # SAMPLED OUTPUT
+    # ==========================================================
+    def every(self, n: int) -> bool:
+        """True on the first and then every ``n``-th call from the same line.
+
+        Example:
+            if logger.every(100):
+                print(f"step {step} loss {loss:.4f}")
+        """
+        return self._rate_limiter.allow(("every",) + self._call_site(), every=n)
+    def throttle(self, seconds: float) -> bool:
+        """True at most once every ``seconds`` for calls from the same line."""
+        return self._rate_limiter.allow(
+            ("throttle",) + self._call_site(), interval=seconds
+        )
+    @staticmethod
+    def _call_site(depth: int = 2) -> Tuple[str, int]:
+        frame = sys._getframe(depth)
+        return frame.f_code.co_filename, frame.f_lineno
     # ==========================================================
     # LOGGER CONTROL
     # ==========================================================
     def start(self) -> None:
+        if self._writer is not None:
+            # The previous session was never stopped (e.g. a crashed notebook cell)
+            self.stop("interrupted")
+        self._reset_session()
         self._args = self._parser.args
+        self._print_rate = self._parse_print_rate()
         self._log_filepath = (
             Path(self._args["logger"]["dir"]) / Path(self._args["project"])
         )
@@ -69,21 +149,107 @@ class Logger:
         os.makedirs(self._log_filepath, exist_ok=True)
         with open(self._log_file, "w", encoding="utf-8") as f:
             f.write("")
+        self._writer = self._create_writer()
+        self._start_time = datetime.now()
+        self._write_session_meta("running")
+        if self._args["logger"].get("jsonl"):
+            self._jsonl_sink = self._create_jsonl_sink()
+        self._owner_pid = os.getpid()
+        mp_conf = self._args["logger"].get("multiprocess")
+        if mp_conf:
+            # true -> default start method, or the name of one ("spawn", ...)
+            method = mp_conf if isinstance(mp_conf, str) else None
+            self._mp_queue = multiprocessing.get_context(method).Queue()
+            self._mp_listener = LogListener(self._mp_queue, self._write_child_record)
         self.system_info(
             f"Logging file {self._log_filename} created in {self._log_filepath}"
         )
-        builtins.print = self._log_print
+        builtins.print = self._print_hook()
         if self._args.get("wandb"):
             self._init_wandb()
         if self._args.get("tensorboard"):
             self._init_tensorboard()
-    def stop(self) -> None:
+        self._metrics = self._create_metrics_buffer()
+    def stop(self, status: str = "completed") -> None:
+        self._report_spans()
+        self._report_suppressed()
         builtins.print = self._original_print
+        if self._mp_listener:
+            self._mp_listener.stop()
+            if self._mp_listener.dropped:
+                self.system_warning(
+                    f"{self._mp_listener.dropped} log record(s) from child "
+                    "processes could not be written."
+                )
+            self._mp_listener = None
+        self._mp_queue = None
+        if self._metrics:
+            self._metrics.close()
+            self._metrics = None
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+            self._write_session_meta(status, end_time=datetime.now())
+        if self._jsonl_sink:
+            self._jsonl_sink.close()
+            self._jsonl_sink = None
         if self._wandb_run:
             self._wandb_run.finish()
+            self._wandb_run = None
+        if self._wandb_spool:
+            self._stop_wandb_spool()
         
         if self._tensorboard_writer:
             self._tensorboard_writer.close()
+            self._tensorboard_writer = None
+    def flush(self) -> None:
+        """Writes any buffered log lines to the session log file."""
+        if self._writer:
+            self._writer.flush()
+        if self._metrics:
+            self._metrics.flush()
+        if self._jsonl_sink:
+            self._jsonl_sink.flush()
+    async def aflush(self) -> None:
+        """Awaitable flush; the file I/O runs in the loop's default executor."""
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+    # ==========================================================
+    # MULTI-PROCESS LOGGING
+    # ==========================================================
+    def client(self, rank: Optional[int] = None) -> LogClient:
+        """Returns a picklable handle for child processes to log through.
+
+        Requires ``logger.multiprocess`` (``true`` for the default start
+        method, or the name of the start method the children use). Children
+        created with fork are routed automatically; with spawn/forkserver,
+        pass the client to the child and call ``Logger().connect(client)``
+        there, or pass it as a ``DataLoader`` ``worker_init_fn``.
+        """
+        if self._mp_queue is None:
+            raise RuntimeError(
+                "Multi-process logging is disabled. Set logger.multiprocess: true."
+            )
+        return LogClient(self._mp_queue, rank=rank)
+    def connect(
+        self,
+        client: LogClient,
+        rank: Optional[int] = None,
+        worker: Optional[int] = None,
+    ) -> None:
+        """Routes this (child) process's log lines to the parent Logger."""
+        self._mp_queue = client.queue
+        self._owner_pid = None
+        self._process_tag = format_tag(
+            rank=rank if rank is not None else client.rank,
+            worker=worker,
+            pid=os.getpid(),
+        )
+        builtins.print = self._print_hook()
+    def _write_child_record(self, record: LogRecord) -> None:
+        tag, level, source, message, timestamp = record
+        self._write_log(level, source, message, timestamp=timestamp, tag=tag)
     # ==========================================================
     # INTERNAL PRINT HANDLER
     # ==========================================================
@@ -96,6 +262,145 @@ class Logger:
         flush: bool = False,
     ) -> None:
         self._original_print(*objects, sep=sep, end=end, file=file, flush=flush)
+    def _create_writer(self) -> Any:
+        logger_conf = self._args["logger"]
+        if not logger_conf.get("buffered", False):
+            return FileWriter(self._log_file)
+        return BufferedFileWriter(
+            self._log_file,
+            max_lines=logger_conf.get("buffer_size", 1024),
+            flush_interval=logger_conf.get("flush_interval", 1.0),
+        )
+    def _write_session_meta(
+        self, status: str, end_time: Optional[datetime] = None
+    ) -> None:
+        # <session_id>.json next to the log, read by `fenn logs`.
+        meta = {
+            "session_id": self._args["session_id"],
+            "project": self._args["project"],
+            "start_time": self._start_time.isoformat(timespec="seconds"),
+            "end_time": end_time.isoformat(timespec="seconds") if end_time else None,
+            "status": status,
+            "config": self._args,
+        }
+        if self._span_summary:
+            meta["spans"] = self._span_summary
+        meta_file = self._log_file.with_suffix(".json")
+        with open(meta_file, "w", encoding="utf-8") as f:
+            json.dump(meta, f, default=str, indent=2)
+    def _create_jsonl_sink(self) -> JsonlSink:
+        jsonl_conf = self._args["logger"]["jsonl"]
+        if not isinstance(jsonl_conf, dict):
+            jsonl_conf = {}
+        return JsonlSink(
+            self._log_filepath / f'{self._args["session_id"]}.jsonl',
+            max_bytes=jsonl_conf.get("max_bytes", 100 * 1024 * 1024),
+            compress=jsonl_conf.get("compress", True),
+        )
+    def _create_metrics_buffer(self) -> Optional[MetricsBuffer]:
+        sinks = []
+        if self._tensorboard_writer:
+            sinks.append(self._tensorboard_sink)
+        if self._wandb_run:
+            sinks.append(self._wandb_sink)
+        if self._wandb_spool:
+            sinks.append(self._wandb_spool.log)
+        if not sinks:
+            return None
+        metrics_conf = self._args["logger"].get("metrics") or {}
+        return MetricsBuffer(
+            sinks,
+            aggregate=metrics_conf.get("aggregate", "mean"),
+            flush_interval=metrics_conf.get("flush_interval", 1.0),
+            on_error=lambda exc: self.system_warning(f"Failed to log metrics: {exc}"),
+        )
+    def _tensorboard_sink(self, metrics: Dict[str, float], step: int) -> None:
+        for name, value in metrics.items():
+            self._tensorboard_writer.add_scalar(name, value, step)
+    def _wandb_sink(self, metrics: Dict[str, float], step: int) -> None:
+        self._wandb_run.log(metrics, step=step)
+    def _report_spans(self) -> None:
+        summary = self._spans.summary()
+        if not summary or not self._writer:
+            return
+        self._log_print("Span timings:")
+        metrics = {}
+        for name, stats in summary.items():
+            self._log_print(
+                f"  {name}: count={stats['count']} "
+                f"p50={stats['p50_ms']:.3f}ms p95={stats['p95_ms']:.3f}ms "
+                f"max={stats['max_ms']:.3f}ms total={stats['total_ms']:.1f}ms "
+                f"cpu={stats['cpu_total_ms']:.1f}ms"
+            )
+            for key in ("p50_ms", "p95_ms", "max_ms", "total_ms"):
+                metrics[f"span/{name}/{key}"] = stats[key]
+        # Run-level statistics: kept out of the per-step metrics stream, where
+        # they would show up as an extra step after the user's last one.
+        self._span_summary = summary
+        if self._wandb_run:
+            try:
+                self._wandb_run.summary.update(metrics)
+            except Exception as exc:
+                self.system_warning(f"Failed to log span timings to wandb: {exc}")
+    def _report_suppressed(self) -> None:
+        if not self._writer:
+            return
+        for site, count in self._rate_limiter.suppressed().items():
+            # every()/throttle() skips are the caller's choice, not dropped output
+            if site[0] != "print":
+                continue
+            filename, lineno = site[-2:]
+            self._log_print(f"{count} messages suppressed at {filename}:{lineno}")
+    def _parse_print_rate(self) -> Optional[Tuple[int, float]]:
+        rate_conf = self._args["logger"].get("rate_limit")
+        if not rate_conf:
+            return None
+        return int(rate_conf.get("every", 1)), float(rate_conf.get("interval", 0.0))
+    def _print_hook(self) -> Any:
+        return self._sampled_print if self._print_rate else self._log_print
+    def _sampled_print(self, *objects: Any, **kwargs: Any) -> None:
+        every, interval = self._print_rate
+        site = ("print",) + self._call_site()
+        if self._rate_limiter.allow(site, every=every, interval=interval):
+            self._log_print(*objects, **kwargs)
+    def _write_log(
+        self,
+        level: str,
+        source: str,
+        message: str,
+        flush: bool = False,
+        timestamp: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        if self._mp_queue is not None and os.getpid() != self._owner_pid:
+            if self._process_tag is None:
+                self._process_tag = format_tag(pid=os.getpid())
+            self._mp_queue.put(
+                (self._process_tag, level, source, message, time.time())
+            )
+            return
+        if not (self._writer or self._jsonl_sink):
+            return
+        now = datetime.fromtimestamp(timestamp) if timestamp else datetime.now()
+        clean_message = self._ansi_escape.sub("", message)
+        if source == "user" and self._writer:
+            prefix = f"[{tag}] " if tag else ""
+            self._writer.write(
+                f"[{now.replace(microsecond=0).isoformat(' ')}] {prefix}{clean_message}\n"
+            )
+            if flush:
+                self._writer.flush()
+        if self._jsonl_sink:
+            record = {
+                "timestamp": now.isoformat(timespec="milliseconds"),
+                "level": level,
+                "source": source,
+                "session_id": self._args["session_id"],
+                "message": clean_message,
+            }
+            if tag:
+                record["process"] = tag
+            self._jsonl_sink.write(record)
     def _log_print(
         self,
         *objects: Any,
@@ -103,13 +408,10 @@ class Logger:
         end: str = "\n",
         file: Optional[Any] = None,
         flush: bool = False,
+        level: str = "info",
     ) -> None:
         message = sep.join(map(str, objects))
-        if self._log_file:
-            clean_message = self._ansi_escape.sub("", message)
-            timestamp = datetime.now().replace(microsecond=0).isoformat(" ")
-            with open(self._log_file, "a", encoding="utf-8") as f:
-                f.write(f"[{timestamp}] {clean_message}\n")
+        self._write_log(level, "user", message, flush=flush)
         self._original_print(*objects, sep=sep, end=end, file=file, flush=flush)
     # ==========================================================
     # WANDB INITIALIZATION
@@ -117,6 +419,9 @@ class Logger:
     def _init_wandb(self) -> None:
         os.environ["WANDB_SILENT"] = "true"
         wandb_conf = self._args.get("wandb", {})
+        if wandb_conf.get("spool"):
+            self._init_wandb_spool(wandb_conf)
+            return
         try:
             wandb_key = self._keystore.get_key("WANDB_API_KEY")
         except Exception as exc:
@@ -125,6 +430,7 @@ class Logger:
         if not os.environ.get("WANDB_API_KEY"):
             os.environ["WANDB_API_KEY"] = wandb_key
         try:
+            import wandb
             self._wandb_run = wandb.init(
                 entity=wandb_conf.get("entity"),
                 project=self._args.get("project"),
@@ -136,11 +442,58 @@ class Logger:
             self.system_exception("Failed to start wandb session.")
             self.system_warning("Ensure internet connection is active.")
             raise RuntimeError(f"Failed to initialize wandb: {exc}") from exc
+    def _init_wandb_spool(self, wandb_conf: Dict[str, Any]) -> None:
+        # Offline-first: metrics go to disk, the network is only touched by
+        # the background uploader (or a later `fenn sync`).
+        try:
+            os.environ.setdefault(
+                "WANDB_API_KEY", self._keystore.get_key("WANDB_API_KEY")
+            )
+        except KeyError:
+            self.system_warning(
+                "No WANDB API key found, metrics will only be spooled to disk."
+            )
+        spool_dir = self._log_filepath / f'{self._args["session_id"]}.wandb'
+        self._wandb_spool = WandbSpool(
+            spool_dir,
+            run_info={
+                "entity": wandb_conf.get("entity"),
+                "project": self._args.get("project"),
+                "config": self._args.get("training"),
+                "name": self._args.get("session_id"),
+            },
+        )
+        interval = wandb_conf.get("sync_interval", 30)
+        if interval:
+            self._wandb_uploader = SpoolUploader(
+                spool_dir,
+                interval=interval,
+                on_error=lambda exc: self.system_warning(
+                    f"Wandb upload failed, metrics stay spooled in {spool_dir}: {exc}"
+                ),
+            )
+        self.system_info(f"Wandb metrics spooled to {spool_dir}")
+    def _stop_wandb_spool(self) -> None:
+        spool_dir = self._wandb_spool.directory
+        uploaded = False
+        if self._wandb_uploader:
+            uploaded = self._wandb_uploader.close()
+            self._wandb_uploader = None
+        # Releases the spool's lock: from now on it is fenn sync's
+        self._wandb_spool.close()
+        self._wandb_spool = None
+        if not uploaded:
+            self.system_warning(
+                f"Wandb metrics in {spool_dir} were not uploaded. "
+                f"Run {Fore.LIGHTYELLOW_EX}fenn sync{Style.RESET_ALL} to upload them."
+            )
     # ==========================================================
     # TENSORBOARD INITIALIZATION
     # ==========================================================
     def _init_tensorboard(self) -> None:
-        if SummaryWriter is None:
+        try:
+            from torch.utils.tensorboard import SummaryWriter
+        except ImportError:
             self.system_warning(
                 "TensorBoard requested but torch is not installed or SummaryWriter not available."
             )
@@ -0,0 +1,138 @@
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+MetricsSink = Callable[[Dict[str, float], int], None]
+
+_AGGREGATES = ("mean", "last", "max")
+
+
+class MetricsBuffer:
+    """Buffers scalar metrics and fans them out to tracking backends.
+
+    ``add()`` only appends to an in-memory queue; values are converted to
+    floats, aggregated per step and handed to every sink by a daemon thread
+    every ``flush_interval`` seconds. The most recent step is held back until
+    a later step arrives (or ``flush()`` is called), so a step that is still
+    being logged is never sent twice. Steps reach the sinks in increasing
+    order (wandb rejects anything else); values for a step lower than one
+    already sent are dropped and reported through ``on_error``.
+    """
+
+    def __init__(
+        self,
+        sinks: List[MetricsSink],
+        aggregate: str = "mean",
+        flush_interval: float = 1.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        if aggregate not in _AGGREGATES:
+            raise ValueError(
+                f"Unknown metrics aggregate {aggregate!r}, expected one of {_AGGREGATES}"
+            )
+
+        self._sinks = sinks
+        self._aggregate = aggregate
+        self._flush_interval = float(flush_interval)
+        self._on_error = on_error
+
+        self._pending: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        # step -> metric name -> [sum, count, last, max]
+        self._steps: Dict[int, Dict[str, List[float]]] = {}
+        self._next_step = 0
+        # Highest step handed to the sinks
+        self._last_sent: Optional[int] = None
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name="fenn-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def add(self, metrics: Dict[str, Any], step: Optional[int] = None) -> None:
+        if step is None:
+            step = self._next_step
+        self._next_step = step + 1
+        self._pending.append((step, dict(metrics)))
+
+    def flush(self) -> None:
+        with self._lock:
+            self._drain(final=True)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self._flush_interval)
+            with self._lock:
+                self._drain(final=False)
+
+    def _drain(self, final: bool) -> None:
+        # Must be called with self._lock held.
+        popleft = self._pending.popleft
+        late: List[int] = []
+        while self._pending:
+            step, metrics = popleft()
+            if self._last_sent is not None and step < self._last_sent:
+                late.append(step)
+                continue
+            accumulators = self._steps.setdefault(step, {})
+            for name, value in metrics.items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError) as exc:
+                    if self._on_error is not None:
+                        self._on_error(exc)
+                    continue
+                acc = accumulators.get(name)
+                if acc is None:
+                    accumulators[name] = [value, 1, value, value]
+                else:
+                    acc[0] += value
+                    acc[1] += 1
+                    acc[2] = value
+                    acc[3] = max(acc[3], value)
+
+        if late and self._on_error is not None:
+            self._on_error(
+                ValueError(
+                    f"Dropped metrics of step(s) {sorted(set(late))}: step "
+                    f"{self._last_sent} was already sent, and steps must increase"
+                )
+            )
+
+        if not self._steps:
+            return
+
+        ready = sorted(self._steps)
+        if not final:
+            ready = ready[:-1]
+
+        for step in ready:
+            self._emit(step, self._steps.pop(step))
+            self._last_sent = step
+
+    def _emit(self, step: int, accumulators: Dict[str, List[float]]) -> None:
+        if self._aggregate == "mean":
+            values = {k: acc[0] / acc[1] for k, acc in accumulators.items()}
+        elif self._aggregate == "last":
+            values = {k: acc[2] for k, acc in accumulators.items()}
+        else:
+            values = {k: acc[3] for k, acc in accumulators.items()}
+
+        for sink in self._sinks:
+            try:
+                sink(values, step)
+            except Exception as exc:
+                if self._on_error is not None:
+                    self._on_error(exc)
@@ -0,0 +1,83 @@
+import sys
+import threading
+import traceback
+from typing import Any, Callable, Optional, Tuple
+
+# (tag, level, source, message, unix timestamp)
+LogRecord = Tuple[str, str, str, str, float]
+
+
+class LogClient:
+    """Picklable handle that routes a child process's log lines to the parent.
+
+    Obtained from ``Logger().client()`` in the parent process. Pass it to
+    ``multiprocessing.Process``/``torch.multiprocessing.spawn`` arguments and
+    call ``Logger().connect(client)`` in the child, or use the client directly
+    as a ``DataLoader`` ``worker_init_fn``.
+    """
+
+    def __init__(self, queue: Any, rank: Optional[int] = None) -> None:
+        self.queue = queue
+        self.rank = rank
+
+    def __call__(self, worker_id: int) -> None:
+        from fenn.logging import Logger
+
+        Logger().connect(self, worker=worker_id)
+
+
+def format_tag(
+    rank: Optional[int] = None,
+    worker: Optional[int] = None,
+    pid: Optional[int] = None,
+) -> str:
+    parts = []
+    if rank is not None:
+        parts.append(f"rank {rank}")
+    if worker is not None:
+        parts.append(f"worker {worker}")
+    if not parts and pid is not None:
+        parts.append(f"pid {pid}")
+    return "/".join(parts)
+
+
+class LogListener:
+    """Drains log records sent by child processes on a single thread.
+
+    Every record is handed to ``handle`` in the order it was received, which
+    preserves the order of the records sent by each process. A record that
+    cannot be handled is skipped; the first failure is printed to stderr
+    and the total is kept in ``dropped``.
+    """
+
+    def __init__(self, queue: Any, handle: Callable[[LogRecord], None]) -> None:
+        self._queue = queue
+        self._handle = handle
+        self.dropped = 0
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name="fenn-log-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            try:
+                self._handle(record)
+            except Exception:
+                # A bad record must not stop the records that follow it.
+                self.dropped += 1
+                if self.dropped == 1:
+                    sys.stderr.write(
+                        f"[FENN] Failed to log a record from a child process: {record!r}\n"
+                    )
+                    traceback.print_exc()
@@ -0,0 +1,43 @@
+import time
+from typing import Dict, Hashable, List
+
+
+class RateLimiter:
+    """Samples or throttles events independently for every call site.
+
+    A site passes on its first call and then either every ``every``-th call,
+    at most once per ``interval`` seconds, or both when both are given.
+    Rejected calls are counted so that a summary can be reported later.
+    """
+
+    def __init__(self) -> None:
+        # site -> [calls, last accepted time, suppressed]
+        self._sites: Dict[Hashable, List[float]] = {}
+
+    def allow(self, site: Hashable, every: int = 1, interval: float = 0.0) -> bool:
+        state = self._sites.get(site)
+        if state is None:
+            state = self._sites[site] = [0, float("-inf"), 0]
+
+        calls = state[0]
+        state[0] = calls + 1
+
+        if every > 1 and calls % every:
+            state[2] += 1
+            return False
+
+        if interval > 0:
+            now = time.monotonic()
+            if now - state[1] < interval:
+                state[2] += 1
+                return False
+            state[1] = now
+
+        return True
+
+    def suppressed(self) -> Dict[Hashable, int]:
+        """Returns the number of rejected calls per site, for sites with any."""
+        return {site: int(state[2]) for site, state in self._sites.items() if state[2]}
+
+    def clear(self) -> None:
+        self._sites.clear()
@@ -0,0 +1,108 @@
+import random
+import threading
+import time
+from contextlib import ContextDecorator
+from typing import Any, Dict, List
+
+
+class Histogram:
+    """Count, total and max of a series, plus a bounded reservoir for percentiles.
+
+    Exact statistics are kept for every value; percentiles are computed from a
+    uniform sample of at most ``max_samples`` values, so memory stays bounded
+    for spans that run millions of times.
+    """
+
+    __slots__ = ("count", "total", "max", "_samples", "_max_samples")
+
+    def __init__(self, max_samples: int = 10_000) -> None:
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self._samples: List[int] = []
+        self._max_samples = max_samples
+
+    def add(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if len(self._samples) < self._max_samples:
+            self._samples.append(value)
+        else:
+            i = random.randrange(self.count)
+            if i < self._max_samples:
+                self._samples[i] = value
+
+    def percentile(self, q: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class SpanRecorder:
+    """Collects wall-clock and CPU time histograms per span name."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: Dict[str, List[Histogram]] = {}
+
+    def record(self, name: str, wall_ns: int, cpu_ns: int) -> None:
+        histograms = self._spans.get(name)
+        if histograms is None:
+            with self._lock:
+                histograms = self._spans.setdefault(name, [Histogram(), Histogram()])
+        wall, cpu = histograms
+        wall.add(wall_ns)
+        cpu.add(cpu_ns)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Returns, per span, the count and wall/CPU times in milliseconds."""
+        summary = {}
+        for name, (wall, cpu) in sorted(self._spans.items()):
+            summary[name] = {
+                "count": wall.count,
+                "total_ms": wall.total / 1e6,
+                "p50_ms": wall.percentile(0.50) / 1e6,
+                "p95_ms": wall.percentile(0.95) / 1e6,
+                "max_ms": wall.max / 1e6,
+                "cpu_total_ms": cpu.total / 1e6,
+                "cpu_p50_ms": cpu.percentile(0.50) / 1e6,
+            }
+        return summary
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class Span(ContextDecorator):
+    """Times a block or function and records it under ``name``.
+
+    Usable both as ``with logger.span("forward"):`` and as ``@logger.span("forward")``.
+    A block left by StopIteration (``next`` on an exhausted loader) fetched
+    nothing and is not recorded.
+    """
+
+    def __init__(self, recorder: SpanRecorder, name: str) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._wall = 0
+        self._cpu = 0
+
+    def _recreate_cm(self) -> "Span":
+        # Each decorated call gets its own timer, so recursion and threads are safe.
+        return Span(self._recorder, self._name)
+
+    def __enter__(self) -> "Span":
+        self._cpu = time.process_time_ns()
+        self._wall = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is not None and issubclass(exc_type, (StopIteration, StopAsyncIteration)):
+            return
+        wall = time.perf_counter_ns() - self._wall
+        cpu = time.process_time_ns() - self._cpu
+        self._recorder.record(self._name, wall, cpu)
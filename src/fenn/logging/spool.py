@@ -0,0 +1,239 @@
+import json
+import os
+import secrets
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+RUN_FILE = "run.json"
+QUEUE_FILE = "queue.jsonl"
+CURSOR_FILE = "cursor"
+FINISHED_FILE = "finished"
+# Locked by the session writing the spool, for as long as it runs
+LOCK_FILE = "lock"
+
+
+def _try_lock(f: Any) -> bool:
+    """Takes an exclusive lock on an open file without waiting; False if held."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+class WandbSpool:
+    """Append-only on-disk queue of the wandb calls made by one session.
+
+    ``run.json`` holds the arguments for ``wandb.init`` (including a fixed
+    run id, so that every replay resumes the same run) and ``queue.jsonl``
+    one metrics record per line. Writing never touches the network.
+
+    The spool holds a lock on ``lock`` until it is closed (or its process
+    dies), so that ``fenn sync`` leaves the spool of a running session to
+    its own uploader.
+    """
+
+    def __init__(self, directory: Path, run_info: Dict[str, Any]) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        run_info = {"id": secrets.token_hex(4), **run_info}
+        with open(self._directory / RUN_FILE, "w", encoding="utf-8") as f:
+            json.dump(run_info, f, default=str)
+
+        self._lock_file = open(self._directory / LOCK_FILE, "a")
+        _try_lock(self._lock_file)
+
+        self._lock = threading.Lock()
+        self._file = open(self._directory / QUEUE_FILE, "a", encoding="utf-8")
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def log(self, metrics: Dict[str, float], step: int) -> None:
+        line = json.dumps({"step": step, "metrics": metrics}) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+            self._lock_file.close()
+
+
+class SpoolReplayer:
+    """Uploads the records of a spool directory to wandb.
+
+    The byte offset of the last uploaded record is kept in ``cursor``, so a
+    replay interrupted by a network error continues where it stopped and no
+    record is uploaded twice. The cursor is saved once per upload, after the
+    last record wandb accepted. ``client`` defaults to the ``wandb`` module.
+    """
+
+    def __init__(self, directory: Path, client: Optional[Any] = None) -> None:
+        self._directory = Path(directory)
+        self._client = client
+        self._run: Optional[Any] = None
+
+    @property
+    def finished(self) -> bool:
+        return (self._directory / FINISHED_FILE).exists()
+
+    @property
+    def active(self) -> bool:
+        """Whether the session writing the spool is still running."""
+        lock_file = self._directory / LOCK_FILE
+        if not lock_file.exists():
+            return False
+        with open(lock_file, "a") as f:
+            return not _try_lock(f)
+
+    def pending(self) -> bool:
+        """Whether a finished session left records (or the run end) to upload."""
+        if self.active:
+            return False
+        queue_file = self._directory / QUEUE_FILE
+        size = queue_file.stat().st_size if queue_file.exists() else 0
+        return not self.finished or size > self._read_cursor()
+
+    def upload(self) -> int:
+        """Uploads the records written since the last upload.
+
+        Returns:
+            The number of uploaded records.
+
+        Raises:
+            Exception: Whatever wandb raises, e.g. when there is no network.
+        """
+        if self._run is None:
+            self._run = self._init_run()
+
+        uploaded = 0
+        start = cursor = self._read_cursor()
+        try:
+            for record, end in self._read_records(start):
+                self._run.log(record["metrics"], step=record["step"])
+                cursor = end
+                uploaded += 1
+        finally:
+            # Up to the last record wandb took, even if a later one failed
+            if cursor != start:
+                self._write_cursor(cursor)
+        return uploaded
+
+    def finish(self) -> int:
+        """Uploads the remaining records and closes the wandb run.
+
+        Returns:
+            The number of records uploaded by this call.
+        """
+        uploaded = self.upload()
+        self._run.finish()
+        self._run = None
+        (self._directory / FINISHED_FILE).touch()
+        return uploaded
+
+    def _init_run(self) -> Any:
+        if self._client is None:
+            import wandb
+
+            self._client = wandb
+        with open(self._directory / RUN_FILE, encoding="utf-8") as f:
+            run_info = json.load(f)
+        return self._client.init(resume="allow", **run_info)
+
+    def _read_records(self, cursor: int) -> Iterator[tuple]:
+        queue_file = self._directory / QUEUE_FILE
+        if not queue_file.exists():
+            return
+        with open(queue_file, "rb") as f:
+            f.seek(cursor)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Still being written; picked up by the next upload.
+                    return
+                cursor += len(line)
+                yield json.loads(line), cursor
+
+    def _read_cursor(self) -> int:
+        try:
+            return int((self._directory / CURSOR_FILE).read_text())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _write_cursor(self, cursor: int) -> None:
+        tmp = self._directory / (CURSOR_FILE + ".tmp")
+        tmp.write_text(str(cursor))
+        os.replace(tmp, self._directory / CURSOR_FILE)
+
+
+class SpoolUploader:
+    """Replays a spool to wandb from a background thread while the run is going.
+
+    Upload errors (no network, wandb down, missing key) never reach the
+    training loop: they are reported once through ``on_error`` and the
+    upload is retried every ``interval`` seconds. Whatever is still pending
+    when the session ends can be uploaded later with ``fenn sync``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        interval: float = 30.0,
+        client: Optional[Any] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self._replayer = SpoolReplayer(directory, client=client)
+        self._interval = float(interval)
+        self._on_error = on_error
+        self._error_reported = False
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name="fenn-wandb-uploader", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> bool:
+        """Stops the thread and tries a final upload.
+
+        Returns:
+            True if the whole spool was uploaded and the wandb run finished.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self._replayer.finish()
+            return True
+        except Exception as exc:
+            self._report(exc)
+            return False
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self._replayer.upload()
+            except Exception as exc:
+                self._report(exc)
+
+    def _report(self, exc: Exception) -> None:
+        if self._on_error is not None and not self._error_reported:
+            self._error_reported = True
+            self._on_error(exc)
+
+
+def find_spools(logger_dir: Path) -> List[Path]:
+    """Returns the spool directories under a logger directory."""
+    return sorted(p.parent for p in Path(logger_dir).glob(f"*/*.wandb/{RUN_FILE}"))
@@ -0,0 +1,96 @@
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Deque, Optional
+
+
+class FileWriter:
+    """Appends every line to the log file, opening and closing it each time."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def write(self, line: str) -> None:
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class BufferedFileWriter:
+    """Keeps the log file open and writes queued lines in batches.
+
+    Lines are appended to an in-memory queue and drained by a daemon thread
+    once ``max_lines`` are pending or every ``flush_interval`` seconds,
+    whichever comes first. ``flush()`` and ``close()`` drain the queue
+    synchronously, so no line is lost when the session ends.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_lines: int = 1024,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._path = path
+        self._max_lines = max(1, int(max_lines))
+        self._flush_interval = float(flush_interval)
+
+        self._file = open(path, "a", encoding="utf-8")
+        self._lines: Deque[str] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name="fenn-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        if self._closed:
+            raise ValueError("write to a closed log writer")
+        self._lines.append(line)
+        if len(self._lines) >= self._max_lines:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._drain()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._drain()
+            self._file.close()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            with self._lock:
+                self._drain()
+
+    def _drain(self) -> None:
+        # Must be called with self._lock held.
+        if not self._lines:
+            return
+        batch = []
+        popleft = self._lines.popleft
+        try:
+            while True:
+                batch.append(popleft())
+        except IndexError:
+            pass
+        self._file.write("".join(batch))
+        self._file.flush()
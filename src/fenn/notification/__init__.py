@@ -1,2 +1,18 @@
-from fenn.notification.notifier import Notifier
-from fenn.notification.service import Service
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from fenn._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from fenn.notification.notifier import NotificationResult, Notifier
+    from fenn.notification.service import Service
+
+# Resolved on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "Notifier": "fenn.notification.notifier",
+    "NotificationResult": "fenn.notification.notifier",
+    "Service": "fenn.notification.service",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -1,12 +1,78 @@
-from typing import List, Type, Iterable
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, List, Optional, Tuple, Type, Iterable, TypedDict, Union
+from fenn.notification.outbox import Outbox
 from fenn.notification.service import Service
 
+
+class NotificationResult(TypedDict):
+    """Outcome of a notify call, per service class name."""
+
+    successful: List[str]
+    failed: List[Tuple[str, str]]  # (service, error)
+
+
 class Notifier:
     """Central notification manager that handles multiple notification services."""
 
-    def __init__(self):
-        """Initialize the notifier with an empty list of services."""
+    def __init__(
+        self,
+        deadline: float = 15.0,
+        max_workers: Optional[int] = None,
+        background: bool = False,
+        queue_size: int = 100,
+        coalesce: float = 0.0,
+        outbox: Optional[Union[os.PathLike, str, Outbox]] = None,
+    ):
+        """Initialize the notifier with an empty list of services.
+
+        Args:
+            deadline: Maximum number of seconds notify waits for the services.
+            max_workers: Maximum number of threads the services are called
+                from (default: 32). Threads are only started when needed.
+            background: If True, notify only queues the message and returns;
+                a daemon thread sends the queued messages in order.
+            queue_size: Maximum number of queued messages in background mode.
+                When the queue is full, the oldest message is dropped.
+            coalesce: Seconds the background worker waits after a message
+                for more to arrive; the messages received meanwhile are sent
+                as one digest per service, split to fit its length limit.
+            outbox: SQLite file (or Outbox) the messages are stored in until
+                delivered. Failed messages are retried from a background
+                thread with exponential backoff, including those left by a
+                previous process.
+
+        Raises:
+            ValueError: If coalesce is set without background mode.
+        """
+        if coalesce and not background:
+            raise ValueError("coalesce requires background=True")
+
         self._services: List[Service] = []
+        self._deadline = deadline
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        self._background = background
+        self._coalesce = coalesce
+        self._queue: Deque[str] = deque(maxlen=queue_size)
+        self._queue_changed = threading.Condition()
+        self._in_flight = 0
+        self._dropped = 0
+        self._stopping = False
+        self._flushing = 0
+        self._worker: Optional[threading.Thread] = None
+
+        self._outbox: Optional[Outbox] = None
+        self._retry_changed = threading.Condition()
+        self._retrier: Optional[threading.Thread] = None
+        self._retry_wanted = False
+        self._closed = False
+        if outbox is not None:
+            self.open_outbox(outbox)
 
     def add_services(
         self,
@@ -29,6 +95,9 @@ class Notifier:
             service: A service implementing the Service interface.
         """
         self._services.append(service())
+        if self._outbox is not None:
+            # Messages a previous run could not deliver to this service
+            self._wake_retrier()
 
     def remove_service(self, service: Type[Service]) -> None:
         """Remove a notification service.
@@ -45,26 +114,159 @@ class Notifier:
             ValueError(f"Service {service.__class__.__name__} not found in services list")
             raise
 
-    def notify(self, message: str) -> None:
-        """Send notification to all registered services.
+    def notify(
+        self, message: str, deadline: Optional[float] = None
+    ) -> Optional[NotificationResult]:
+        """Send notification to all registered services, concurrently.
+
+        In background mode the message is only queued, and None is returned.
+
+        Every service is called from its own pool thread, so the call takes
+        as long as the slowest service rather than the sum of all of them,
+        and never longer than the deadline. A service that did not answer
+        in time is reported as failed; its request still completes in the
+        background.
 
         Args:
             message: The message to send.
+            deadline: Seconds to wait for the services (default: the
+                notifier's deadline).
+
+        Returns:
+            The names of the services that sent the message, and the
+            (name, error) pairs of those that failed or timed out.
         """
+        if self._background:
+            self._enqueue(message)
+            return None
+        return self._send([message], deadline)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the queued messages are sent (background mode).
+
+        Args:
+            timeout: Maximum number of seconds to wait (default: no limit).
+
+        Returns:
+            True if every queued message was sent.
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._queue_changed:
+            # Sends the pending digest without waiting for the coalescing window
+            self._flushing += 1
+            self._queue_changed.notify_all()
+            try:
+                while self._queue or self._in_flight:
+                    remaining = None if end is None else end - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._queue_changed.wait(remaining)
+            finally:
+                self._flushing -= 1
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of queued messages not sent yet, including those being sent."""
+        with self._queue_changed:
+            return len(self._queue) + self._in_flight
+
+    @property
+    def dropped(self) -> int:
+        """Number of queued messages dropped because the queue was full."""
+        return self._dropped
+
+    def flush_outbox(self, timeout: Optional[float] = None) -> int:
+        """Send the outbox messages that are due now, in one pass.
+
+        Used at the end of a run, since the retry thread does not survive
+        the process.
+
+        Args:
+            timeout: Maximum number of seconds to wait (default: no limit).
+
+        Returns:
+            The number of messages still in the outbox.
+        """
+        outbox = self._outbox
+        if outbox is None:
+            return 0
+        future = self._get_pool().submit(self._retry_due, outbox, list(self._services))
+        wait([future], timeout=timeout)
+        return outbox.pending()
+
+    @property
+    def outbox(self) -> Optional[Outbox]:
+        return self._outbox
+
+    def open_outbox(self, outbox: Union[os.PathLike, str, Outbox]) -> None:
+        """Store messages in a SQLite outbox until they are delivered.
+
+        Messages left in it by a previous process are sent again.
+
+        Args:
+            outbox: Path of the SQLite file, or an Outbox.
+        """
+        if self._outbox is not None:
+            if not isinstance(outbox, Outbox) and os.fspath(outbox) == self._outbox.path:
+                return
+            self._outbox.close()
+        self._outbox = outbox if isinstance(outbox, Outbox) else Outbox(outbox)
+        self._wake_retrier()
+
+    def _send(
+        self, messages: List[str], deadline: Optional[float] = None
+    ) -> NotificationResult:
+        result: NotificationResult = {"successful": [], "failed": []}
         if not self._services:
-            return
+            return result
 
-        successful_services = []
-        failed_services = []
+        if deadline is None:
+            deadline = self._deadline
 
+        outbox = self._outbox
+        if outbox is not None:
+            # Stored before sending, so nothing is lost if the process dies
+            ids = outbox.add(self.get_services(), messages)
+
+        pool = self._get_pool()
+        futures = []
         for service in self._services:
-            try:
-                service.send_notification(message)
-                successful_services.append(service.__class__.__name__)
-                #logger.info(f"Successfully sent notification via {service.__class__.__name__}")
-            except Exception as e:
-                failed_services.append((service.__class__.__name__, str(e)))
-                #logger.error(f"Failed to send notification via {service.__class__.__name__}: {e}")
+            name = service.__class__.__name__
+            if outbox is None:
+                future = pool.submit(service.send_digest, messages)
+            else:
+                # Settles its rows itself, also after the deadline
+                future = pool.submit(self._deliver, outbox, service, messages, ids[name])
+                future.add_done_callback(
+                    lambda f, ids=ids[name]: self._settle_cancelled(outbox, ids, f)
+                )
+            futures.append((name, future))
+        wait([future for _, future in futures], timeout=deadline)
+
+        for name, future in futures:
+            if not future.done():
+                future.cancel()
+                result["failed"].append((name, f"No answer within {deadline}s"))
+            elif future.exception() is not None:
+                result["failed"].append((name, str(future.exception())))
+            else:
+                result["successful"].append(name)
+
+        return result
+
+    async def anotify(self, message: str) -> NotificationResult:
+        """Awaitable notify; the requests run in the loop's default executor.
+
+        Args:
+            message: The message to send.
+
+        Returns:
+            The result of notify.
+        """
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.notify, message)
 
     def get_services(self) -> List[str]:
         """Get list of registered service names.
@@ -75,5 +277,192 @@ class Notifier:
         return [service.__class__.__name__ for service in self._services]
 
     def clear_services(self) -> None:
-        """Remove all registered services."""
-        self._services.clear()
\ No newline at end of file
+        """Remove all registered services and close their HTTP sessions."""
+        for service in self._services:
+            service.close()
+        self._services.clear()
+
+    def close(self) -> None:
+        """Close the services' HTTP sessions and shut down the thread pool.
+
+        Both are created again by the next notify. In background mode, the
+        worker thread stops once the queue is empty; call flush first to
+        wait for it. The outbox retry thread stops too; undelivered
+        messages stay in the outbox for the next run.
+        """
+        with self._queue_changed:
+            self._stopping = True
+            self._queue_changed.notify_all()
+        with self._retry_changed:
+            self._closed = True
+            self._retry_changed.notify_all()
+        for service in self._services:
+            service.close()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers or 32,
+                thread_name_prefix="fenn-notify",
+            )
+        return self._pool
+
+    def _enqueue(self, message: str) -> None:
+        with self._queue_changed:
+            if len(self._queue) == self._queue.maxlen:
+                # deque(maxlen=...) drops the oldest message on append
+                self._dropped += 1
+            self._queue.append(message)
+            self._stopping = False
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="fenn-notifier", daemon=True
+                )
+                self._worker.start()
+            self._queue_changed.notify_all()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._queue_changed:
+                while not self._queue and not self._stopping:
+                    self._queue_changed.wait()
+                if not self._queue:
+                    self._worker = None
+                    return
+                if self._coalesce:
+                    window_end = time.monotonic() + self._coalesce
+                    while not self._stopping and not self._flushing:
+                        remaining = window_end - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._queue_changed.wait(remaining)
+                    messages = list(self._queue)
+                    self._queue.clear()
+                else:
+                    messages = [self._queue.popleft()]
+                self._in_flight += len(messages)
+
+            try:
+                result = self._send(messages)
+            except Exception as e:
+                result = {"successful": [], "failed": [("Notifier", str(e))]}
+            finally:
+                with self._queue_changed:
+                    self._in_flight -= len(messages)
+                    self._queue_changed.notify_all()
+
+            self._report_failures(result)
+
+    def _deliver(
+        self, outbox: Outbox, service: Service, messages: List[str], ids: List[int]
+    ) -> None:
+        """Sends a digest message by message, settling the rows of each one.
+
+        Raises:
+            Exception: The first error, once every message was attempted.
+        """
+        error: Optional[Exception] = None
+        for group in service.digest_groups(messages):
+            group_ids = [ids[i] for i in group]
+            try:
+                (chunk,) = service.digest([messages[i] for i in group])
+                service.send_notification(chunk)
+            except Exception as e:
+                # Only the undelivered part of the digest is sent again
+                self._retry_failed(outbox, group_ids, str(e))
+                error = error or e
+            else:
+                outbox.sent(group_ids)
+        if error is not None:
+            self._wake_retrier()
+            raise error
+
+    def _settle_cancelled(self, outbox: Outbox, ids: List[int], future: Future) -> None:
+        # Cancelled before it started: nothing was sent
+        if future.cancelled():
+            self._retry_failed(outbox, ids, "Cancelled")
+            self._wake_retrier()
+
+    def _retry_failed(self, outbox: Outbox, ids: List[int], error: str) -> None:
+        dead = outbox.failed(ids, error)
+        if dead:
+            from fenn.logging import Logger
+
+            Logger().system_warning(
+                f"{dead} notification(s) given up after {outbox.max_attempts} "
+                f"attempts: {error}"
+            )
+
+    def _wake_retrier(self) -> None:
+        with self._retry_changed:
+            self._closed = False
+            self._retry_wanted = True
+            if self._retrier is None:
+                self._retrier = threading.Thread(
+                    target=self._run_retrier, name="fenn-outbox", daemon=True
+                )
+                self._retrier.start()
+            self._retry_changed.notify_all()
+
+    def _run_retrier(self) -> None:
+        while True:
+            with self._retry_changed:
+                self._retry_wanted = False
+            outbox = self._outbox
+            services = list(self._services)
+            names = [service.__class__.__name__ for service in services]
+
+            if outbox is not None and not self._closed:
+                try:
+                    self._retry_due(outbox, services)
+                except Exception as e:
+                    # e.g. the outbox file became unreadable; stop retrying
+                    self._report_failures({"successful": [], "failed": [("Outbox", str(e))]})
+                    outbox = None
+
+            with self._retry_changed:
+                next_attempt = None
+                if outbox is not None and outbox is self._outbox and not self._closed:
+                    next_attempt = outbox.next_attempt(names)
+                if self._retry_wanted:
+                    # Woken while sending: new failures, services or outbox
+                    continue
+                if next_attempt is None:
+                    self._retrier = None
+                    return
+                self._retry_changed.wait(max(0.0, next_attempt - time.time()))
+
+    def _retry_due(self, outbox: Outbox, services: List[Service]) -> None:
+        due: Dict[str, List[Tuple[int, str]]] = {}
+        names = [service.__class__.__name__ for service in services]
+        for row_id, name, message in outbox.claim(names):
+            due.setdefault(name, []).append((row_id, message))
+
+        for service in services:
+            rows = due.pop(service.__class__.__name__, None)
+            if not rows:
+                continue
+            # Messages piled up during an outage go out as one digest
+            try:
+                self._deliver(
+                    outbox,
+                    service,
+                    [message for _, message in rows],
+                    [row_id for row_id, _ in rows],
+                )
+            except Exception:
+                # Already rescheduled by _deliver
+                pass
+
+    @staticmethod
+    def _report_failures(result: NotificationResult) -> None:
+        # Nobody waits for the result of a background send, so failures are logged.
+        if not result["failed"]:
+            return
+        from fenn.logging import Logger
+
+        for name, error in result["failed"]:
+            Logger().system_warning(f"Notification via {name} failed: {error}")
@@ -0,0 +1,234 @@
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+OUTBOX_FILENAME = ".fenn_outbox.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    service TEXT NOT NULL,
+    message TEXT NOT NULL,
+    created REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    last_error TEXT,
+    dead INTEGER NOT NULL DEFAULT 0,
+    owner INTEGER,
+    host TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox(dead, next_attempt);
+"""
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill would terminate the process; rely on the lease instead
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def backoff(attempt: int, base: float, cap: float) -> float:
+    """Delay before retry number ``attempt`` (from 1): exponential, with jitter.
+
+    Half of the delay is random, so that the runs of a sweep which lost the
+    network together do not all retry at the same moment.
+    """
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class Outbox:
+    """SQLite-backed queue of the notifications that were not delivered yet.
+
+    A message is stored once per service before it is sent, and deleted
+    when the service accepted it. A failed message is retried later, with
+    exponential backoff, until ``max_attempts`` is reached; it is then kept
+    as dead for inspection.
+
+    Rows being sent are leased to the sending process (its host and pid)
+    for ``lease`` seconds, so that several processes sharing the file do
+    not send the same message twice. The rows of a process of this host
+    that is no longer running are due at once, so a run started after a
+    crash sends them without waiting for the lease to expire. Leases held
+    on other hosts (a logger dir on NFS) are only taken over once expired,
+    since their pids cannot be checked from here.
+    """
+
+    def __init__(
+        self,
+        path: os.PathLike,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        max_attempts: int = 10,
+        lease: float = 60.0,
+    ) -> None:
+        self._path = os.path.abspath(os.fspath(path))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.lease = lease
+
+        # Shared by the notify threads and the retry worker
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, timeout=30, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")]
+        if "host" not in columns:
+            # Outbox written before leases recorded the host
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN host TEXT")
+        self._conn.commit()
+        self._closed = False
+        self._host = socket.gethostname()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def add(self, services: Sequence[str], messages: Sequence[str]) -> Dict[str, List[int]]:
+        """Stores the messages for every service, leased to the caller.
+
+        Returns:
+            The ids of the stored rows, per service.
+        """
+        now = time.time()
+        ids: Dict[str, List[int]] = {}
+        with self._lock, self._conn:
+            for service in services:
+                ids[service] = [
+                    self._conn.execute(
+                        "INSERT INTO outbox (service, message, created, next_attempt, owner,"
+                        " host) VALUES (?, ?, ?, ?, ?, ?)",
+                        (service, message, now, now + self.lease, os.getpid(), self._host),
+                    ).lastrowid
+                    for message in messages
+                ]
+        return ids
+
+    def claim(self, services: Sequence[str]) -> List[Tuple[int, str, str]]:
+        """Leases the messages due for the given services.
+
+        Returns:
+            The (id, service, message) rows, oldest first.
+        """
+        if not services:
+            return []
+        now = time.time()
+        marks = ", ".join("?" * len(services))
+        with self._lock, self._conn:
+            if self._closed:
+                # Closed under a retry thread: nothing is due any more
+                return []
+            orphans = self._orphan_owners(services)
+            owner_marks = ", ".join("?" * len(orphans))
+            rows = self._conn.execute(
+                f"SELECT id, service, message FROM outbox WHERE dead = 0"
+                f" AND (next_attempt <= ? OR (host = ? AND owner IN ({owner_marks})))"
+                f" AND service IN ({marks}) ORDER BY id",
+                (now, self._host, *orphans, *services),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE outbox SET next_attempt = ?, owner = ?, host = ? WHERE id = ?",
+                [(now + self.lease, os.getpid(), self._host, row[0]) for row in rows],
+            )
+        return [tuple(row) for row in rows]
+
+    def sent(self, ids: Sequence[int]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM outbox WHERE id = ?", [(i,) for i in ids]
+                )
+
+    def failed(self, ids: Sequence[int], error: str) -> int:
+        """Schedules the next attempt of the messages, or gives up on them.
+
+        Returns:
+            The number of messages that reached max_attempts.
+        """
+        now = time.time()
+        dead = 0
+        with self._lock:
+            if self._closed:
+                return 0
+            with self._conn:
+                for row_id in ids:
+                    row = self._conn.execute(
+                        "SELECT attempts FROM outbox WHERE id = ?", (row_id,)
+                    ).fetchone()
+                    if row is None:
+                        continue
+                    attempts = row[0] + 1
+                    is_dead = attempts >= self.max_attempts
+                    dead += is_dead
+                    self._conn.execute(
+                        "UPDATE outbox SET attempts = ?, last_error = ?, next_attempt = ?,"
+                        " dead = ?, owner = NULL, host = NULL WHERE id = ?",
+                        (
+                            attempts,
+                            error,
+                            now + backoff(attempts, self.base_delay, self.max_delay),
+                            int(is_dead),
+                            row_id,
+                        ),
+                    )
+        return dead
+
+    def next_attempt(self, services: Sequence[str]) -> Optional[float]:
+        """Time (``time.time()``) of the next retry for these services, if any."""
+        if not services:
+            return None
+        marks = ", ".join("?" * len(services))
+        with self._lock:
+            if self._closed:
+                return None
+            if self._orphan_owners(services):
+                return time.time()
+            (value,) = self._conn.execute(
+                f"SELECT MIN(next_attempt) FROM outbox WHERE dead = 0"
+                f" AND service IN ({marks})",
+                tuple(services),
+            ).fetchone()
+        return value
+
+    def pending(self) -> int:
+        """Number of messages not delivered yet, dead ones excluded."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE dead = 0"
+            ).fetchone()[0]
+
+    def dead(self) -> List[Tuple[str, str, str]]:
+        """The (service, message, last error) of the messages given up on."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT service, message, last_error FROM outbox WHERE dead = 1 ORDER BY id"
+            ).fetchall()
+
+    def _orphan_owners(self, services: Sequence[str]) -> List[int]:
+        # Processes of this host holding a lease on these services' rows that
+        # are gone; a pid of another host says nothing about its process here
+        marks = ", ".join("?" * len(services))
+        owners = self._conn.execute(
+            f"SELECT DISTINCT owner FROM outbox WHERE dead = 0 AND owner IS NOT NULL"
+            f" AND host = ? AND owner != ? AND next_attempt > ? AND service IN ({marks})",
+            (self._host, os.getpid(), time.time(), *services),
+        ).fetchall()
+        return [owner for (owner,) in owners if not _process_alive(owner)]
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._conn.close()
@@ -0,0 +1,100 @@
+import email.utils
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` sends per second, bursts of ``burst``.
+
+    A 429 answer pauses the whole bucket with ``defer``, so every thread
+    sending to the same channel waits for the Retry-After delay, not only
+    the one that got the 429.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Takes a token, sleeping until one is available.
+
+        Returns:
+            The number of seconds waited.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def defer(self, seconds: float) -> None:
+        """Hands out no token for the next ``seconds``, and empties the bucket."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+
+# One bucket per channel for the whole process, so that every Notifier and
+# thread of the process shares the channel's limit. Buckets are not shared
+# between processes: the runs of a process-pool sweep each get the full
+# budget, and rely on the 429 retries once they exceed it together.
+_buckets: Dict[Hashable, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(key: Hashable, rate: float, burst: int = 1) -> TokenBucket:
+    """Returns the process-wide bucket of a channel, created on first use."""
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+
+def retry_after(response: Any) -> Optional[float]:
+    """Seconds to wait before retrying a 429 response, if the server said so.
+
+    Reads the ``Retry-After`` header (seconds or an HTTP date), then the
+    ``retry_after`` field Discord and Telegram put in the JSON body.
+    """
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            date = None
+        if date is not None:
+            return max(0.0, date.timestamp() - time.time())
+
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    if not isinstance(body, dict):
+        return None
+    value = body.get("retry_after", (body.get("parameters") or {}).get("retry_after"))
+    try:
+        return None if value is None else max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
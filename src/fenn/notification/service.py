@@ -1,12 +1,137 @@
+import threading
+import time
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from fenn.notification.ratelimit import bucket_for, retry_after
 from fenn.secrets.keystore import KeyStore
 
+if TYPE_CHECKING:
+    import requests
+
 class Service(ABC):
     """Abstract base class for notification services."""
 
+    # Keep-alive connections kept open per host by the service's session
+    pool_size: int = 4
+
+    # Sends per second allowed per channel (None: no limit), and burst size
+    rate: Optional[float] = None
+    burst: int = 1
+    # Longest message the service accepts (None: no limit)
+    max_message_length: Optional[int] = None
+    # Retries of a request answered with 429 Too Many Requests
+    max_retries: int = 3
+    # Wait before a retry when the 429 answer does not say how long
+    default_retry_after: float = 1.0
+
+    _session_lock = threading.Lock()
+
     def __init__(self):
         self._keystore = KeyStore()
 
+    @property
+    def session(self) -> "requests.Session":
+        """The HTTP session of this service, created on first use.
+
+        Reusing one session keeps the connection to the webhook alive, so
+        only the first message pays for the TCP and TLS handshakes.
+        """
+        # getattr: subclasses (and tests) may bypass __init__
+        session: Optional["requests.Session"] = getattr(self, "_session", None)
+        if session is None:
+            with self._session_lock:
+                session = getattr(self, "_session", None)
+                if session is None:
+                    session = self._session = self._create_session()
+        return session
+
+    def close(self) -> None:
+        """Close the HTTP session; a new one is created if the service is used again."""
+        session = getattr(self, "_session", None)
+        if session is not None:
+            self._session = None
+            session.close()
+
+    def _create_session(self) -> "requests.Session":
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def digest(self, messages: List[str]) -> List[str]:
+        """Merge messages into as few messages as the length limit allows.
+
+        Messages are joined with blank lines; a message longer than
+        ``max_message_length`` on its own is truncated.
+        """
+        return [
+            "\n\n".join(self._fit(messages[i]) for i in group)
+            for group in self.digest_groups(messages)
+        ]
+
+    def digest_groups(self, messages: List[str]) -> List[List[int]]:
+        """Indices of the messages merged into each message of ``digest``."""
+        limit = self.max_message_length
+        groups: List[List[int]] = []
+        length = 0
+        for i, message in enumerate(messages):
+            size = len(self._fit(message))
+            if groups and (limit is None or length + 2 + size <= limit):
+                groups[-1].append(i)
+                length += 2 + size
+            else:
+                groups.append([i])
+                length = size
+        return groups
+
+    def _fit(self, message: str) -> str:
+        limit = self.max_message_length
+        if limit is not None and len(message) > limit:
+            return message[: limit - 1] + "…"
+        return message
+
+    def send_digest(self, messages: List[str]) -> None:
+        """Send several messages, merged by ``digest``."""
+        for chunk in self.digest(messages):
+            self.send_notification(chunk)
+
+    def _post(self, url: str, payload: Dict[str, Any]) -> "requests.Response":
+        """POST a JSON payload, within the rate limit of the channel.
+
+        The limit is enforced per process. A 429 answer pauses the channel
+        for its Retry-After delay and the request is retried, up to
+        ``max_retries`` times.
+
+        Raises:
+            requests.exceptions.HTTPError: If the final answer is an error.
+        """
+        bucket = None
+        if self.rate is not None:
+            bucket = bucket_for((type(self).__name__, url), self.rate, self.burst)
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            response = self.session.post(url, json=payload, timeout=10)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                break
+            attempt += 1
+            delay = retry_after(response)
+            if delay is None:
+                delay = self.default_retry_after
+            if bucket is not None:
+                bucket.defer(delay)
+            else:
+                time.sleep(delay)
+        response.raise_for_status()
+        return response
+
     @abstractmethod
     def send_notification(self, message: str) -> None:
         """Send a notification message.
@@ -1,3 +1,20 @@
-from fenn.notification.services.discord import Discord
-from fenn.notification.services.slack import Slack
-from fenn.notification.services.telegram import Telegram
+from typing import TYPE_CHECKING
+
+from fenn._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from fenn.notification.services.discord import Discord
+    from fenn.notification.services.slack import Slack
+    from fenn.notification.services.telegram import Telegram
+
+# Resolved on first access (PEP 562), so that requests is only imported
+# once a service is actually used.
+_LAZY_ATTRIBUTES = {
+    "Discord": "fenn.notification.services.discord",
+    "Slack": "fenn.notification.services.slack",
+    "Telegram": "fenn.notification.services.telegram",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
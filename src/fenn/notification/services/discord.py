@@ -5,6 +5,11 @@ from fenn.notification.service import Service
 class Discord(Service):
     """Discord notification service using webhooks."""
 
+    # Webhooks accept 5 requests per 2 seconds, and 2000 characters
+    rate = 2.5
+    burst = 5
+    max_message_length = 2000
+
     def __init__(self):
         """Initialize Discord service.
         """
@@ -27,7 +32,6 @@ class Discord(Service):
         }
 
         try:
-            result = requests.post(self._discord_webhook_url, json=data, timeout=10)
-            result.raise_for_status()
+            self._post(self._discord_webhook_url, data)
         except requests.exceptions.RequestException as err:
             raise requests.exceptions.RequestException(f"Failed to send Discord notification: {err}")
\ No newline at end of file
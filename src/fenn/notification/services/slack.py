@@ -6,6 +6,11 @@ from fenn.notification.service import Service
 class Slack(Service):
     """Slack notification service using webhooks."""
 
+    # Incoming webhooks accept about one message per second
+    rate = 1.0
+    burst = 1
+    max_message_length = 40000
+
     def __init__(self):
         """Initialize Slack service."""
         super().__init__()
@@ -23,8 +28,7 @@ class Slack(Service):
         data = {"text": message}
 
         try:
-            result = requests.post(self._slack_webhook_url, json=data, timeout=10)
-            result.raise_for_status()
+            self._post(self._slack_webhook_url, data)
         except requests.exceptions.RequestException as err:
             raise requests.exceptions.RequestException(
                 f"Failed to send Slack notification: {err}"
@@ -5,6 +5,11 @@ from typing import Literal
 class Telegram(Service):
     """Telegram notification service using webhooks."""
 
+    # Bots may send about one message per second to a chat, of 4096 characters
+    rate = 1.0
+    burst = 1
+    max_message_length = 4096
+
     def __init__(
         self,
         parse_mode: Literal["Markdown", "HTML"] | None=None
@@ -44,7 +49,6 @@ class Telegram(Service):
             data["parse_mode"] = self._parse_mode
 
         try:
-            result = requests.post(self._telegram_api_url, json=data, timeout=10)
-            result.raise_for_status()
+            self._post(self._telegram_api_url, data)
         except requests.exceptions.RequestException as err:
             raise requests.exceptions.RequestException(f"Failed to send Telegram notification: {err}")
\ No newline at end of file
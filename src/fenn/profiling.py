@@ -0,0 +1,114 @@
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+# "1" records the startup phases of FENN.run, "exit" also skips the entrypoint.
+PROFILE_ENV = "FENN_PROFILE_STARTUP"
+# time.time() at which `fenn profile-startup` launched the script.
+ORIGIN_ENV = "FENN_PROFILE_STARTUP_T0"
+# File the log path of the profiled session is written to, for the CLI.
+LOG_PATH_ENV = "FENN_PROFILE_STARTUP_LOG"
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+def enabled() -> bool:
+    return os.environ.get(PROFILE_ENV, "") not in ("", "0")
+
+
+def skip_entrypoint() -> bool:
+    return os.environ.get(PROFILE_ENV, "") == "exit"
+
+
+class StartupProfiler:
+    """Wall-clock duration, in milliseconds, of consecutive startup phases.
+
+    When launched by ``fenn profile-startup``, the time between the launch
+    and the creation of the profiler is recorded as a first phase, which
+    covers the interpreter startup and the imports of the script.
+    """
+
+    def __init__(self) -> None:
+        self._phases: Dict[str, float] = {}
+        origin = os.environ.get(ORIGIN_ENV)
+        if origin:
+            self._phases["interpreter and imports"] = (time.time() - float(origin)) * 1000
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Ends the current phase and names it."""
+        now = time.perf_counter()
+        self._phases[phase] = (now - self._last) * 1000
+        self._last = now
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        return dict(self._phases)
+
+
+class ImportNode:
+    """One module of a ``-X importtime`` report, with its own and total time in ms."""
+
+    __slots__ = ("name", "self_ms", "total_ms", "children")
+
+    def __init__(self, name: str, self_ms: float, total_ms: float) -> None:
+        self.name = name
+        self.self_ms = self_ms
+        self.total_ms = total_ms
+        self.children: List["ImportNode"] = []
+
+
+def parse_importtime(lines: List[str]) -> List[ImportNode]:
+    """Builds the import tree from ``python -X importtime`` stderr lines.
+
+    CPython reports a module after the modules it imported, one indentation
+    level deeper, so children are collected until their parent shows up.
+
+    Returns:
+        The top-level imports, in import order.
+    """
+    pending: List[tuple] = []  # (depth, node)
+    for line in lines:
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, total_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        node = ImportNode(name, int(self_us) / 1000, int(total_us) / 1000)
+        while pending and pending[-1][0] > depth:
+            node.children.append(pending.pop()[1])
+        node.children.reverse()
+        pending.append((depth, node))
+    return [node for _, node in pending]
+
+
+def format_import_tree(
+    roots: List[ImportNode], min_ms: float = 5.0, max_depth: int = 3
+) -> List[str]:
+    """Formats the slowest branches of an import tree, slowest first."""
+    lines: List[str] = []
+
+    def visit(node: ImportNode, depth: int) -> None:
+        lines.append(
+            f"{'  ' * depth}{node.name}: {node.total_ms:.1f} ms "
+            f"(self {node.self_ms:.1f} ms)"
+        )
+        if depth + 1 >= max_depth:
+            return
+        for child in sorted(node.children, key=lambda n: n.total_ms, reverse=True):
+            if child.total_ms >= min_ms:
+                visit(child, depth + 1)
+
+    for root in sorted(roots, key=lambda n: n.total_ms, reverse=True):
+        if root.total_ms >= min_ms:
+            visit(root, 0)
+    return lines
+
+
+def write_log_path(path: Optional[os.PathLike]) -> None:
+    """Tells `fenn profile-startup` which session log to append the import tree to."""
+    target = os.environ.get(LOG_PATH_ENV)
+    if target and path is not None:
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(os.fspath(path))
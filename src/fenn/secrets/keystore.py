@@ -1,8 +1,17 @@
 import os
+from typing import Dict, Optional, Tuple
 
 from dotenv import dotenv_values
 
 class KeyStore:
+    """Singleton store of secrets read from a .env file and the environment.
+
+    The .env file is parsed once and cached. Instantiating ``KeyStore()``
+    again only stats the file and re-parses it when its mtime or size
+    changed, so key lookups are plain dictionary hits. The file defaults to
+    ``.env`` in the working directory, or ``$FENN_ENV_FILE`` when set.
+    """
+
     _instance = None
 
     def __new__(cls, *args, **kwargs):
@@ -10,10 +19,36 @@ class KeyStore:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        self._keys = dotenv_values(".env")
+    def __init__(self, env_file: Optional[str] = None):
+        if not hasattr(self, "_initialized"):
+            self._env_file: str = os.environ.get("FENN_ENV_FILE", ".env")
+            self._signature: Optional[Tuple[str, int, int]] = None
+            self._file_keys: Dict[str, Optional[str]] = {}
+            self._overrides: Dict[str, str] = {}
+            self._keys: Dict[str, Optional[str]] = {}
+            self._initialized = True
+
+        if env_file is not None:
+            self._env_file = env_file
+
+        self._refresh()
+
+    @property
+    def env_file(self) -> str:
+        return self._env_file
+
+    @env_file.setter
+    def env_file(self, env_file: str) -> None:
+        self._env_file = env_file
+        self._refresh()
+
+    def reload(self) -> None:
+        """Re-reads the .env file even if it did not change."""
+        self._signature = None
+        self._refresh()
 
     def set_key(self, service:str, key:str):
+        self._overrides[service] = key
         self._keys[service] = key
 
     def get_key(self, service:str) -> str:
@@ -24,4 +59,19 @@ class KeyStore:
         if service in self._keys.keys():
             return self._keys[service]
         else:
-            raise KeyError(f"Key {service} not found in .env or environment")
\ No newline at end of file
+            raise KeyError(f"Key {service} not found in .env or environment")
+
+    def _refresh(self) -> None:
+        path = os.path.abspath(self._env_file)
+        try:
+            stat = os.stat(path)
+            signature = (path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = (path, -1, -1)
+
+        if signature == self._signature:
+            return
+
+        self._file_keys = dotenv_values(path) if signature[1] != -1 else {}
+        self._keys = {**self._file_keys, **self._overrides}
+        self._signature = signature
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+VALUE_FILE = "value.pkl"
+
+# Returned by StageCache.get on a miss, since None is a valid stage output.
+MISS = object()
+
+
+class _Pickler(pickle.Pickler):
+    """Pickles a stage output, saving every NumPy array as its own .npy file."""
+
+    def __init__(self, file: Any, directory: Path) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._directory = directory
+        self._arrays = 0
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, str]]:
+        np = sys.modules.get("numpy")
+        if np is None or not isinstance(obj, np.ndarray) or obj.dtype.hasobject:
+            return None
+        name = f"{self._arrays}.npy"
+        self._arrays += 1
+        np.save(self._directory / name, obj, allow_pickle=False)
+        return ("npy", name)
+
+
+class _Unpickler(pickle.Unpickler):
+    """Loads a stage output, memory-mapping its arrays read-only."""
+
+    def __init__(self, file: Any, directory: Path) -> None:
+        super().__init__(file)
+        self._directory = directory
+
+    def persistent_load(self, pid: Tuple[str, str]) -> Any:
+        import numpy as np
+
+        kind, name = pid
+        if kind != "npy":
+            raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+        return np.load(self._directory / name, mmap_mode="r")
+
+
+class StageCache:
+    """Content-addressed on-disk cache of stage outputs.
+
+    Every entry is a directory named after its key, holding the pickled
+    output and one ``.npy`` file per NumPy array in it. Arrays are loaded
+    back with ``mmap_mode="r"``, so a cached dataset is paged in lazily and
+    shared between processes. Entries are written to a temporary directory
+    and renamed into place, so concurrent runs never see a partial entry.
+    When the cache grows over ``max_bytes``, the least recently used
+    entries are deleted.
+    """
+
+    def __init__(self, directory: os.PathLike, max_bytes: int) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = int(max_bytes)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def get(self, key: str) -> Any:
+        """Returns the cached output of ``key``, or MISS.
+
+        An entry that cannot be loaded (truncated pickle, missing .npy, a
+        class that moved) is deleted and reported as a miss.
+        """
+        entry = self._directory / key
+        try:
+            with open(entry / VALUE_FILE, "rb") as f:
+                value = _Unpickler(f, entry).load()
+        except FileNotFoundError:
+            if entry.exists():
+                shutil.rmtree(entry, ignore_errors=True)
+            return MISS
+        except (pickle.UnpicklingError, EOFError, OSError, ValueError, AttributeError, ImportError):
+            shutil.rmtree(entry, ignore_errors=True)
+            return MISS
+        # The directory mtime is the last use, for the LRU eviction.
+        os.utime(entry)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        entry = self._directory / key
+        tmp = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self._directory))
+        try:
+            with open(tmp / VALUE_FILE, "wb") as f:
+                _Pickler(f, tmp).dump(value)
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                # Written meanwhile by another process, with the same content.
+                if not entry.exists():
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Deletes the least recently used entries until the cache fits.
+
+        Returns:
+            The number of deleted entries.
+        """
+        entries = []
+        total = 0
+        for entry in self._directory.iterdir():
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((entry.stat().st_mtime_ns, size, entry))
+            total += size
+
+        deleted = 0
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self._max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            deleted += 1
+        return deleted
+
+    def clear(self) -> None:
+        shutil.rmtree(self._directory, ignore_errors=True)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+
+def source_hash(fn: Callable) -> str:
+    """Hashes the source of a function, or its bytecode when there is no source."""
+    import inspect
+
+    try:
+        code = inspect.getsource(fn).encode()
+    except (OSError, TypeError):
+        code = fn.__code__.co_code
+    return hashlib.sha256(code).hexdigest()
+
+
+def config_subset(args: Mapping[str, Any], depends_on: Sequence[str]) -> Dict[str, Any]:
+    """Returns the values of the ``depends_on`` key paths (``a.b`` or ``a/b``).
+
+    Raises:
+        KeyError: If a path is not in the configuration, since a misspelled
+            dependency would silently serve stale outputs.
+    """
+    subset = {}
+    for path in depends_on:
+        node: Any = args
+        for part in path.replace("/", ".").split("."):
+            if not isinstance(node, Mapping) or part not in node:
+                raise KeyError(f"Stage dependency {path!r} is not in the configuration")
+            node = node[part]
+        subset[path] = _plain(node)
+    return subset
+
+
+def canonical(value: Any) -> Any:
+    """Replaces the sets in stage arguments by sorted tuples, recursively.
+
+    The pickle of a set follows its iteration order, which changes with
+    hash randomization, so equal sets would give other keys in other runs.
+    """
+    if isinstance(value, (set, frozenset)):
+        items = [canonical(v) for v in value]
+        items.sort(key=lambda v: pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL))
+        return (f"<{type(value).__name__}>", tuple(items))
+    if type(value) in (list, tuple):
+        return type(value)(canonical(v) for v in value)
+    if type(value) is dict:
+        return {canonical(k): canonical(v) for k, v in value.items()}
+    return value
+
+
+def stage_key(
+    fn: Callable,
+    source: str,
+    subset: Dict[str, Any],
+    arguments: bytes,
+) -> str:
+    """The cache key of a stage call: its name, code, config subset and arguments."""
+    payload = json.dumps(
+        {
+            "stage": f"{fn.__module__}.{fn.__qualname__}",
+            "source": source,
+            "config": subset,
+            "arguments": hashlib.sha256(arguments).hexdigest(),
+        },
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
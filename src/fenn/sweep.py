@@ -0,0 +1,70 @@
+import itertools
+import json
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+SweepSpec = Union[
+    Mapping[str, Sequence[Any]],
+    Sequence[Union[Mapping[str, Any], Sequence[str]]],
+]
+
+
+def expand_sweep(spec: SweepSpec) -> List[Dict[str, Any]]:
+    """Turns a sweep specification into one ``{key.path: value}`` dict per run.
+
+    Args:
+        spec: Either a grid, ``{"training.lr": [0.1, 0.01], ...}``, expanded
+            to the cartesian product of its values, or a list of runs, each
+            a ``{key.path: value}`` dict or a list of ``key.path=value``
+            strings.
+    """
+    if isinstance(spec, Mapping):
+        keys = list(spec)
+        return [dict(zip(keys, values)) for values in itertools.product(*spec.values())]
+
+    runs = []
+    for run in spec:
+        if isinstance(run, Mapping):
+            runs.append(dict(run))
+        else:
+            # ["a.b=1", ...] -> {"a.b": 1}, parsed like command-line overrides
+            from fenn.args.parser import Parser
+
+            runs.append(
+                {key: Parser._parse_value(raw) for key, _, raw in (o.partition("=") for o in run)}
+            )
+    return runs
+
+
+def to_overrides(run: Mapping[str, Any]) -> List[str]:
+    """Encodes a ``{key.path: value}`` dict as ``key.path=value`` overrides."""
+    overrides = []
+    for key, value in run.items():
+        # JSON is valid YAML flow syntax, so every value, strings included,
+        # comes back unchanged ("off" stays a string instead of False).
+        overrides.append(f"{key}={json.dumps(value)}")
+    return overrides
+
+
+def run_sweep_job(
+    entrypoint_fn: Callable,
+    config_file: Union[str, List[str]],
+    overrides: List[str],
+    frozen_config: bool = False,
+    schema: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Runs the entrypoint once in a pool worker with its own session and log."""
+    from fenn.app import FENN
+
+    app = FENN(frozen_config=frozen_config)
+    app.entrypoint(entrypoint_fn)
+    app.set_config_file(config_file)
+    app.set_schema(schema)
+
+    job: Dict[str, Any] = {"session_id": app.session_id}
+    try:
+        job["result"] = app._execute(overrides)
+        job["status"] = "completed"
+    except Exception as exc:
+        job["status"] = "failed"
+        job["error"] = f"{type(exc).__name__}: {exc}"
+    return job
@@ -1,57 +1,17 @@
-import random
-import numpy as np
+from typing import TYPE_CHECKING
 
-try:
-    import torch
-except ImportError as e:
-    raise RuntimeError(
-        "Torch is required by fenn. Install it yourself (GPU/CPU) or use 'pip install fenn[torch]'."
-    ) from e
+from fenn._lazy import lazy_module
 
-def set_seed(seed: int) -> None:
-    """
-    Sets the random seed for Python, NumPy, and PyTorch to ensure reproducibility.
-    """
-    random.seed(seed)
-    np.random.seed(seed)
-    torch.manual_seed(seed)
-    if torch.cuda.is_available():
-        torch.cuda.manual_seed(seed)
-        torch.cuda.manual_seed_all(seed)
+if TYPE_CHECKING:
+    from fenn.utils.haiku import generate_haiku_id
+    from fenn.utils.seed import set_seed
 
-    torch.backends.cudnn.deterministic = True
-    torch.backends.cudnn.benchmark = False
+# Resolved on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "generate_haiku_id": "fenn.utils.haiku",
+    "set_seed": "fenn.utils.seed",
+}
 
+__all__ = list(_LAZY_ATTRIBUTES)
 
-import secrets
-import random
-
-def generate_haiku_id() -> str:
-    # A curated list of "beautiful" words
-    adjectives = [
-        "autumn", "hidden", "bitter", "misty", "silent",
-        "empty", "dry", "dark", "summer", "icy", "delicate",
-        "quiet", "white", "cool", "spring", "winter", "patient",
-        "twilight", "dawn", "crimson", "wispy", "weathered",
-        "blue", "billowing", "broken", "cold", "damp", "falling",
-        "frosty", "green", "long", "late", "lingering"
-    ]
-
-    nouns = [
-        "waterfall", "river", "breeze", "moon", "rain",
-        "wind", "sea", "morning", "snow", "lake", "sunset",
-        "pine", "shadow", "leaf", "dawn", "glitter", "forest",
-        "hill", "cloud", "meadow", "sun", "glade", "bird",
-        "brook", "butterfly", "bush", "dew", "dust", "field",
-        "fire", "flower", "firefly", "feather", "grass"
-    ]
-
-    # Select words
-    adj = random.choice(adjectives)
-    noun = random.choice(nouns)
-
-    # Add a secure hex suffix (2 bytes = 4 hex chars) to ensure uniqueness
-    # Use secrets (not random) for the numeric part for security
-    suffix = secrets.token_hex(2)
-
-    return f"{adj}_{noun}_{suffix}"
\ No newline at end of file
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,32 @@
+import secrets
+import random
+
+def generate_haiku_id() -> str:
+    # A curated list of "beautiful" words
+    adjectives = [
+        "autumn", "hidden", "bitter", "misty", "silent",
+        "empty", "dry", "dark", "summer", "icy", "delicate",
+        "quiet", "white", "cool", "spring", "winter", "patient",
+        "twilight", "dawn", "crimson", "wispy", "weathered",
+        "blue", "billowing", "broken", "cold", "damp", "falling",
+        "frosty", "green", "long", "late", "lingering"
+    ]
+
+    nouns = [
+        "waterfall", "river", "breeze", "moon", "rain",
+        "wind", "sea", "morning", "snow", "lake", "sunset",
+        "pine", "shadow", "leaf", "dawn", "glitter", "forest",
+        "hill", "cloud", "meadow", "sun", "glade", "bird",
+        "brook", "butterfly", "bush", "dew", "dust", "field",
+        "fire", "flower", "firefly", "feather", "grass"
+    ]
+
+    # Select words
+    adj = random.choice(adjectives)
+    noun = random.choice(nouns)
+
+    # Add a secure hex suffix (2 bytes = 4 hex chars) to ensure uniqueness
+    # Use secrets (not random) for the numeric part for security
+    suffix = secrets.token_hex(2)
+
+    return f"{adj}_{noun}_{suffix}"
@@ -0,0 +1,24 @@
+import random
+
+def set_seed(seed: int) -> None:
+    """
+    Sets the random seed for Python, NumPy, and PyTorch to ensure reproducibility.
+    """
+    import numpy as np
+
+    try:
+        import torch
+    except ImportError as e:
+        raise RuntimeError(
+            "Torch is required by fenn. Install it yourself (GPU/CPU) or use 'pip install fenn[torch]'."
+        ) from e
+
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    if torch.cuda.is_available():
+        torch.cuda.manual_seed(seed)
+        torch.cuda.manual_seed_all(seed)
+
+    torch.backends.cudnn.deterministic = True
+    torch.backends.cudnn.benchmark = False
@@ -1,4 +1,22 @@
-from fenn.vision.summary import image_summary
-from fenn.vision.color_mode import ensure_color_mode
-from fenn.vision.resize import resize_batch
-from fenn.vision.image_dir_summary import image_dir_summary
+from typing import TYPE_CHECKING
+
+from fenn._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from fenn.vision.color_mode import ensure_color_mode
+    from fenn.vision.image_dir_summary import image_dir_summary
+    from fenn.vision.resize import resize_batch
+    from fenn.vision.summary import image_summary
+
+# Resolved on first access (PEP 562), so that using one helper only
+# imports the modules it needs.
+_LAZY_ATTRIBUTES = {
+    "image_summary": "fenn.vision.summary",
+    "ensure_color_mode": "fenn.vision.color_mode",
+    "resize_batch": "fenn.vision.resize",
+    "image_dir_summary": "fenn.vision.image_dir_summary",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,94 @@
+import pickle
+
+import pytest
+
+from fenn import FENN
+from fenn.args import Config, Parser
+
+
+@pytest.fixture
+def config():
+    return Config(
+        {
+            "project": "test",
+            "training": {"lr": 0.001, "epochs": 10, "layers": [64, 32]},
+            "model": {"encoder": {"depth": 4}},
+        }
+    )
+
+
+class TestConfig:
+    def test_attribute_item_and_flat_access(self, config):
+        assert config.training.lr == 0.001
+        assert config["training"]["epochs"] == 10
+        assert config["training/lr"] == 0.001
+        assert config["model/encoder/depth"] == 4
+        assert config["model/encoder"].depth == 4
+
+    def test_lists_become_tuples(self, config):
+        assert config.training.layers == (64, 32)
+        assert config.to_dict()["training"]["layers"] == [64, 32]
+
+    def test_is_a_mapping(self, config):
+        assert list(config) == ["project", "training", "model"]
+        assert len(config) == 3
+        assert "training/lr" in config
+        assert config.get("missing", 1) == 1
+        assert config == config.to_dict()
+
+    def test_flat_leaves(self, config):
+        assert config.flat() == {
+            "project": "test",
+            "training/lr": 0.001,
+            "training/epochs": 10,
+            "training/layers": (64, 32),
+            "model/encoder/depth": 4,
+        }
+
+    def test_is_frozen(self, config):
+        with pytest.raises(AttributeError):
+            config.project = "other"
+        with pytest.raises(TypeError):
+            config["project"] = "other"
+
+    def test_typos_suggest_the_closest_key(self, config):
+        with pytest.raises(AttributeError, match="Did you mean 'training'"):
+            config.trainig
+        with pytest.raises(KeyError, match="Did you mean 'training/epochs'"):
+            config["training/epoch"]
+
+    def test_hash_and_equality(self, config):
+        same = Config(config.to_dict())
+        other = Config({**config.to_dict(), "project": "other"})
+
+        assert hash(same) == hash(config)
+        assert same == config
+        assert other != config
+        assert {config: 1}[same] == 1
+
+    def test_pickle_roundtrip(self, config):
+        restored = pickle.loads(pickle.dumps(config))
+
+        assert restored == config
+        assert hash(restored) == hash(config)
+        assert restored.training.lr == 0.001
+
+
+class TestFrozenEntrypoint:
+    def test_entrypoint_receives_a_config(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("sys.argv", ["main.py"])
+        Parser.clear_cache()
+        (tmp_path / "fenn.yaml").write_text(
+            "project: test\nlogger:\n  dir: logger\ntraining:\n  lr: 0.1\n"
+        )
+        app = FENN(frozen_config=True)
+        received = []
+        app.entrypoint(received.append)
+
+        app.run()
+
+        (args,) = received
+        assert isinstance(args, Config)
+        assert args.training.lr == 0.1
+        assert args.session_id == app.session_id
@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+from fenn.args import Parser
+from fenn.args import parser as parser_module
+
+
+@pytest.fixture
+def parser(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Parser.clear_cache()
+    parser = Parser()
+    yield parser
+    Parser.clear_cache()
+
+
+def write_config(path, lr):
+    path.write_text(
+        "project: test\n"
+        "logger:\n  dir: logger\n"
+        f"training:\n  lr: {lr}\n  layers: [64, 32]\n"
+    )
+
+
+class TestConfigCache:
+    def test_unchanged_file_is_not_parsed_again(self, parser, tmp_path, monkeypatch):
+        write_config(tmp_path / "fenn.yaml", 0.1)
+        parser.config_file = "fenn.yaml"
+        first = parser.load_configuration()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config parsed again")
+
+        monkeypatch.setattr(parser_module.yaml, "load", fail)
+        second = parser.load_configuration()
+
+        assert second == first
+        assert second is not first
+
+    def test_returned_config_is_a_private_copy(self, parser, tmp_path):
+        write_config(tmp_path / "fenn.yaml", 0.1)
+        parser.config_file = "fenn.yaml"
+
+        parser.load_configuration()["training"]["layers"].append(16)
+
+        assert parser.load_configuration()["training"]["layers"] == [64, 32]
+
+    def test_modified_file_is_parsed_again(self, parser, tmp_path):
+        config = tmp_path / "fenn.yaml"
+        write_config(config, 0.1)
+        parser.config_file = "fenn.yaml"
+        parser.load_configuration()
+
+        write_config(config, 0.25)
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert parser.load_configuration()["training"]["lr"] == 0.25
+
+    def test_touched_file_reuses_cache_by_hash(self, parser, tmp_path, monkeypatch):
+        config = tmp_path / "fenn.yaml"
+        write_config(config, 0.1)
+        parser.config_file = "fenn.yaml"
+        parser.load_configuration()
+
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        monkeypatch.setattr(parser_module.yaml, "load", None)
+
+        assert parser.load_configuration()["training"]["lr"] == 0.1
+
+    def test_deprecated_wandb_key_is_moved_to_keystore(self, parser, tmp_path):
+        (tmp_path / "fenn.yaml").write_text(
+            "project: test\nlogger:\n  dir: logger\nwandb:\n  entity: me\n  key: secret\n"
+        )
+        parser.config_file = "fenn.yaml"
+
+        for _ in range(2):
+            args = parser.load_configuration()
+            assert args["wandb"] == {"entity": "me"}
+            assert parser._keystore._keys["WANDB_API_KEY"] == "secret"
+
+    def test_print_reuses_flattened_config(self, parser, tmp_path, monkeypatch):
+        write_config(tmp_path / "fenn.yaml", 0.1)
+        parser.config_file = "fenn.yaml"
+        parser.load_configuration()["session_id"] = "abc"
+
+        flattened = []
+        original = Parser._flatten_dict
+        monkeypatch.setattr(
+            Parser, "_flatten_dict",
+            staticmethod(lambda d, *a, **kw: flattened.append(d) or original(d, *a, **kw)),
+        )
+
+        flat = parser._flat_config()
+
+        assert flat["training/lr"] == 0.1
+        assert flat["session_id"] == "abc"
+        assert flattened == [{"session_id": "abc"}]
+
+    def test_flattened_config_does_not_go_stale(self, parser, tmp_path):
+        write_config(tmp_path / "fenn.yaml", 0.1)
+        parser.config_file = "fenn.yaml"
+        args = parser.load_configuration()
+        parser._flat_config()
+
+        args["training"]["lr"] = 0.5
+        assert parser._flat_config()["training/lr"] == 0.5
+
+        parser.load_configuration()
+        parser._args = {"project": "other"}
+        assert parser._flat_config() == {"project": "other"}
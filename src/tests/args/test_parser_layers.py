@@ -0,0 +1,98 @@
+import pytest
+
+from fenn.args import Parser
+
+
+@pytest.fixture
+def parser(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Parser.clear_cache()
+    parser = Parser()
+    (tmp_path / "base.yaml").write_text(
+        "project: base\n"
+        "logger:\n  dir: logger\n"
+        "training:\n  lr: 0.001\n  epochs: 10\n  layers: [64, 32]\n"
+        "model:\n  name: mlp\n"
+    )
+    (tmp_path / "small.yaml").write_text(
+        "training:\n  lr: 0.01\n  layers: [8]\n"
+    )
+    yield parser
+    parser.config_file = "fenn.yaml"
+    parser.overrides = []
+    Parser.clear_cache()
+
+
+class TestLayeredConfig:
+    def test_later_files_override_earlier_ones(self, parser):
+        parser.config_file = ["base.yaml", "small.yaml"]
+
+        args = parser.load_configuration()
+
+        assert args["training"] == {"lr": 0.01, "epochs": 10, "layers": [8]}
+        assert args["model"] == {"name": "mlp"}
+        assert args["project"] == "base"
+
+    def test_overrides_are_applied_last(self, parser):
+        parser.config_file = ["base.yaml", "small.yaml"]
+        parser.overrides = ["training.lr=0.5", "model.depth=3", "tags=[a, b]", "project=x"]
+
+        args = parser.load_configuration()
+
+        assert args["training"]["lr"] == 0.5
+        assert args["model"] == {"name": "mlp", "depth": 3}
+        assert args["tags"] == ["a", "b"]
+        assert args["project"] == "x"
+
+    def test_scalar_replaces_section(self, parser):
+        parser.config_file = "base.yaml"
+        parser.overrides = ["model=none"]
+
+        assert parser.load_configuration()["model"] == "none"
+
+    def test_merged_stack_is_memoized(self, parser, monkeypatch):
+        parser.config_file = ["base.yaml", "small.yaml"]
+        parser.overrides = ["training.lr=0.5"]
+        first = parser.load_configuration()
+
+        monkeypatch.setattr(Parser, "_merge_layers", None)
+        second = parser.load_configuration()
+
+        assert second == first
+        assert second is not first
+
+    def test_merged_stacks_are_bounded(self, parser, monkeypatch):
+        from fenn.args import parser as parser_module
+
+        monkeypatch.setattr(parser_module, "_MERGED_CACHE_SIZE", 3)
+        parser.config_file = ["base.yaml", "small.yaml"]
+        for lr in range(5):
+            parser.overrides = [f"training.lr={lr}"]
+            parser.load_configuration()
+
+        assert len(parser_module._merged_cache) == 3
+
+    def test_changed_layer_invalidates_merge(self, parser, tmp_path):
+        parser.config_file = ["base.yaml", "small.yaml"]
+        parser.load_configuration()
+
+        (tmp_path / "small.yaml").write_text("training:\n  lr: 0.2\n  extra: true\n")
+
+        assert parser.load_configuration()["training"]["lr"] == 0.2
+
+    def test_missing_layer(self, parser):
+        parser.config_file = ["base.yaml", "missing.yaml"]
+
+        with pytest.raises(FileNotFoundError):
+            parser.load_configuration()
+
+    def test_invalid_override(self, parser):
+        with pytest.raises(ValueError):
+            parser.overrides = ["no_equal_sign"]
+
+    @pytest.mark.parametrize(
+        "token, expected",
+        [("training.lr=0.1", True), ("lr=1", True), ("--flag", False), ("--lr=1", False), ("file.yaml", False)],
+    )
+    def test_is_override(self, token, expected):
+        assert Parser.is_override(token) is expected
@@ -0,0 +1,133 @@
+import time
+
+import pytest
+
+from fenn.args import ConfigError, Parser, Schema
+from fenn.args.schema import compile_schema
+
+
+@pytest.fixture
+def parser(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Parser.clear_cache()
+    parser = Parser()
+    parser.config_file = "fenn.yaml"
+    yield parser
+    parser.schema = None
+    Parser.clear_cache()
+
+
+def write_config(tmp_path, body):
+    (tmp_path / "fenn.yaml").write_text("project: test\nlogger:\n  dir: logger\n" + body)
+
+
+class TestSchema:
+    def test_coerces_values(self):
+        args = {"training": {"lr": "1e-3", "epochs": "10", "amp": "yes", "layers": (1, 2)}}
+        schema = Schema(
+            {
+                "training.lr": float,
+                "training.epochs": "int",
+                "training/amp": bool,
+                "training.layers": list,
+            }
+        )
+
+        changed = schema.apply(args)
+
+        assert args["training"] == {"lr": 0.001, "epochs": 10, "amp": True, "layers": [1, 2]}
+        assert changed == {
+            "training/lr": 0.001,
+            "training/epochs": 10,
+            "training/amp": True,
+            "training/layers": [1, 2],
+        }
+
+    def test_collects_every_issue(self):
+        schema = Schema(
+            {
+                "training.lr": float,
+                "training.epochs": {"type": int, "min": 1},
+                "model.name": {"type": str, "choices": ["mlp", "cnn"]},
+                "data.dir": str,
+            }
+        )
+
+        with pytest.raises(ConfigError) as info:
+            schema.apply(
+                {"training": {"lr": "fast", "epochs": 0}, "model": {"name": "rnn"}}
+            )
+
+        assert info.value.issues == [
+            "training.lr: expected float, got 'fast'",
+            "training.epochs: 0 is below the minimum 1",
+            "model.name: 'rnn' is not one of ['mlp', 'cnn']",
+            "data.dir: required key is missing",
+        ]
+
+    def test_defaults_and_optional_keys(self):
+        args = {}
+        Schema(
+            {
+                "training.seed": {"type": int, "default": 42},
+                "training.resume": {"type": str, "required": False},
+                "training.note": {"type": str, "nullable": True, "default": None},
+            }
+        ).apply(args)
+
+        assert args == {"training": {"seed": 42, "note": None}}
+
+    def test_rejects_unknown_types(self):
+        with pytest.raises(ValueError):
+            Schema({"training.lr": "double"})
+
+    def test_is_compiled_once(self):
+        spec = {"training.lr": float}
+        assert compile_schema(spec) is compile_schema({"training/lr": "float"})
+
+
+class TestParserSchema:
+    def test_builtin_keys_are_required(self, parser, tmp_path):
+        (tmp_path / "fenn.yaml").write_text("project: test\n")
+
+        with pytest.raises(ConfigError, match="logger.dir: required key is missing"):
+            parser.load_configuration()
+
+    def test_yaml_schema_section(self, parser, tmp_path):
+        write_config(
+            tmp_path,
+            "training:\n  lr: 1e-3\n"
+            "fenn_schema:\n  training.lr: float\n  training.epochs: {type: int, default: 5}\n",
+        )
+
+        args = parser.load_configuration()
+
+        assert "fenn_schema" not in args
+        assert args["training"] == {"lr": 0.001, "epochs": 5}
+        assert parser._flat_config()["training/lr"] == 0.001
+
+    def test_plain_schema_key_is_user_data(self, parser, tmp_path):
+        write_config(tmp_path, "schema:\n  table: users\n  columns: [id, name]\n")
+
+        args = parser.load_configuration()
+
+        assert args["schema"] == {"table": "users", "columns": ["id", "name"]}
+
+    def test_python_schema(self, parser, tmp_path):
+        write_config(tmp_path, "training:\n  lr: fast\n  epochs: many\n")
+        parser.schema = {"training.lr": float, "training.epochs": int}
+
+        with pytest.raises(ConfigError) as info:
+            parser.load_configuration()
+
+        assert len(info.value.issues) == 2
+
+    def test_fails_in_milliseconds(self, parser, tmp_path):
+        write_config(tmp_path, "training:\n  lr: fast\n")
+        parser.schema = {"training.lr": float}
+
+        start = time.perf_counter()
+        with pytest.raises(ConfigError):
+            parser.load_configuration()
+
+        assert time.perf_counter() - start < 0.5
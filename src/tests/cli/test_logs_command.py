@@ -0,0 +1,184 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from fenn.cli import build_parser
+from fenn.cli.logs_command import execute
+from fenn.logging.index import SessionIndex
+
+
+def write_session(logger_dir, project, session_id, lines, config=None, status="completed"):
+    session_dir = logger_dir / project
+    session_dir.mkdir(parents=True, exist_ok=True)
+    log_file = session_dir / f"{session_id}.log"
+    log_file.write_text("".join(f"[2025-11-25 08:48:0{i}] {l}\n" for i, l in enumerate(lines)))
+    if config is not None:
+        meta = {
+            "session_id": session_id,
+            "project": project,
+            "start_time": "2025-11-25T08:48:00",
+            "end_time": "2025-11-25T09:00:00",
+            "status": status,
+            "config": config,
+        }
+        log_file.with_suffix(".json").write_text(json.dumps(meta))
+    return log_file
+
+
+@pytest.fixture
+def logger_dir(tmp_path):
+    logger_dir = tmp_path / "logger"
+    write_session(
+        logger_dir, "mnist", "misty_moon_0001", ["epoch 1 loss 0.5", "validation accuracy 0.91"],
+        config={"training": {"lr": 0.001, "epochs": 10}},
+    )
+    write_session(
+        logger_dir, "mnist", "quiet_lake_0002", ["epoch 1 loss 0.7", "CUDA out of memory"],
+        config={"training": {"lr": 0.01, "epochs": 10}}, status="failed",
+    )
+    write_session(logger_dir, "cifar", "dark_pine_0003", ["no metadata here"])
+    return logger_dir
+
+
+class TestSessionIndex:
+    def test_text_search(self, logger_dir):
+        index = SessionIndex(logger_dir)
+        index.update()
+
+        sessions = index.search(text="out of memory")
+
+        assert [s["session_id"] for s in sessions] == ["quiet_lake_0002"]
+        assert "memory" in sessions[0]["snippet"]
+        index.close()
+
+    def test_config_filter(self, logger_dir):
+        index = SessionIndex(logger_dir)
+        index.update()
+
+        assert [s["session_id"] for s in index.search(where={"training.lr": "0.001"})] == [
+            "misty_moon_0001"
+        ]
+        assert len(index.search(where={"training/epochs": "10"})) == 2
+        index.close()
+
+    def test_project_and_status_filters(self, logger_dir):
+        index = SessionIndex(logger_dir)
+        index.update()
+
+        assert len(index.search(project="mnist")) == 2
+        assert [s["session_id"] for s in index.search(status="failed")] == ["quiet_lake_0002"]
+
+        cifar = index.search(project="cifar")[0]
+        assert cifar["status"] == "unknown"
+        assert cifar["start_time"] == "2025-11-25T08:48:00"
+        index.close()
+
+    def test_only_changed_logs_are_reindexed(self, logger_dir):
+        index = SessionIndex(logger_dir)
+        assert index.update() == 3
+        assert index.update() == 0
+
+        log_file = logger_dir / "cifar" / "dark_pine_0003.log"
+        log_file.write_text(log_file.read_text() + "[2025-11-25 08:49:00] late line\n")
+        (logger_dir / "mnist" / "misty_moon_0001.log").unlink()
+
+        assert index.update() == 1
+        assert len(index.search()) == 2
+        assert index.search(text="late line")[0]["session_id"] == "dark_pine_0003"
+        index.close()
+
+
+    def test_config_filter_normalises_values(self, tmp_path):
+        logger_dir = tmp_path / "logger"
+        write_session(
+            logger_dir, "mnist", "misty_moon_0001", ["epoch 1"],
+            config={"flag": True, "training": {"lr": 0.001, "epochs": 10, "opt": "adam"}},
+        )
+        index = SessionIndex(logger_dir)
+        index.update()
+
+        for where in (
+            {"flag": "true"},
+            {"training.lr": "1e-3"},
+            {"training.epochs": "10.0"},
+            {"training.opt": "adam"},
+        ):
+            assert len(index.search(where=where)) == 1, where
+        assert index.search(where={"flag": "false"}) == []
+        index.close()
+
+    def test_long_logs_are_chunked_and_capped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("fenn.logging.index._CHUNK_CHARS", 50)
+        logger_dir = tmp_path / "logger"
+        lines = [f"epoch {i} loss 0.5" for i in range(8)] + ["beyond the cap"]
+        write_session(logger_dir, "mnist", "misty_moon_0001", lines)
+        index = SessionIndex(logger_dir, max_text_chars=200)
+        index.update()
+
+        sessions = index.search(text="loss")
+
+        assert [s["session_id"] for s in sessions] == ["misty_moon_0001"]
+        assert index.search(text="beyond the cap") == []
+        # Timestamps are still read past the cap
+        assert sessions[0]["end_time"] == "2025-11-25T08:48:08"
+        index.close()
+
+
+class TestLogsCommand:
+    def test_parser_registers_logs(self, monkeypatch):
+        args = build_parser().parse_args(
+            ["logs", "loss", "--dir", "runs", "--where", "training.lr=0.1"]
+        )
+        command = Mock()
+        monkeypatch.setattr("fenn.cli.logs_command.execute", command)
+
+        args.func(args)
+
+        command.assert_called_once_with(args)
+        assert args.query == "loss"
+        assert args.dir == "runs"
+        assert args.where == ["training.lr=0.1"]
+
+    def test_execute_prints_matches(self, logger_dir, capsys):
+        args = build_parser().parse_args(["logs", "accuracy", "--dir", str(logger_dir)])
+
+        execute(args)
+
+        captured = capsys.readouterr()
+        assert "1 session(s) found" in captured.out
+        assert "misty_moon_0001" in captured.out
+
+    def test_missing_directory(self, tmp_path, capsys):
+        args = Mock(dir=str(tmp_path / "missing"))
+
+        with pytest.raises(SystemExit) as exc_info:
+            execute(args)
+
+        assert exc_info.value.code == 1
+        assert "was not found" in capsys.readouterr().out
+
+    def test_invalid_filter(self, logger_dir, capsys):
+        args = build_parser().parse_args(["logs", "--dir", str(logger_dir), "--where", "lr"])
+
+        with pytest.raises(SystemExit):
+            execute(args)
+
+        assert "Invalid filter" in capsys.readouterr().out
+
+    def test_logger_sessions_are_indexed(self, start_logger, capsys):
+        logger = start_logger()
+        logger.user_info("hello from the logger")
+        logger.stop("failed")
+
+        logger_dir = logger._log_filepath.parent
+        meta = json.loads(logger._log_file.with_suffix(".json").read_text())
+        assert meta["status"] == "failed"
+        assert meta["end_time"] is not None
+
+        index = SessionIndex(logger_dir)
+        index.update()
+        sessions = index.search(text="hello from the logger")
+        index.close()
+
+        assert [s["status"] for s in sessions] == ["failed"]
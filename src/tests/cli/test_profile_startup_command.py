@@ -0,0 +1,63 @@
+from fenn.cli import build_parser
+from fenn.profiling import format_import_tree, parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       163 |        163 |       _json
+import time:       417 |        579 |     json.scanner
+import time:       415 |        993 |   json.decoder
+import time:       413 |        413 |   json.encoder
+import time:       237 |       1642 | json
+import time:      9000 |       9000 | slow
+"""
+
+MAIN = """\
+from fenn import FENN
+
+app = FENN()
+
+@app.entrypoint
+def main(args):
+    open("entrypoint_ran", "w").close()
+
+if __name__ == "__main__":
+    app.run()
+"""
+
+
+def test_parse_importtime():
+    roots = parse_importtime(IMPORTTIME.splitlines())
+
+    assert [root.name for root in roots] == ["json", "slow"]
+    json_node = roots[0]
+    assert json_node.total_ms == 1.642
+    assert [child.name for child in json_node.children] == ["json.decoder", "json.encoder"]
+    assert json_node.children[0].children[0].children[0].name == "_json"
+
+    assert format_import_tree(roots, min_ms=0.5, max_depth=2) == [
+        "slow: 9.0 ms (self 9.0 ms)",
+        "json: 1.6 ms (self 0.2 ms)",
+        "  json.decoder: 1.0 ms (self 0.4 ms)",
+    ]
+
+
+def test_profile_startup(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "main.py").write_text(MAIN)
+    (tmp_path / "fenn.yaml").write_text("project: profiled\nlogger:\n  dir: logger\n")
+
+    args = build_parser().parse_args(["profile-startup", "--min-ms", "0", "main.py"])
+    args.func(args)
+
+    out = capsys.readouterr().out
+    assert "Import time:" in out
+    assert "fenn" in out
+    assert not (tmp_path / "entrypoint_ran").exists()
+
+    (log,) = (tmp_path / "logger" / "profiled").glob("*.log")
+    text = log.read_text()
+    assert "Startup timings:" in text
+    assert "interpreter and imports" in text
+    assert "load configuration" in text
+    assert "Import times" in text
+    assert '"status": "profiled"' in log.with_suffix(".json").read_text()
@@ -1,6 +1,27 @@
 import pytest
 from faker import Faker
 
+from fenn.args import Parser
+from fenn.logging import Logger
+
 @pytest.fixture(scope="session")
 def fake():
     return Faker()
+
+@pytest.fixture
+def start_logger(tmp_path):
+    """Start the Logger singleton on a throwaway config and stop it afterwards."""
+    logger = Logger()
+
+    def _start(**logger_conf):
+        Parser()._args = {
+            "project": "test",
+            "session_id": "test_session",
+            "logger": {"dir": str(tmp_path / "logger"), **logger_conf},
+        }
+        logger.start()
+        return logger
+
+    yield _start
+
+    logger.stop()
@@ -0,0 +1,69 @@
+import builtins
+import gzip
+import io
+import json
+
+from fenn.logging.jsonl import JsonlSink
+
+
+class TestJsonlSink:
+    def test_records_are_json_lines(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        sink = JsonlSink(path)
+
+        sink.write({"message": "a", "level": "info"})
+        sink.write({"message": "b", "level": "warning"})
+        sink.close()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["message"] for r in records] == ["a", "b"]
+
+    def test_rotates_and_compresses_segments(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        sink = JsonlSink(path, max_bytes=200, compress=True)
+
+        for i in range(20):
+            sink.write({"message": f"record {i:02d}"})
+        sink.close()
+
+        segments = sorted(tmp_path.glob("session.*.jsonl.gz"))
+        assert segments
+        assert not list(tmp_path.glob("session.*.jsonl"))
+
+        messages = []
+        for i in range(1, len(segments) + 1):
+            with gzip.open(tmp_path / f"session.{i}.jsonl.gz", "rt") as f:
+                messages += [json.loads(line)["message"] for line in f]
+        messages += [json.loads(line)["message"] for line in path.read_text().splitlines()]
+
+        assert messages == [f"record {i:02d}" for i in range(20)]
+        assert all(s.stat().st_size > 0 for s in segments)
+
+    def test_rotation_without_compression(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        sink = JsonlSink(path, max_bytes=100, compress=False)
+
+        for i in range(10):
+            sink.write({"message": f"record {i}"})
+        sink.close()
+
+        assert (tmp_path / "session.1.jsonl").exists()
+        assert not list(tmp_path.glob("*.gz"))
+
+
+class TestLoggerJsonl:
+    def test_logger_writes_structured_records(self, start_logger):
+        logger = start_logger(jsonl=True)
+
+        builtins.print("\x1b[31muser message\x1b[0m", file=io.StringIO())
+        logger.user_warning("careful")
+        logger.stop()
+
+        path = logger._log_filepath / "test_session.jsonl"
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        by_message = {r["message"]: r for r in records}
+
+        assert by_message["user message"]["source"] == "user"
+        assert by_message["careful"]["level"] == "warning"
+        assert all(r["session_id"] == "test_session" for r in records)
+        assert any(r["source"] == "system" for r in records)
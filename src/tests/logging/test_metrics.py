@@ -0,0 +1,117 @@
+import pytest
+
+from fenn.logging.metrics import MetricsBuffer
+
+
+class RecordingSink:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, metrics, step):
+        self.calls.append((step, metrics))
+
+
+@pytest.fixture
+def sink():
+    return RecordingSink()
+
+
+class TestMetricsBuffer:
+    @pytest.mark.parametrize(
+        "aggregate, expected",
+        [("mean", 2.0), ("last", 1.0), ("max", 3.0)],
+    )
+    def test_aggregates_per_step(self, sink, aggregate, expected):
+        buffer = MetricsBuffer([sink], aggregate=aggregate, flush_interval=60)
+
+        for value in (2.0, 3.0, 1.0):
+            buffer.add({"loss": value}, step=0)
+        buffer.close()
+
+        assert sink.calls == [(0, {"loss": expected})]
+
+    def test_steps_are_emitted_in_order(self, sink):
+        buffer = MetricsBuffer([sink], flush_interval=60)
+
+        buffer.add({"loss": 1.0}, step=1)
+        buffer.add({"loss": 2.0}, step=0)
+        buffer.flush()
+
+        assert [step for step, _ in sink.calls] == [0, 1]
+        buffer.close()
+
+    def test_step_defaults_to_next_step(self, sink):
+        buffer = MetricsBuffer([sink], flush_interval=60)
+
+        buffer.add({"loss": 1.0})
+        buffer.add({"loss": 2.0})
+        buffer.add({"acc": 0.5}, step=10)
+        buffer.add({"acc": 0.7})
+        buffer.close()
+
+        assert [step for step, _ in sink.calls] == [0, 1, 10, 11]
+
+    def test_late_steps_are_dropped(self, sink):
+        errors = []
+        buffer = MetricsBuffer([sink], flush_interval=60, on_error=errors.append)
+
+        buffer.add({"loss": 1.0}, step=5)
+        buffer.flush()
+        buffer.add({"loss": 2.0}, step=3)
+        buffer.add({"loss": 3.0}, step=6)
+        buffer.close()
+
+        assert [step for step, _ in sink.calls] == [5, 6]
+        assert len(errors) == 1
+        assert "step(s) [3]" in str(errors[0])
+
+    def test_latest_step_is_held_back_by_background_flush(self, sink):
+        buffer = MetricsBuffer([sink], flush_interval=60)
+
+        buffer.add({"loss": 1.0}, step=0)
+        buffer.add({"loss": 2.0}, step=1)
+        with buffer._lock:
+            buffer._drain(final=False)
+
+        assert sink.calls == [(0, {"loss": 1.0})]
+        buffer.close()
+        assert sink.calls[-1] == (1, {"loss": 2.0})
+
+    def test_sink_errors_are_reported(self):
+        errors = []
+
+        def failing_sink(metrics, step):
+            raise RuntimeError("backend down")
+
+        buffer = MetricsBuffer([failing_sink], flush_interval=60, on_error=errors.append)
+        buffer.add({"loss": 1.0}, step=0)
+        buffer.close()
+
+        assert len(errors) == 1
+        assert "backend down" in str(errors[0])
+
+    def test_unknown_aggregate(self, sink):
+        with pytest.raises(ValueError):
+            MetricsBuffer([sink], aggregate="median")
+
+
+class TestLoggerMetrics:
+    def test_log_metrics_reaches_tensorboard_writer(self, start_logger, monkeypatch):
+        logger = start_logger(metrics={"aggregate": "max"})
+        calls = []
+
+        class Writer:
+            def add_scalar(self, name, value, step):
+                calls.append((name, value, step))
+
+            def close(self):
+                pass
+
+        logger._tensorboard_writer = Writer()
+        logger._metrics = logger._create_metrics_buffer()
+
+        logger.log_metrics({"loss": 0.5}, step=3)
+        logger.log_metrics({"loss": 0.9}, step=3)
+        logger.stop()
+
+        assert calls == [("loss", 0.9, 3)]
@@ -0,0 +1,110 @@
+import builtins
+import io
+import json
+import multiprocessing
+import queue
+
+import pytest
+
+from fenn.logging import Logger
+from fenn.logging.multiprocess import LogClient, LogListener, format_tag
+
+
+def _print_lines(count):
+    for i in range(count):
+        print(f"child line {i}", file=io.StringIO())
+
+
+def _print_lines_spawned(client, rank, count):
+    Logger().connect(client, rank=rank)
+    _print_lines(count)
+
+
+class TestFormatTag:
+    def test_rank_and_worker(self):
+        assert format_tag(rank=0, worker=3, pid=123) == "rank 0/worker 3"
+
+    def test_pid_fallback(self):
+        assert format_tag(pid=123) == "pid 123"
+
+
+class TestMultiprocessLogging:
+    def test_forked_children_write_through_parent(self, start_logger):
+        logger = start_logger(multiprocess="fork")
+
+        ctx = multiprocessing.get_context("fork")
+        processes = [ctx.Process(target=_print_lines, args=(50,)) for _ in range(3)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        logger.stop()
+
+        lines = [l for l in logger._log_file.read_text().splitlines() if "child line" in l]
+        assert len(lines) == 150
+
+        per_process = {}
+        for line in lines:
+            tag = line.split("] [", 1)[1].split("]", 1)[0]
+            per_process.setdefault(tag, []).append(int(line.rsplit(" ", 1)[1]))
+
+        assert len(per_process) == 3
+        assert all(tag.startswith("pid ") for tag in per_process)
+        assert all(numbers == list(range(50)) for numbers in per_process.values())
+
+    def test_spawned_child_connects_with_client(self, start_logger):
+        logger = start_logger(multiprocess="spawn", jsonl=True)
+
+        ctx = multiprocessing.get_context("spawn")
+        p = ctx.Process(target=_print_lines_spawned, args=(logger.client(rank=1), 1, 5))
+        p.start()
+        p.join()
+        logger.stop()
+
+        lines = logger._log_file.read_text().splitlines()
+        assert sum("[rank 1] child line" in l for l in lines) == 5
+
+        jsonl = logger._log_filepath / "test_session.jsonl"
+        records = [json.loads(l) for l in jsonl.read_text().splitlines()]
+        assert [r["process"] for r in records if r.get("process")] == ["rank 1"] * 5
+
+    def test_parent_writes_directly(self, start_logger):
+        logger = start_logger(multiprocess=True)
+
+        builtins.print("parent line", file=io.StringIO())
+        logger.stop()
+
+        assert any(l.endswith("] parent line") for l in logger._log_file.read_text().splitlines())
+
+    def test_client_requires_multiprocess_mode(self, start_logger):
+        logger = start_logger()
+
+        with pytest.raises(RuntimeError):
+            logger.client()
+
+    def test_client_is_a_worker_init_fn(self, start_logger):
+        logger = start_logger(multiprocess=True)
+        client = logger.client(rank=0)
+        assert isinstance(client, LogClient)
+
+
+class TestLogListener:
+    def test_bad_records_are_reported_once(self, capsys):
+        handled = []
+
+        def handle(record):
+            if record == "bad":
+                raise ValueError("broken record")
+            handled.append(record)
+
+        records = queue.Queue()
+        listener = LogListener(records, handle)
+        for record in ("bad", "good", "bad"):
+            records.put(record)
+        listener.stop()
+
+        assert handled == ["good"]
+        assert listener.dropped == 2
+        err = capsys.readouterr().err
+        assert err.count("Failed to log a record from a child process") == 1
+        assert "ValueError: broken record" in err
@@ -0,0 +1,77 @@
+import builtins
+import io
+
+from fenn.logging.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    def test_every(self):
+        limiter = RateLimiter()
+
+        allowed = [limiter.allow("site", every=3) for _ in range(7)]
+
+        assert allowed == [True, False, False, True, False, False, True]
+        assert limiter.suppressed() == {"site": 4}
+
+    def test_interval(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("fenn.logging.ratelimit.time.monotonic", lambda: now[0])
+        limiter = RateLimiter()
+
+        assert limiter.allow("site", interval=1.0)
+        now[0] += 0.5
+        assert not limiter.allow("site", interval=1.0)
+        now[0] += 0.6
+        assert limiter.allow("site", interval=1.0)
+
+    def test_sites_are_independent(self):
+        limiter = RateLimiter()
+
+        assert limiter.allow("a", every=10)
+        assert limiter.allow("b", every=10)
+        assert limiter.suppressed() == {}
+
+
+class TestLoggerSampling:
+    def test_prints_are_sampled_per_call_site(self, start_logger):
+        logger = start_logger(rate_limit={"every": 10})
+        out = io.StringIO()
+
+        for i in range(25):
+            builtins.print(f"tight loop {i}", file=out)
+        builtins.print("other site", file=out)
+        logger.stop()
+
+        assert out.getvalue().splitlines() == [
+            "tight loop 0", "tight loop 10", "tight loop 20", "other site",
+        ]
+        text = logger._log_file.read_text()
+        assert "22 messages suppressed at" in text
+        assert "test_ratelimit.py" in text
+
+    def test_every_helper(self, start_logger):
+        logger = start_logger()
+
+        hits = [step for step in range(10) if logger.every(4)]
+        logger.stop()
+
+        assert hits == [0, 4, 8]
+        # Skipped on purpose, not reported as suppressed output
+        assert "suppressed" not in logger._log_file.read_text()
+
+    def test_throttle_helper(self, start_logger):
+        logger = start_logger()
+
+        hits = sum(logger.throttle(60) for _ in range(5))
+
+        assert hits == 1
+
+    def test_internal_messages_are_not_sampled(self, start_logger):
+        logger = start_logger(rate_limit={"every": 100})
+
+        for i in range(3):
+            logger.user_info(f"config line {i}")
+        logger.stop()
+
+        text = logger._log_file.read_text()
+        assert all(f"config line {i}" in text for i in range(3))
@@ -0,0 +1,115 @@
+import json
+import time
+
+from fenn.logging.spans import Histogram, Span, SpanRecorder
+
+
+class RecordingBuffer:
+    def __init__(self):
+        self.added = []
+
+    def add(self, metrics, step=None):
+        self.added.append((metrics, step))
+
+    def close(self):
+        pass
+
+
+class TestHistogram:
+    def test_statistics(self):
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.add(value)
+
+        assert histogram.count == 100
+        assert histogram.total == 5050
+        assert histogram.max == 100
+        assert histogram.percentile(0.5) == 51
+        assert histogram.percentile(0.95) == 96
+
+    def test_reservoir_is_bounded(self):
+        histogram = Histogram(max_samples=10)
+        for value in range(1000):
+            histogram.add(value)
+
+        assert len(histogram._samples) == 10
+        assert histogram.count == 1000
+        assert histogram.max == 999
+
+
+class TestSpan:
+    def test_context_manager(self):
+        recorder = SpanRecorder()
+        for _ in range(3):
+            with Span(recorder, "sleep"):
+                time.sleep(0.001)
+
+        stats = recorder.summary()["sleep"]
+        assert stats["count"] == 3
+        assert stats["p50_ms"] >= 1.0
+        assert stats["max_ms"] >= stats["p50_ms"]
+
+    def test_exhausted_iterator_is_not_recorded(self):
+        recorder = SpanRecorder()
+        batches = iter([1, 2])
+        fetched = []
+        while True:
+            try:
+                with Span(recorder, "data_load"):
+                    fetched.append(next(batches))
+            except StopIteration:
+                break
+
+        assert fetched == [1, 2]
+        assert recorder.summary()["data_load"]["count"] == 2
+
+    def test_decorator_supports_recursion(self):
+        recorder = SpanRecorder()
+
+        @Span(recorder, "fib")
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        assert fib(5) == 5
+        assert recorder.summary()["fib"]["count"] == 15
+
+
+class TestLoggerSpans:
+    def test_spans_are_written_to_the_log(self, start_logger):
+        logger = start_logger()
+
+        with logger.span("data_load"):
+            pass
+
+        @logger.span("step")
+        def step():
+            pass
+
+        step()
+        step()
+        logger.stop()
+
+        text = logger._log_file.read_text()
+        assert "data_load: count=1" in text
+        assert "step: count=2" in text
+
+    def test_spans_are_in_the_session_meta_not_the_metrics(self, start_logger):
+        logger = start_logger()
+        logger._metrics = buffer = RecordingBuffer()
+
+        with logger.span("data_load"):
+            pass
+        logger.stop()
+
+        meta = json.loads(logger._log_file.with_suffix(".json").read_text())
+        assert meta["spans"]["data_load"]["count"] == 1
+        assert buffer.added == []
+
+    def test_spans_are_reset_by_start(self, start_logger):
+        logger = start_logger()
+        with logger.span("old"):
+            pass
+        logger.stop()
+
+        logger.start()
+        assert logger._spans.summary() == {}
@@ -0,0 +1,208 @@
+import json
+import sys
+import time
+import types
+
+import pytest
+
+from fenn.cli import build_parser
+from fenn.cli.sync_command import execute as sync_execute
+from fenn.logging.spool import SpoolReplayer, SpoolUploader, WandbSpool, find_spools
+
+
+class FakeRun:
+    def __init__(self, client):
+        self._client = client
+
+    def log(self, metrics, step):
+        if self._client.offline:
+            raise ConnectionError("no network")
+        self._client.logged.append((step, metrics))
+
+    def finish(self):
+        self._client.finished += 1
+
+
+class FakeWandb:
+    """Stand-in for the wandb client that can be switched offline."""
+
+    def __init__(self, offline=False):
+        self.offline = offline
+        self.inits = []
+        self.logged = []
+        self.finished = 0
+
+    def init(self, **kwargs):
+        if self.offline:
+            raise ConnectionError("no network")
+        self.inits.append(kwargs)
+        return FakeRun(self)
+
+
+@pytest.fixture
+def spool(tmp_path):
+    spool = WandbSpool(
+        tmp_path / "test" / "session.wandb",
+        run_info={"project": "test", "name": "session", "config": {"lr": 0.1}},
+    )
+    yield spool
+    spool.close()
+
+
+class TestSpoolReplayer:
+    def test_replays_records_in_order(self, spool):
+        for step in range(3):
+            spool.log({"loss": float(step)}, step)
+
+        client = FakeWandb()
+        assert SpoolReplayer(spool.directory, client=client).finish() == 3
+
+        assert client.logged == [(0, {"loss": 0.0}), (1, {"loss": 1.0}), (2, {"loss": 2.0})]
+        assert client.inits[0]["resume"] == "allow"
+        assert client.inits[0]["config"] == {"lr": 0.1}
+        assert client.finished == 1
+
+    def test_resumes_after_failure_without_duplicates(self, spool):
+        spool.log({"loss": 1.0}, 0)
+
+        offline = FakeWandb(offline=True)
+        replayer = SpoolReplayer(spool.directory, client=offline)
+        with pytest.raises(ConnectionError):
+            replayer.upload()
+        # Left to the running session's own uploader
+        assert replayer.active
+        assert not replayer.pending()
+
+        online = FakeWandb()
+        replayer = SpoolReplayer(spool.directory, client=online)
+        replayer.upload()
+        spool.log({"loss": 2.0}, 1)
+        replayer.finish()
+
+        assert online.logged == [(0, {"loss": 1.0}), (1, {"loss": 2.0})]
+        spool.close()
+        assert not SpoolReplayer(spool.directory).pending()
+
+    def test_run_id_is_stable_across_replays(self, spool):
+        first, second = FakeWandb(), FakeWandb()
+        SpoolReplayer(spool.directory, client=first).upload()
+        SpoolReplayer(spool.directory, client=second).upload()
+
+        assert first.inits[0]["id"] == second.inits[0]["id"]
+
+    def test_partial_line_is_left_for_next_upload(self, spool):
+        spool.log({"loss": 1.0}, 0)
+        with open(spool.directory / "queue.jsonl", "a") as f:
+            f.write('{"step": 1, "metr')
+
+        client = FakeWandb()
+        assert SpoolReplayer(spool.directory, client=client).upload() == 1
+
+    def test_cursor_is_saved_once_per_upload(self, spool, monkeypatch):
+        for step in range(5):
+            spool.log({"loss": float(step)}, step)
+        writes = []
+        replayer = SpoolReplayer(spool.directory, client=FakeWandb())
+        original = replayer._write_cursor
+        monkeypatch.setattr(replayer, "_write_cursor", lambda c: (writes.append(c), original(c)))
+
+        assert replayer.upload() == 5
+
+        assert len(writes) == 1
+        assert replayer.upload() == 0
+        assert len(writes) == 1
+
+    def test_cursor_stops_at_the_last_accepted_record(self, spool):
+        for step in range(3):
+            spool.log({"loss": float(step)}, step)
+        client = FakeWandb()
+        replayer = SpoolReplayer(spool.directory, client=client)
+        replayer._run = client.init()
+        original_log = FakeRun.log
+
+        def flaky_log(run, metrics, step):
+            if step == 2:
+                raise ConnectionError("no network")
+            original_log(run, metrics, step)
+
+        replayer._run.log = types.MethodType(flaky_log, replayer._run)
+        with pytest.raises(ConnectionError):
+            replayer.upload()
+
+        retry = FakeWandb()
+        SpoolReplayer(spool.directory, client=retry).upload()
+        assert [step for step, _ in client.logged] == [0, 1]
+        assert [step for step, _ in retry.logged] == [2]
+
+    def test_sync_skips_running_sessions(self, spool, monkeypatch, capsys):
+        spool.log({"loss": 1.0}, 0)
+        client = FakeWandb()
+        monkeypatch.setitem(sys.modules, "wandb", types.SimpleNamespace(init=client.init))
+        logger_dir = spool.directory.parent.parent
+
+        sync_execute(build_parser().parse_args(["sync", "--dir", str(logger_dir)]))
+
+        out = capsys.readouterr().out
+        assert "still running" in out
+        assert "Nothing to sync" in out
+        assert client.logged == []
+        assert not (spool.directory / "finished").exists()
+
+        spool.close()
+        sync_execute(build_parser().parse_args(["sync", "--dir", str(logger_dir)]))
+        assert client.logged == [(0, {"loss": 1.0})]
+
+
+class TestSpoolUploader:
+    def test_uploads_in_background(self, spool):
+        client = FakeWandb()
+        uploader = SpoolUploader(spool.directory, interval=0.01, client=client)
+        spool.log({"loss": 1.0}, 0)
+
+        deadline = time.monotonic() + 2
+        while not client.logged and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert client.logged == [(0, {"loss": 1.0})]
+        assert uploader.close()
+        assert client.finished == 1
+
+    def test_offline_errors_are_reported_once(self, spool):
+        errors = []
+        uploader = SpoolUploader(
+            spool.directory, interval=0.01, client=FakeWandb(offline=True), on_error=errors.append
+        )
+        spool.log({"loss": 1.0}, 0)
+        time.sleep(0.05)
+
+        assert not uploader.close()
+        assert len(errors) == 1
+        spool.close()
+        assert SpoolReplayer(spool.directory).pending()
+
+
+class TestLoggerSpool:
+    def test_metrics_are_spooled_and_synced_later(self, start_logger, monkeypatch, capsys):
+        logger = start_logger()
+        logger.stop()
+        logger._parser.args["wandb"] = {"spool": True, "sync_interval": 0}
+        logger.start()
+        logger.log_metrics({"loss": 0.5}, step=0)
+        logger.stop()
+
+        logger_dir = logger._log_filepath.parent
+        spools = find_spools(logger_dir)
+        assert len(spools) == 1
+        lines = (spools[0] / "queue.jsonl").read_text().splitlines()
+        assert [json.loads(l) for l in lines] == [{"step": 0, "metrics": {"loss": 0.5}}]
+        assert "fenn sync" in capsys.readouterr().out
+
+        client = FakeWandb()
+        monkeypatch.setitem(sys.modules, "wandb", types.SimpleNamespace(init=client.init))
+        sync_execute(build_parser().parse_args(["sync", "--dir", str(logger_dir)]))
+
+        assert client.logged == [(0, {"loss": 0.5})]
+        assert "Synced" in capsys.readouterr().out
+
+        sync_execute(build_parser().parse_args(["sync", "--dir", str(logger_dir)]))
+        assert "Nothing to sync" in capsys.readouterr().out
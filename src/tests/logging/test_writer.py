@@ -0,0 +1,77 @@
+import builtins
+import io
+import time
+
+from fenn.logging.writer import BufferedFileWriter, FileWriter
+
+
+class TestFileWriter:
+    def test_appends_lines(self, tmp_path):
+        path = tmp_path / "session.log"
+        writer = FileWriter(path)
+
+        writer.write("first\n")
+        writer.write("second\n")
+
+        assert path.read_text() == "first\nsecond\n"
+
+
+class TestBufferedFileWriter:
+    def test_lines_are_written_on_close(self, tmp_path):
+        path = tmp_path / "session.log"
+        writer = BufferedFileWriter(path, max_lines=1000, flush_interval=60)
+
+        for i in range(10):
+            writer.write(f"line {i}\n")
+        writer.close()
+
+        assert path.read_text().splitlines() == [f"line {i}" for i in range(10)]
+
+    def test_flush_drains_pending_lines(self, tmp_path):
+        path = tmp_path / "session.log"
+        writer = BufferedFileWriter(path, max_lines=1000, flush_interval=60)
+
+        writer.write("pending\n")
+        writer.flush()
+
+        assert path.read_text() == "pending\n"
+        writer.close()
+
+    def test_size_threshold_wakes_writer(self, tmp_path):
+        path = tmp_path / "session.log"
+        writer = BufferedFileWriter(path, max_lines=5, flush_interval=60)
+
+        for i in range(5):
+            writer.write(f"line {i}\n")
+        deadline = time.monotonic() + 2
+        while not path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(path.read_text().splitlines()) == 5
+        writer.close()
+
+    def test_close_is_idempotent(self, tmp_path):
+        writer = BufferedFileWriter(tmp_path / "session.log")
+        writer.close()
+        writer.close()
+
+
+class TestLoggerBufferedMode:
+    def test_print_is_buffered_until_stop(self, start_logger):
+        logger = start_logger(buffered=True, flush_interval=60)
+        assert isinstance(logger._writer, BufferedFileWriter)
+
+        builtins.print("hello buffered", file=io.StringIO())
+        log_file = logger._log_file
+        assert "hello buffered" not in log_file.read_text()
+
+        logger.stop()
+
+        assert "hello buffered" in log_file.read_text()
+
+    def test_default_mode_writes_immediately(self, start_logger):
+        logger = start_logger()
+
+        builtins.print("hello direct", file=io.StringIO())
+
+        assert "hello direct" in logger._log_file.read_text()
@@ -0,0 +1,238 @@
+import threading
+import time
+
+import pytest
+
+from fenn.notification import Notifier, Service
+
+
+class Fast(Service):
+    sent = []
+
+    def send_notification(self, message: str) -> None:
+        self.sent.append(message)
+
+
+class Slow(Service):
+    delay = 0.2
+
+    def send_notification(self, message: str) -> None:
+        time.sleep(self.delay)
+
+
+class AlsoSlow(Slow):
+    pass
+
+
+class Broken(Service):
+    def send_notification(self, message: str) -> None:
+        raise RuntimeError("webhook rejected the message")
+
+
+@pytest.fixture(autouse=True)
+def fast_sent(monkeypatch):
+    monkeypatch.setattr(Fast, "sent", [])
+
+
+@pytest.fixture
+def notifier():
+    notifier = Notifier()
+    yield notifier
+    notifier.close()
+
+
+@pytest.fixture
+def make_notifier():
+    """Creates notifiers that are closed at teardown, even when the test fails."""
+    notifiers = []
+
+    def make(**kwargs):
+        notifiers.append(Notifier(**kwargs))
+        return notifiers[-1]
+
+    yield make
+    for notifier in notifiers:
+        notifier.close()
+
+
+@pytest.fixture
+def gated():
+    """A service that blocks until ``release`` is set, to hold the background worker."""
+
+    class Gated(Service):
+        started = threading.Event()
+        release = threading.Event()
+
+        def send_notification(self, message: str) -> None:
+            self.started.set()
+            self.release.wait(5)
+
+    yield Gated
+    # Never leave the worker blocked behind a failed test
+    Gated.release.set()
+
+
+class TestNotifier:
+    def test_no_services(self, notifier):
+        assert notifier.notify("hello") == {"successful": [], "failed": []}
+
+    def test_reports_successes_and_failures(self, notifier):
+        notifier.add_services([Fast, Broken])
+
+        result = notifier.notify("hello")
+
+        assert result == {
+            "successful": ["Fast"],
+            "failed": [("Broken", "webhook rejected the message")],
+        }
+        assert Fast.sent == ["hello"]
+
+    def test_services_are_called_concurrently(self, notifier):
+        notifier.add_services([Slow, AlsoSlow, Fast])
+
+        start = time.perf_counter()
+        result = notifier.notify("hello")
+        elapsed = time.perf_counter() - start
+
+        assert result["successful"] == ["Slow", "AlsoSlow", "Fast"]
+        assert elapsed < 2 * Slow.delay
+
+    def test_deadline(self, notifier):
+        notifier.add_services([Slow, Fast])
+
+        start = time.perf_counter()
+        result = notifier.notify("hello", deadline=0.05)
+        elapsed = time.perf_counter() - start
+
+        assert result["successful"] == ["Fast"]
+        assert result["failed"] == [("Slow", "No answer within 0.05s")]
+        assert elapsed < Slow.delay
+
+
+class TestServiceSession:
+    def test_session_is_created_once_and_reused(self):
+        service = object.__new__(Fast)  # __init__ bypassed
+
+        session = service.session
+
+        assert service.session is session
+        assert session.get_adapter("https://hooks.slack.com")._pool_maxsize == Fast.pool_size
+
+    def test_pool_size_is_configurable(self, monkeypatch):
+        monkeypatch.setattr(Fast, "pool_size", 16)
+
+        assert object.__new__(Fast).session.get_adapter("https://x")._pool_maxsize == 16
+
+    def test_clear_services_closes_sessions(self, notifier, monkeypatch):
+        notifier.add_service(Fast)
+        (service,) = notifier._services
+        session = service.session
+        closed = []
+        monkeypatch.setattr(session, "close", lambda: closed.append(True))
+
+        notifier.clear_services()
+
+        assert closed == [True]
+        assert service.session is not session
+
+
+class TestBackgroundNotifier:
+    def test_notify_only_enqueues(self, make_notifier):
+        notifier = make_notifier(background=True)
+        notifier.add_service(Slow)
+
+        start = time.perf_counter()
+        assert notifier.notify("hello") is None
+        assert time.perf_counter() - start < Slow.delay
+
+        assert notifier.flush(timeout=5)
+        assert notifier.pending == 0
+
+    def test_oldest_messages_are_dropped(self, make_notifier, gated):
+        notifier = make_notifier(background=True, queue_size=2)
+        notifier.add_services([gated, Fast])
+
+        notifier.notify("message 0")
+        assert gated.started.wait(5)
+        for i in range(1, 5):
+            notifier.notify(f"message {i}")
+        gated.release.set()
+        assert notifier.flush(timeout=5)
+
+        # "message 0" was being sent; 1 and 2 were pushed out by 3 and 4
+        assert Fast.sent == ["message 0", "message 3", "message 4"]
+        assert notifier.dropped == 2
+
+    def test_flush_timeout(self, make_notifier):
+        notifier = make_notifier(background=True)
+        notifier.add_service(Slow)
+        notifier.notify("hello")
+
+        assert not notifier.flush(timeout=0.01)
+        assert notifier.flush(timeout=5)
+
+    def test_messages_are_coalesced(self, make_notifier):
+        notifier = make_notifier(background=True, coalesce=0.1)
+        notifier.add_service(Fast)
+
+        for i in range(3):
+            notifier.notify(f"epoch {i}")
+        assert Fast.sent == []
+        assert notifier.flush(timeout=5)
+
+        assert Fast.sent == ["epoch 0\n\nepoch 1\n\nepoch 2"]
+
+    def test_coalesce_requires_background(self):
+        with pytest.raises(ValueError, match="background"):
+            Notifier(coalesce=1.0)
+
+    def test_run_flushes_on_exit(self, tmp_path, monkeypatch):
+        from fenn import FENN
+        from fenn.args import Parser
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("sys.argv", ["main.py"])
+        Parser.clear_cache()
+        (tmp_path / "fenn.yaml").write_text("project: notify\nlogger:\n  dir: logger\n")
+        app = FENN()
+        app.notifier.add_services([Slow, Fast])
+
+        @app.entrypoint
+        def main(args):
+            app.notifier.notify("training done")
+
+        app.run()
+
+        assert Fast.sent == ["training done"]
+        assert app.notifier.pending == 0
+
+    def test_run_stops_logger_when_flush_fails(self, tmp_path, monkeypatch):
+        import builtins
+
+        from fenn import FENN
+        from fenn.args import Parser
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("sys.argv", ["main.py"])
+        Parser.clear_cache()
+        (tmp_path / "fenn.yaml").write_text("project: notify\nlogger:\n  dir: logger\n")
+        original_print = builtins.print
+        app = FENN()
+
+        def broken_flush(timeout=None):
+            raise RuntimeError("flush failed")
+
+        monkeypatch.setattr(app.notifier, "flush", broken_flush)
+
+        @app.entrypoint
+        def main(args):
+            return 1
+
+        try:
+            with pytest.raises(RuntimeError, match="flush failed"):
+                app.run()
+
+            assert builtins.print is original_print
+            assert app.context.status == "completed"
+        finally:
+            app.notifier.close()
@@ -0,0 +1,261 @@
+import subprocess
+import sys
+import time
+
+import pytest
+import requests
+
+from fenn.notification import Notifier, Service
+from fenn.notification.outbox import Outbox, backoff
+
+URL = "https://hooks.test/outbox"
+
+
+class Hook(Service):
+    def send_notification(self, message: str) -> None:
+        self._post(URL, {"text": message})
+
+
+def store_and_die(path, messages):
+    """Stores messages from another process, which exits before sending them."""
+    code = (
+        "import sys; from fenn.notification.outbox import Outbox; "
+        "Outbox(sys.argv[1]).add(['Hook'], sys.argv[2:])"
+    )
+    subprocess.run([sys.executable, "-c", code, str(path), *messages], check=True)
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    outbox = Outbox(tmp_path / "outbox.sqlite", base_delay=0.01, max_delay=0.05)
+    yield outbox
+    outbox.close()
+
+
+@pytest.fixture
+def notifier(outbox):
+    notifier = Notifier(outbox=outbox)
+    yield notifier
+    notifier.close()
+
+
+def sent(requests_mock):
+    return [r.json()["text"] for r in requests_mock.request_history]
+
+
+class TestBackoff:
+    def test_grows_exponentially_up_to_the_cap(self):
+        for attempt, limit in [(1, 1), (2, 2), (3, 4), (10, 30)]:
+            delay = backoff(attempt, base=1, cap=30)
+            assert limit / 2 <= delay <= limit
+
+    def test_is_jittered(self):
+        assert len({backoff(5, base=1, cap=60) for _ in range(20)}) > 1
+
+
+class TestOutbox:
+    def test_delivered_messages_are_removed(self, notifier, outbox, requests_mock):
+        requests_mock.post(URL, status_code=200)
+        notifier.add_service(Hook)
+
+        result = notifier.notify("epoch 1")
+
+        assert result["successful"] == ["Hook"]
+        assert wait_for(lambda: outbox.pending() == 0)
+
+    def test_failed_message_is_retried(self, notifier, outbox, requests_mock):
+        requests_mock.post(
+            URL,
+            [
+                {"exc": requests.exceptions.ConnectionError("network is unreachable")},
+                {"status_code": 200},
+            ],
+        )
+        notifier.add_service(Hook)
+
+        result = notifier.notify("epoch 1")
+
+        assert result["failed"] == [("Hook", "network is unreachable")]
+        assert wait_for(lambda: outbox.pending() == 0)
+        assert requests_mock.call_count == 2
+        assert requests_mock.last_request.json() == {"text": "epoch 1"}
+
+    def test_only_undelivered_chunks_are_resent(self, outbox, requests_mock, monkeypatch):
+        monkeypatch.setattr(Hook, "max_message_length", 10)
+        requests_mock.post(
+            URL,
+            [
+                {"status_code": 200},
+                {"exc": requests.exceptions.ConnectionError("network is unreachable")},
+                {"status_code": 200},
+            ],
+        )
+        notifier = Notifier(background=True, coalesce=0.05, outbox=outbox)
+        try:
+            notifier.add_service(Hook)
+            notifier.notify("epoch 1")
+            notifier.notify("epoch 2")
+            notifier.flush(timeout=5)
+
+            assert wait_for(lambda: outbox.pending() == 0)
+            assert sent(requests_mock) == ["epoch 1", "epoch 2", "epoch 2"]
+        finally:
+            notifier.close()
+
+    def test_messages_of_a_dead_process_are_sent_by_the_next(self, tmp_path, requests_mock):
+        requests_mock.post(URL, status_code=200)
+        path = tmp_path / "outbox.sqlite"
+        store_and_die(path, ["epoch 1", "epoch 2"])
+
+        notifier = Notifier(outbox=path)
+        try:
+            notifier.add_service(Hook)
+
+            assert wait_for(lambda: notifier.outbox.pending() == 0)
+            assert sent(requests_mock) == ["epoch 1\n\nepoch 2"]
+        finally:
+            notifier.close()
+
+    def test_leases_of_other_hosts_wait_for_expiry(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "outbox.sqlite"
+        store_and_die(path, ["epoch 1"])
+        with sqlite3.connect(path) as conn:
+            conn.execute("UPDATE outbox SET host = 'another-host'")
+        outbox = Outbox(path)
+        try:
+            # The dead pid may be a live process on the other host
+            assert outbox.claim(["Hook"]) == []
+
+            with sqlite3.connect(path) as conn:
+                conn.execute("UPDATE outbox SET next_attempt = 0")
+            assert [row[2] for row in outbox.claim(["Hook"])] == ["epoch 1"]
+        finally:
+            outbox.close()
+
+    def test_outbox_without_host_column_is_upgraded(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "outbox.sqlite"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, service TEXT NOT NULL,"
+                " message TEXT NOT NULL, created REAL NOT NULL, attempts INTEGER NOT NULL"
+                " DEFAULT 0, next_attempt REAL NOT NULL, last_error TEXT, dead INTEGER NOT NULL"
+                " DEFAULT 0, owner INTEGER)"
+            )
+        outbox = Outbox(path)
+        try:
+            outbox.add(["Hook"], ["epoch 1"])
+            assert outbox.pending() == 1
+        finally:
+            outbox.close()
+
+    def test_leases_of_running_processes_are_kept(self, outbox):
+        outbox.add(["Hook"], ["epoch 1"])
+
+        assert outbox.claim(["Hook"]) == []
+
+    def test_gives_up_after_max_attempts(self, notifier, outbox, requests_mock):
+        outbox.max_attempts = 3
+        requests_mock.post(URL, status_code=500)
+        notifier.add_service(Hook)
+
+        notifier.notify("epoch 1")
+
+        assert wait_for(lambda: outbox.pending() == 0)
+        assert requests_mock.call_count == 3
+        ((service, message, error),) = outbox.dead()
+        assert (service, message) == ("Hook", "epoch 1")
+        assert "500" in error
+
+    def test_run_opens_outbox_in_logger_dir(self, tmp_path, monkeypatch):
+        from fenn import FENN
+        from fenn.args import Parser
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("sys.argv", ["main.py"])
+        Parser.clear_cache()
+        (tmp_path / "fenn.yaml").write_text(
+            "project: outbox\nlogger:\n  dir: logger\nnotification:\n  outbox: true\n"
+        )
+        app = FENN()
+
+        @app.entrypoint
+        def main(args):
+            pass
+
+        app.run()
+
+        assert app.notifier.outbox.path == str(tmp_path / "logger" / ".fenn_outbox.sqlite")
+        app.notifier.close()
+
+    def test_run_stops_logger_when_outbox_cannot_open(self, tmp_path, monkeypatch):
+        import builtins
+        import sqlite3
+
+        from fenn import FENN
+        from fenn.args import Parser
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("sys.argv", ["main.py"])
+        Parser.clear_cache()
+        (tmp_path / "fenn.yaml").write_text(
+            "project: outbox\nlogger:\n  dir: logger\nnotification:\n  outbox: true\n"
+        )
+        (tmp_path / "logger" / ".fenn_outbox.sqlite").mkdir(parents=True)
+        original_print = builtins.print
+        app = FENN()
+
+        @app.entrypoint
+        def main(args):
+            pass
+
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                app.run()
+
+            assert builtins.print is original_print
+            assert app.context.status == "failed"
+        finally:
+            app.notifier.close()
+
+    def test_run_sends_due_messages_before_exiting(self, tmp_path, monkeypatch, requests_mock):
+        from fenn import FENN
+        from fenn.args import Parser
+
+        requests_mock.post(URL, status_code=200)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("sys.argv", ["main.py"])
+        Parser.clear_cache()
+        (tmp_path / "fenn.yaml").write_text(
+            "project: outbox\nlogger:\n  dir: logger\nnotification:\n  outbox: true\n"
+        )
+        (tmp_path / "logger").mkdir()
+        store_and_die(tmp_path / "logger" / ".fenn_outbox.sqlite", ["training done"])
+        app = FENN()
+        # Stands in for the retry thread, which a short run does not outlive
+        monkeypatch.setattr(Notifier, "_wake_retrier", lambda self: None)
+        app.notifier.add_service(Hook)
+
+        @app.entrypoint
+        def main(args):
+            pass
+
+        try:
+            app.run()
+
+            assert sent(requests_mock) == ["training done"]
+            assert app.notifier.outbox.pending() == 0
+        finally:
+            app.notifier.close()
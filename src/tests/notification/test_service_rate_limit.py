@@ -0,0 +1,121 @@
+import time
+
+import pytest
+import requests
+
+from fenn.notification import Service
+from fenn.notification.ratelimit import TokenBucket, bucket_for, retry_after
+
+URL = "https://hooks.test/channel"
+
+
+class Hook(Service):
+    rate = 1000.0
+    burst = 1
+    max_message_length = 20
+    default_retry_after = 0.01
+
+    def send_notification(self, message: str) -> None:
+        self._post(URL, {"text": message})
+
+
+@pytest.fixture
+def hook():
+    # __init__ bypassed, no keystore needed
+    service = object.__new__(Hook)
+    yield service
+    service.close()
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=50, burst=3)
+
+        start = time.perf_counter()
+        for _ in range(3):
+            bucket.acquire()
+        burst_elapsed = time.perf_counter() - start
+        bucket.acquire()
+        bucket.acquire()
+        elapsed = time.perf_counter() - start
+
+        assert burst_elapsed < 0.01
+        assert elapsed >= 2 / 50 * 0.9
+
+    def test_defer(self):
+        bucket = TokenBucket(rate=1000, burst=5)
+        bucket.defer(0.05)
+
+        assert bucket.acquire() >= 0.04
+
+    def test_bucket_is_shared_per_channel(self):
+        bucket = bucket_for(("Shared", URL), 1.0)
+
+        assert bucket_for(("Shared", URL), 1.0) is bucket
+        assert bucket_for(("Shared", "https://hooks.test/other"), 1.0) is not bucket
+
+
+class TestRetryAfter:
+    def response(self, requests_mock, **kwargs):
+        requests_mock.post(URL, status_code=429, **kwargs)
+        return requests.post(URL)
+
+    def test_header(self, requests_mock):
+        assert retry_after(self.response(requests_mock, headers={"Retry-After": "3"})) == 3
+
+    def test_discord_body(self, requests_mock):
+        assert retry_after(self.response(requests_mock, json={"retry_after": 0.5})) == 0.5
+
+    def test_telegram_body(self, requests_mock):
+        response = self.response(requests_mock, json={"parameters": {"retry_after": 7}})
+        assert retry_after(response) == 7
+
+    def test_unknown(self, requests_mock):
+        assert retry_after(self.response(requests_mock, text="slow down")) is None
+
+
+class TestPost:
+    def test_retries_on_429(self, hook, requests_mock):
+        requests_mock.post(
+            URL,
+            [
+                {"status_code": 429, "headers": {"Retry-After": "0.05"}},
+                {"status_code": 200},
+            ],
+        )
+
+        start = time.perf_counter()
+        hook.send_notification("hello")
+
+        assert requests_mock.call_count == 2
+        assert time.perf_counter() - start >= 0.04
+
+    def test_gives_up_after_max_retries(self, hook, requests_mock):
+        requests_mock.post(URL, status_code=429)
+
+        with pytest.raises(requests.exceptions.HTTPError, match="429"):
+            hook.send_notification("hello")
+
+        assert requests_mock.call_count == Hook.max_retries + 1
+
+
+class TestDigest:
+    def test_messages_are_merged_within_the_limit(self, hook):
+        assert hook.digest(["epoch 1", "epoch 2", "epoch 3"]) == [
+            "epoch 1\n\nepoch 2",
+            "epoch 3",
+        ]
+
+    def test_long_message_is_truncated(self, hook):
+        (chunk,) = hook.digest(["x" * 50])
+        assert chunk == "x" * 19 + "…"
+
+    def test_send_digest(self, hook, requests_mock):
+        requests_mock.post(URL, status_code=200)
+
+        hook.send_digest(["epoch 1", "epoch 2", "epoch 3"])
+
+        assert [r.json()["text"] for r in requests_mock.request_history] == [
+            "epoch 1\n\nepoch 2",
+            "epoch 3",
+        ]
@@ -12,7 +12,7 @@ def test_slack_message():
     slack = object.__new__(Slack)
     slack._slack_webhook_url = "https://slack.test"
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from fenn.secrets import keystore as keystore_module
+from fenn.secrets.keystore import KeyStore
+
+
+@pytest.fixture
+def keystore(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("FENN_TEST_KEY", raising=False)
+    store = KeyStore()
+    store.env_file = ".env"
+    yield store
+    store._overrides.clear()
+    store.env_file = ".env"
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestKeyStore:
+    def test_reads_env_file(self, keystore, tmp_path):
+        (tmp_path / ".env").write_text("FENN_TEST_KEY=from-file\n")
+
+        assert KeyStore().get_key("FENN_TEST_KEY") == "from-file"
+
+    def test_env_file_is_parsed_once(self, keystore, tmp_path, monkeypatch):
+        (tmp_path / ".env").write_text("FENN_TEST_KEY=from-file\n")
+        KeyStore()
+
+        def fail(*args, **kwargs):
+            raise AssertionError(".env parsed again")
+
+        monkeypatch.setattr(keystore_module, "dotenv_values", fail)
+        for _ in range(10):
+            assert KeyStore().get_key("FENN_TEST_KEY") == "from-file"
+
+    def test_changed_env_file_is_parsed_again(self, keystore, tmp_path):
+        env = tmp_path / ".env"
+        env.write_text("FENN_TEST_KEY=old\n")
+        KeyStore()
+
+        env.write_text("FENN_TEST_KEY=newer\n")
+        bump_mtime(env)
+
+        assert KeyStore().get_key("FENN_TEST_KEY") == "newer"
+
+    def test_reload(self, keystore, tmp_path, monkeypatch):
+        (tmp_path / ".env").write_text("FENN_TEST_KEY=value\n")
+        KeyStore()
+        calls = []
+        monkeypatch.setattr(
+            keystore_module, "dotenv_values", lambda path: calls.append(path) or {}
+        )
+
+        keystore.reload()
+
+        assert len(calls) == 1
+
+    def test_configurable_env_file(self, keystore, tmp_path):
+        (tmp_path / "secrets.env").write_text("FENN_TEST_KEY=custom\n")
+
+        assert KeyStore(env_file="secrets.env").get_key("FENN_TEST_KEY") == "custom"
+
+    def test_set_key_survives_reload(self, keystore, tmp_path):
+        (tmp_path / ".env").write_text("OTHER=1\n")
+        keystore.set_key("FENN_TEST_KEY", "manual")
+
+        keystore.reload()
+
+        assert keystore.get_key("FENN_TEST_KEY") == "manual"
+
+    def test_environment_wins(self, keystore, tmp_path, monkeypatch):
+        (tmp_path / ".env").write_text("FENN_TEST_KEY=from-file\n")
+        monkeypatch.setenv("FENN_TEST_KEY", "from-env")
+
+        assert KeyStore().get_key("FENN_TEST_KEY") == "from-env"
+
+    def test_missing_key(self, keystore):
+        with pytest.raises(KeyError):
+            keystore.get_key("FENN_TEST_KEY")
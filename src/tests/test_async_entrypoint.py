@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from fenn import FENN
+from fenn.args import Parser
+from fenn.logging import Logger
+from fenn.notification import Notifier, Service
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.argv", ["main.py"])
+    Parser.clear_cache()
+    (tmp_path / "fenn.yaml").write_text("project: async\nlogger:\n  dir: logger\n")
+    yield tmp_path
+
+
+class RecordingService(Service):
+    sent = []
+
+    def send_notification(self, message: str) -> None:
+        self.sent.append(message)
+
+
+class TestAsyncEntrypoint:
+    def test_coroutine_runs_in_a_fenn_loop(self, project):
+        app = FENN()
+
+        @app.entrypoint
+        async def main(args):
+            assert asyncio.get_running_loop() is app.loop
+            await asyncio.sleep(0)
+            print("from the coroutine")
+            await Logger().aflush()
+            return args["project"]
+
+        assert app.run() == "async"
+        assert app.loop is None
+        (log,) = (project / "logger" / "async").glob("*.log")
+        assert "from the coroutine" in log.read_text()
+
+    def test_exception_marks_the_session_failed(self, project):
+        app = FENN()
+
+        @app.entrypoint
+        async def main(args):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            app.run()
+
+        (meta,) = (project / "logger" / "async").glob("*.json")
+        assert '"status": "failed"' in meta.read_text()
+
+    def test_notifications_are_awaitable(self, project):
+        RecordingService.sent = []
+        notifier = Notifier()
+        notifier.add_service(RecordingService)
+        app = FENN()
+
+        @app.entrypoint
+        async def main(args):
+            await asyncio.gather(notifier.anotify("started"), asyncio.sleep(0))
+
+        app.run()
+
+        assert RecordingService.sent == ["started"]
+
+    def test_sync_entrypoint_returning_an_awaitable_is_not_awaited(self, project):
+        class Handle:
+            def __await__(self):
+                raise AssertionError("must not be awaited")
+
+        app = FENN()
+        handle = Handle()
+        app.entrypoint(lambda args: handle)
+
+        assert app.run() is handle
+
+    def test_wrapped_coroutine_function_is_still_run(self, project):
+        app = FENN()
+
+        async def main(args):
+            await asyncio.sleep(0)
+            return "done"
+
+        app.entrypoint(lambda args: main(args))
+
+        assert app.run() == "done"
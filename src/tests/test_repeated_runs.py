@@ -0,0 +1,130 @@
+import argparse
+import json
+import sys
+
+import pytest
+
+from fenn import FENN
+from fenn.args import Parser
+from fenn.logging import Logger
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.argv", ["main.py"])
+    Parser.clear_cache()
+    (tmp_path / "fenn.yaml").write_text("project: repeat\nlogger:\n  dir: logger\nrun: 1\n")
+    (tmp_path / "other.yaml").write_text("project: repeat\nlogger:\n  dir: logger\nrun: 2\n")
+    yield tmp_path
+
+
+def session_files(project, suffix):
+    return {p.stem: p for p in (project / "logger" / "repeat").glob(f"*.{suffix}")}
+
+
+class TestRepeatedRuns:
+    def test_each_run_gets_its_own_session(self, project):
+        app = FENN()
+        app.entrypoint(lambda args: print(f"run {args['run']}") or args["session_id"])
+
+        first = app.run()
+        app.set_config_file("other.yaml")
+        second = app.run()
+
+        assert first != second
+        logs = session_files(project, "log")
+        assert set(logs) == {first, second}
+        assert "run 1" in logs[first].read_text()
+        assert "run 1" not in logs[second].read_text()
+        assert "run 2" in logs[second].read_text()
+
+    def test_session_id_is_known_before_the_run(self, project):
+        app = FENN()
+        app.entrypoint(lambda args: args["session_id"])
+        session_id = app.session_id
+
+        assert app.run() == session_id
+        assert app.context.status == "completed"
+        assert app.context.result == session_id
+
+    def test_failed_run_does_not_leak_into_the_next(self, project):
+        app = FENN()
+        calls = []
+
+        @app.entrypoint
+        def main(args):
+            calls.append(args["session_id"])
+            if len(calls) == 1:
+                raise ValueError("first run fails")
+
+        with pytest.raises(ValueError):
+            app.run()
+        failed = app.context
+        app.run()
+
+        assert failed.status == "failed"
+        assert app.context.status == "completed"
+        assert calls[0] != calls[1]
+        meta = json.loads(session_files(project, "json")[calls[1]].read_text())
+        assert meta["status"] == "completed"
+
+    def test_parser_calls_keep_the_current_configuration(self, project):
+        app = FENN()
+
+        @app.entrypoint
+        def main(args):
+            return Parser().args["run"]
+
+        assert app.run() == 1
+        assert Parser().config_file == "fenn.yaml"
+
+
+class TestLoggerSessions:
+    def test_unstopped_session_is_closed_by_the_next(self, start_logger, tmp_path):
+        logger = start_logger()
+        first_log = logger._log_file
+        print("first")
+
+        Parser()._args = {**Parser()._args, "session_id": "second_session"}
+        logger.start()
+        print("second")
+
+        meta = json.loads(first_log.with_suffix(".json").read_text())
+        assert meta["status"] == "interrupted"
+        assert "second" not in first_log.read_text()
+        assert Logger()._log_file.name == "second_session.log"
+
+    def test_overrides_are_taken_out_of_argv(self, project, monkeypatch):
+        monkeypatch.setattr("sys.argv", ["main.py", "training.lr=0.5", "--name", "exp"])
+        app = FENN()
+        seen = []
+
+        @app.entrypoint
+        def main(args):
+            seen.append(args["training"]["lr"])
+
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--name")
+        assert parser.parse_args().name == "exp"
+
+        app.run()
+        app.run()
+
+        assert sys.argv == ["main.py", "--name", "exp"]
+        assert seen == [0.5, 0.5]
+
+    def test_option_values_and_arguments_after_dashes_are_kept(self, project, monkeypatch):
+        argv = ["main.py", "--tag", "a=b", "training.lr=0.5", "--", "extra=1"]
+        monkeypatch.setattr("sys.argv", argv)
+        app = FENN()
+        seen = []
+
+        @app.entrypoint
+        def main(args):
+            seen.append((args["training"]["lr"], "a" in args, "extra" in args))
+
+        app.run()
+
+        assert sys.argv == ["main.py", "--tag", "a=b", "--", "extra=1"]
+        assert seen == [(0.5, False, False)]
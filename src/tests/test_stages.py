@@ -0,0 +1,213 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from fenn import FENN
+from fenn.args import Parser
+from fenn.stages import MISS, StageCache, canonical
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.argv", ["main.py"])
+    Parser.clear_cache()
+    (tmp_path / "fenn.yaml").write_text(
+        "project: stages\nlogger:\n  dir: logger\n"
+        "stages:\n  dir: cache\n"
+        "data:\n  size: 4\n"
+        "training:\n  lr: 0.1\n"
+    )
+    yield tmp_path
+    Parser().overrides = []
+
+
+def make_app(calls):
+    app = FENN()
+
+    @app.stage(depends_on=["data"])
+    def features(args, scale=1.0):
+        calls.append(scale)
+        return {"x": np.arange(args["data"]["size"]) * scale, "name": "features"}
+
+    @app.entrypoint
+    def main(args):
+        return features(args)
+
+    return app
+
+
+def run(app, monkeypatch, *overrides):
+    monkeypatch.setattr("sys.argv", ["main.py", *overrides])
+    return app.run()
+
+
+class TestStage:
+    def test_output_is_reused_when_other_keys_change(self, project, monkeypatch):
+        calls = []
+        app = make_app(calls)
+
+        first = run(app, monkeypatch)
+        second = run(app, monkeypatch, "training.lr=0.5")
+
+        assert calls == [1.0]
+        assert second["name"] == "features"
+        np.testing.assert_array_equal(second["x"], first["x"])
+
+    def test_arrays_are_memory_mapped(self, project, monkeypatch):
+        app = make_app([])
+        run(app, monkeypatch)
+
+        cached = run(app, monkeypatch)
+
+        assert isinstance(cached["x"], np.memmap)
+        assert not cached["x"].flags.writeable
+
+    def test_dependency_change_recomputes(self, project, monkeypatch):
+        calls = []
+        app = make_app(calls)
+
+        run(app, monkeypatch)
+        result = run(app, monkeypatch, "data.size=2")
+
+        assert len(calls) == 2
+        assert len(result["x"]) == 2
+
+    def test_arguments_are_part_of_the_key(self, project, monkeypatch):
+        calls = []
+        app = FENN()
+
+        @app.stage(depends_on=["data.size"])
+        def features(args, scale=1.0):
+            calls.append(scale)
+            return scale
+
+        @app.entrypoint
+        def main(args):
+            return [features(args, scale=2.0), features(args, scale=2.0), features(args)]
+
+        assert run(app, monkeypatch) == [2.0, 2.0, 1.0]
+        assert calls == [2.0, 1.0]
+
+    def test_unpicklable_arguments_are_rejected(self, project, monkeypatch):
+        app = FENN()
+
+        @app.stage()
+        def features(args, transform):
+            return transform(1)
+
+        @app.entrypoint
+        def main(args):
+            return features(args, lambda x: x + 1)
+
+        with pytest.raises(TypeError, match="key="):
+            run(app, monkeypatch)
+
+    def test_key_function_replaces_the_arguments(self, project, monkeypatch):
+        calls = []
+        app = FENN()
+
+        @app.stage(key=lambda args, transform, name: name)
+        def features(args, transform, name):
+            calls.append(name)
+            return transform(1)
+
+        @app.entrypoint
+        def main(args):
+            return [
+                features(args, lambda x: x + 1, "inc"),
+                features(args, lambda x: x + 1, "inc"),
+                features(args, lambda x: x * 10, "mul"),
+            ]
+
+        assert run(app, monkeypatch) == [2, 2, 10]
+        assert calls == ["inc", "mul"]
+
+    def test_unknown_dependency(self, project, monkeypatch):
+        app = FENN()
+
+        @app.stage(depends_on=["dataa"])
+        def features(args):
+            return 1
+
+        app.entrypoint(features)
+
+        with pytest.raises(KeyError, match="dataa"):
+            run(app, monkeypatch)
+
+    def test_outside_of_a_run(self):
+        app = FENN()
+
+        @app.stage()
+        def features():
+            return 1
+
+        with pytest.raises(RuntimeError):
+            features()
+
+
+class TestStageCache:
+    def test_miss_and_none_output(self, tmp_path):
+        cache = StageCache(tmp_path, max_bytes=1 << 20)
+
+        assert cache.get("key") is MISS
+        cache.put("key", None)
+        assert cache.get("key") is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = StageCache(tmp_path, max_bytes=2500)
+        payload = np.zeros(100)  # about 1 kB per entry
+
+        cache.put("a", payload)
+        cache.put("b", payload)
+        os.utime(tmp_path / "a", ns=(1, 1))
+        os.utime(tmp_path / "b", ns=(2, 2))
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("c", payload)
+
+        assert cache.get("b") is MISS
+        assert cache.get("a") is not MISS
+        assert cache.get("c") is not MISS
+
+    @pytest.mark.parametrize("damage", ["truncate", "remove_array"])
+    def test_damaged_entries_are_misses(self, tmp_path, damage):
+        cache = StageCache(tmp_path, max_bytes=1 << 20)
+        cache.put("key", {"x": np.arange(3)})
+        if damage == "truncate":
+            value_file = tmp_path / "key" / "value.pkl"
+            value_file.write_bytes(value_file.read_bytes()[:10])
+        else:
+            (tmp_path / "key" / "0.npy").unlink()
+
+        assert cache.get("key") is MISS
+        assert not (tmp_path / "key").exists()
+
+
+class TestCanonical:
+    def test_sets_are_sorted(self):
+        assert canonical({"b", "a"}) == canonical({"a", "b"})
+        assert canonical([{3, 1}, {"k": frozenset("xy")}]) == [
+            ("<set>", (1, 3)),
+            {"k": ("<frozenset>", ("x", "y"))},
+        ]
+
+    def test_set_arguments_hash_the_same_in_every_process(self):
+        code = (
+            "import hashlib, pickle; from fenn.stages import canonical; "
+            "print(hashlib.sha256(pickle.dumps(canonical({'alpha', 'beta', 'gamma', 'delta'}),"
+            " protocol=pickle.HIGHEST_PROTOCOL)).hexdigest())"
+        )
+        digests = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for seed in ("1", "2", "3")
+        }
+        assert len(digests) == 1
@@ -0,0 +1,95 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["wandb", "torch", "tensorboard"]
+
+# Third-party modules fenn uses, none of which the CLI help needs
+CLI_HEAVY_MODULES = {
+    "numpy", "pandas", "requests", "yaml", "PIL", "cv2", "wandb", "torch",
+    "tensorboard", "asyncio", "sqlite3",
+}
+
+CLI_HELP = """\
+import fenn.cli
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        fenn.cli.main(["--help"])
+    except SystemExit:
+        pass
+"""
+
+
+def loaded_modules(code: str) -> set:
+    """Run ``code`` in a fresh interpreter and return the names in sys.modules."""
+    script = f"import contextlib, io\n{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("module", HEAVY_MODULES)
+def test_import_fenn_does_not_load_backends(module):
+    assert module not in loaded_modules("import fenn")
+
+
+@pytest.mark.parametrize("module", HEAVY_MODULES)
+def test_import_fenn_utils_does_not_load_backends(module):
+    assert module not in loaded_modules("import fenn.utils")
+
+
+def test_import_fenn_only_loads_the_package():
+    assert loaded_modules("import fenn") - loaded_modules("") == {"fenn", "fenn._lazy"}
+
+
+def test_cli_help_is_bounded():
+    loaded = loaded_modules(CLI_HELP) - loaded_modules("")
+
+    assert {m for m in loaded if m.startswith("fenn")} == {"fenn", "fenn._lazy", "fenn.cli"}
+    assert not {m.partition(".")[0] for m in loaded} & CLI_HEAVY_MODULES
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import fenn.vision",
+        "import fenn.notification",
+        "import fenn.notification.services",
+        "import fenn.utils",
+    ],
+)
+def test_subpackages_are_lazy(code):
+    loaded = loaded_modules(code)
+
+    assert not {"numpy", "requests", "PIL", "yaml"} & loaded
+
+
+def test_lazy_attributes_resolve():
+    import fenn
+    import fenn.vision
+    from fenn.app import FENN
+    from fenn.vision.resize import resize_batch
+
+    assert fenn.FENN is FENN
+    assert fenn.vision.resize_batch is resize_batch
+    assert "FENN" in dir(fenn)
+    with pytest.raises(AttributeError):
+        fenn.missing
+
+
+def test_historical_top_level_names():
+    from fenn import KeyStore, Logger, Parser, generate_haiku_id
+    from fenn.args import Parser as ArgsParser
+    from fenn.logging import Logger as LoggingLogger
+    from fenn.secrets.keystore import KeyStore as SecretsKeyStore
+    from fenn.utils import generate_haiku_id as utils_generate_haiku_id
+
+    assert Logger is LoggingLogger
+    assert Parser is ArgsParser
+    assert KeyStore is SecretsKeyStore
+    assert generate_haiku_id is utils_generate_haiku_id
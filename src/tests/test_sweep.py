@@ -0,0 +1,90 @@
+import pytest
+
+from fenn import FENN
+from fenn.args import Parser
+from fenn.sweep import expand_sweep, to_overrides
+
+
+def train(args):
+    if args["training"]["lr"] > 1:
+        raise ValueError("lr too large")
+    return {"score": args["training"]["lr"] * args["training"]["epochs"]}
+
+
+staged_app = FENN()
+features_calls = []
+
+
+@staged_app.stage(depends_on=["training.epochs"])
+def features(args):
+    features_calls.append(args["training"]["epochs"])
+    return args["training"]["epochs"] * 2
+
+
+def train_with_stage(args):
+    return {"features": features(args), "calls": len(features_calls)}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.argv", ["main.py"])
+    Parser.clear_cache()
+    (tmp_path / "fenn.yaml").write_text(
+        "project: sweep\nlogger:\n  dir: logger\ntraining:\n  lr: 0.1\n  epochs: 1\n"
+    )
+    yield tmp_path
+    Parser().config_file = "fenn.yaml"
+    Parser().overrides = []
+
+
+class TestExpandSweep:
+    def test_grid_is_a_cartesian_product(self):
+        runs = expand_sweep({"a": [1, 2], "b.c": ["x", "y"]})
+
+        assert runs == [
+            {"a": 1, "b.c": "x"}, {"a": 1, "b.c": "y"},
+            {"a": 2, "b.c": "x"}, {"a": 2, "b.c": "y"},
+        ]
+
+    def test_list_of_runs(self):
+        runs = expand_sweep([{"a": 1}, ["a=2", "b.c=[1, 2]"]])
+
+        assert runs == [{"a": 1}, {"a": 2, "b.c": [1, 2]}]
+
+    def test_to_overrides_keeps_types(self):
+        overrides = to_overrides({"a": 0.5, "b": [1, 2], "c": True, "d": "text"})
+
+        assert Parser._parse_overrides(overrides) == {"a": 0.5, "b": [1, 2], "c": True, "d": "text"}
+
+    @pytest.mark.parametrize("value", ["off", "yes", "null", "1e-3", "08"])
+    def test_to_overrides_keeps_strings(self, value):
+        assert Parser._parse_overrides(to_overrides({"a": value})) == {"a": value}
+
+
+class TestSweep:
+    def test_runs_every_configuration_in_its_own_session(self, project):
+        app = FENN()
+        app.entrypoint(train)
+
+        results = app.sweep(
+            {"training.lr": [0.1, 0.2, 5.0], "training.epochs": [10]}, max_workers=2
+        )
+
+        assert list(results["status"]) == ["completed", "completed", "failed"]
+        assert list(results["score"][:2]) == pytest.approx([1.0, 2.0])
+        assert "lr too large" in results["error"].iloc[2]
+        assert results["session_id"].is_unique
+
+        logs = sorted(p.stem for p in (project / "logger" / "sweep").glob("*.log"))
+        assert logs == sorted(results["session_id"])
+
+    def test_stages_run_inside_sweep_jobs(self, project):
+        staged_app.entrypoint(train_with_stage)
+
+        results = staged_app.sweep({"training.lr": [0.1, 0.2]}, max_workers=1)
+
+        assert list(results["status"]) == ["completed", "completed"]
+        assert list(results["features"]) == [2, 2]
+        # Same worker, same training.epochs: the second run loads the first's output
+        assert list(results["calls"]) == [1, 1]